@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Parser benchmark for MarkDeck.
+
+Generates synthetic decks of growing size and times ``SlideParser.parse_content``
+on each, so that the scaling of parse time with file size can be checked. With
+``--parallel`` the decks are parsed with the process pool instead, to check
+scaling with the number of cores.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from markdeck.parser import SlideParser  # noqa: E402
+
+SLIDE_TEMPLATES = [
+    """# Slide {n}
+
+Intro paragraph for slide {n} with some **bold** and *italic* text.
+
+- First point
+- Second point
+- Third point""",
+    """<!--SLIDE:wide-->
+
+## Columns {n}
+
+:::columns[60]
+### Left
+
+```python
+def example_{n}():
+    return ":::columns inside code stays untouched"
+```
+|||
+### Right
+
+Some text on the right.
+:::
+
+<!--NOTES:
+Speaker notes for slide {n}.
+-->""",
+    """## Code {n}
+
+```javascript
+const slide = {n};
+console.log(`slide ${{slide}}`);
+```
+
+Math: $E = mc^2$""",
+]
+
+
+def build_deck(slides: int) -> str:
+    """
+    Build a synthetic deck.
+
+    Args:
+        slides: Number of slides to generate
+
+    Returns:
+        Markdown content of the deck
+    """
+    return "\n\n---\n\n".join(
+        SLIDE_TEMPLATES[n % len(SLIDE_TEMPLATES)].format(n=n) for n in range(slides)
+    )
+
+
+def time_parse(content: str, repeat: int, parallel: bool = False) -> float:
+    """
+    Time parsing and rendering of the given content.
+
+    Args:
+        content: Markdown content to parse
+        repeat: Number of runs; the fastest one is reported
+        parallel: Parse in a process pool, whatever the size of the content
+
+    Returns:
+        Best parse time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if parallel:
+            slides = SlideParser.parse_deck(content, "benchmark", "", parallel=True).slides
+        else:
+            slides = SlideParser.parse_content(content)
+        # Slides are lazy, so render every one of them to time the full parse
+        for slide in slides:
+            slide.to_dict()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main entry point for the parser benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the MarkDeck slide parser")
+    parser.add_argument("--start", type=int, default=250, help="Smallest deck size in slides")
+    parser.add_argument("--steps", type=int, default=5, help="Number of doublings")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size (best is kept)")
+    parser.add_argument(
+        "--parallel", action="store_true", help="Parse in a process pool (all sizes)"
+    )
+    args = parser.parse_args()
+    if args.parallel:
+        SlideParser.PARALLEL_THRESHOLD = 0
+
+    print(f"{'slides':>8} {'bytes':>10} {'time (ms)':>10} {'us/KB':>8}")
+    slides = args.start
+    for _ in range(args.steps):
+        content = build_deck(slides)
+        elapsed = time_parse(content, args.repeat, args.parallel)
+        per_kb = elapsed * 1e6 / (len(content) / 1024)
+        print(f"{slides:>8} {len(content):>10} {elapsed * 1000:>10.2f} {per_kb:>8.2f}")
+        slides *= 2
+
+
+if __name__ == "__main__":
+    main()
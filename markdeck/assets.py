@@ -0,0 +1,245 @@
+"""Files from the presentation's directory, served as /assets for MarkDeck."""
+
+import mimetypes
+import os
+import re
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from email.utils import formatdate
+from pathlib import Path
+from typing import NamedTuple
+
+# Size of the chunks parts of large files are streamed in
+CHUNK_SIZE = 64 * 1024
+
+# A single byte range; other Range headers are ignored
+_RANGE_PATTERN = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+class AssetFile(NamedTuple):
+    """The current version of an asset on disk."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    media_type: str
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the modification time and size."""
+        return f'"{self.mtime_ns:x}-{self.size:x}"'
+
+    @property
+    def modified(self) -> str:
+        """Modification time as an HTTP date."""
+        return formatdate(self.mtime_ns / 1e9, usegmt=True)
+
+
+def byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse the Range header of a request for a file.
+
+    Only single ranges are honoured; for anything else the whole file is sent,
+    which RFC 9110 allows.
+
+    Args:
+        header: Value of the Range request header
+        size: Size of the file in bytes
+
+    Returns:
+        Tuple of (first, last) byte positions, inclusive, or None to send the
+        whole file
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header)
+    if match is None or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header}")
+        return max(0, size - length), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+def iter_file(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """
+    Read part of a file in chunks.
+
+    Args:
+        path: File to read
+        start: First byte position
+        end: Last byte position, inclusive
+
+    Yields:
+        Chunks of at most CHUNK_SIZE bytes
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class AssetStore:
+    """
+    Lookup and caching of the files in a presentation's directory.
+
+    Whether a requested path stays inside the directory is checked once per
+    path and remembered. Files up to ``max_file_size`` bytes are kept in
+    memory, in least-recently-used order, and are read again only when their
+    modification time or size changes.
+    """
+
+    def __init__(
+        self,
+        max_file_size: int = 256 * 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_paths: int = 4096,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_file_size: Largest file to keep in memory
+            max_bytes: Maximum total size of the files kept in memory
+            max_paths: Maximum number of path checks to remember
+        """
+        self.max_file_size = max_file_size
+        self.max_bytes = max_bytes
+        self.max_paths = max_paths
+        self._paths: OrderedDict[tuple[str, str], Path | None] = OrderedDict()
+        self._contents: OrderedDict[Path, tuple[int, int, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def resolve(self, directory: Path, file_path: str) -> Path | None:
+        """
+        Resolve a requested path against the presentation's directory.
+
+        Args:
+            directory: Directory of the presentation
+            file_path: Path from the request, relative to the directory
+
+        Returns:
+            Resolved path, or None if it lies outside the directory
+        """
+        key = (str(directory), file_path)
+        with self._lock:
+            if key in self._paths:
+                self._paths.move_to_end(key)
+                return self._paths[key]
+
+        resolved: Path | None = (directory / file_path).resolve()
+        try:
+            resolved.relative_to(directory.resolve())
+        except ValueError:
+            resolved = None
+
+        with self._lock:
+            self._paths[key] = resolved
+            while len(self._paths) > self.max_paths:
+                self._paths.popitem(last=False)
+        return resolved
+
+    def stat(self, path: Path) -> AssetFile | None:
+        """
+        Look up the current version of a file.
+
+        Args:
+            path: Resolved path of the file
+
+        Returns:
+            AssetFile, or None if there is no such file
+        """
+        try:
+            result = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(result.st_mode):
+            return None
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return AssetFile(path, result.st_size, result.st_mtime_ns, media_type)
+
+    def peek(self, asset: AssetFile) -> bytes | None:
+        """
+        Get the content of a file if this version of it is in memory.
+
+        Args:
+            asset: Current version of the file
+
+        Returns:
+            File content, or None if it is not in memory
+        """
+        with self._lock:
+            cached = self._contents.get(asset.path)
+            if cached is None or cached[:2] != (asset.mtime_ns, asset.size):
+                return None
+            self._contents.move_to_end(asset.path)
+            return cached[2]
+
+    def read(self, asset: AssetFile) -> bytes | None:
+        """
+        Get the content of a small file, from memory when possible.
+
+        May read from disk, so call it off the event loop.
+
+        Args:
+            asset: Current version of the file
+
+        Returns:
+            File content, or None if the file is too large to keep in memory
+        """
+        if asset.size > self.max_file_size:
+            return None
+        content = self.peek(asset)
+        if content is not None:
+            return content
+
+        content = asset.path.read_bytes()
+        if len(content) != asset.size:
+            # Changed while being read; serve it, but do not keep it
+            return content
+
+        with self._lock:
+            old = self._contents.pop(asset.path, None)
+            if old is not None:
+                self._bytes -= len(old[2])
+            self._contents[asset.path] = (asset.mtime_ns, asset.size, content)
+            self._bytes += len(content)
+            while len(self._contents) > 1 and self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._contents.popitem(last=False)
+                self._bytes -= len(evicted)
+        return content
+
+    def clear(self) -> None:
+        """Forget all path checks and cached files."""
+        with self._lock:
+            self._paths.clear()
+            self._contents.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of files kept in memory."""
+        return len(self._contents)
+
+
+asset_store = AssetStore()
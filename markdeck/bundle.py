@@ -0,0 +1,151 @@
+"""Fingerprinted, in-memory viewer files for MarkDeck."""
+
+import hashlib
+import json
+import mimetypes
+import re
+import threading
+from email.utils import formatdate
+from pathlib import Path
+from typing import NamedTuple
+
+from markdeck.encoding import EncodedBody
+from markdeck.vendor import VendorAssets, vendor_assets
+
+# Placeholders in HTML files for the URL of a front-end library or static file
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{(library|static):([\w.-]+)\}\}")
+
+
+class StaticFile(NamedTuple):
+    """A viewer file held in memory."""
+
+    body: EncodedBody
+    media_type: str
+    digest: str
+    modified: str
+
+
+class StaticBundle:
+    """
+    The viewer's static files, fingerprinted and kept in memory.
+
+    Files are read once, hashed and compressed in every supported coding, so
+    requests never touch the disk. Each file is reachable under a content-
+    hashed URL, ``/static/<hash>/<name>``, that can be cached forever.
+
+    HTML files are templates: ``{{static:<name>}}`` and ``{{library:<name>}}``
+    become the URL of that static file or front-end library, and
+    ``{{static}}`` and ``{{libraries}}`` JSON objects with all of them, for
+    the files slides.js loads itself.
+    """
+
+    def __init__(self, directory: Path, vendor: VendorAssets = vendor_assets):
+        """
+        Initialize the bundle. Files are loaded on first use.
+
+        Args:
+            directory: Directory with the viewer's files
+            vendor: Bundled front-end libraries
+        """
+        self.directory = directory
+        self.vendor = vendor
+        self._files: dict[str, StaticFile] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> StaticFile | None:
+        """
+        Get a file of the bundle.
+
+        Args:
+            name: File name, such as 'slides.js'
+
+        Returns:
+            The file, or None if the bundle has no such file
+        """
+        return self.load().get(name)
+
+    def url(self, name: str) -> str:
+        """
+        Get the content-hashed URL of a file.
+
+        Args:
+            name: File name
+
+        Returns:
+            URL that changes whenever the file does
+        """
+        return f"/static/{self.load()[name].digest}/{name}"
+
+    def clear(self) -> None:
+        """Forget the loaded files, so they are read again on next use."""
+        with self._lock:
+            self._files = None
+
+    def load(self) -> dict[str, StaticFile]:
+        """
+        Read, render and compress the files, unless that was done already.
+
+        Returns:
+            Dictionary of files by name
+        """
+        files = self._files
+        if files is not None:
+            return files
+        with self._lock:
+            if self._files is None:
+                files = {}
+                paths = [path for path in self.directory.iterdir() if path.is_file()]
+                # Pages refer to the other files, so those are hashed first
+                for path in sorted(paths, key=lambda path: (path.suffix == ".html", path.name)):
+                    content = path.read_bytes()
+                    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                    if media_type == "text/html":
+                        content = self._render(content.decode("utf-8"), files).encode("utf-8")
+                    files[path.name] = self._file(content, media_type, path.stat().st_mtime)
+                self._files = files
+            return self._files
+
+    def _render(self, html: str, files: dict[str, StaticFile]) -> str:
+        """
+        Fill in the URLs of an HTML template.
+
+        Args:
+            html: Contents of the template
+            files: Files loaded so far
+
+        Returns:
+            HTML with all placeholders replaced
+        """
+        libraries = self.vendor.urls()
+        static = {name: f"/static/{file.digest}/{name}" for name, file in files.items()}
+
+        def url(match: re.Match[str]) -> str:
+            kind, name = match.groups()
+            return libraries[name] if kind == "library" else static[name]
+
+        html = _PLACEHOLDER_PATTERN.sub(url, html)
+        # Escaped so the JSON cannot close the <script> element it is placed in
+        html = html.replace("{{libraries}}", json.dumps(libraries).replace("</", "<\\/"))
+        return html.replace("{{static}}", json.dumps(static).replace("</", "<\\/"))
+
+    @staticmethod
+    def _file(content: bytes, media_type: str, mtime: float) -> StaticFile:
+        """
+        Hash a file and compress it in every supported coding.
+
+        Args:
+            content: File content
+            media_type: MIME type of the file
+            mtime: Modification time of the file
+
+        Returns:
+            StaticFile with all variants built
+        """
+        body = EncodedBody(content)
+        for encoding in body.encodings:
+            body.encoded(encoding)
+        digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        return StaticFile(body, media_type, digest, formatdate(mtime, usegmt=True))
+
+
+static_bundle = StaticBundle(Path(__file__).parent / "static")
@@ -8,7 +8,14 @@ import click
 import uvicorn
 
 from markdeck import __version__
-from markdeck.server import app, enable_watch_mode, set_presentation_file
+from markdeck.server import (
+    app,
+    enable_follow_mode,
+    enable_prerender,
+    enable_watch_mode,
+    get_presenter_key,
+    set_presentation_file,
+)
 
 
 @click.group(invoke_without_command=True)
@@ -29,7 +36,13 @@ def main(ctx, version):
 @click.option("--host", "-h", default="127.0.0.1", help="Host to bind to")
 @click.option("--no-browser", is_flag=True, help="Do not open browser automatically")
 @click.option("--watch", "-w", is_flag=True, help="Watch file for changes and reload automatically")
-def present(file: Path, port: int, host: str, no_browser: bool, watch: bool):
+@click.option(
+    "--prerender", is_flag=True, help="Render slides to HTML on the server instead of the browser"
+)
+@click.option("--follow", is_flag=True, help="Let the audience's browsers follow the presenter")
+def present(
+    file: Path, port: int, host: str, no_browser: bool, watch: bool, prerender: bool, follow: bool
+):
     """
     Start presenting a markdown file.
 
@@ -47,17 +60,45 @@ def present(file: Path, port: int, host: str, no_browser: bool, watch: bool):
     file_path = file.resolve()
     set_presentation_file(file_path)
 
+    # Parse up front (in parallel for very large decks) so that the first
+    # request is served from the parse cache
+    from markdeck.parser import SlideParser
+
+    try:
+        SlideParser(file_path).load(parallel=True)
+    except (OSError, ValueError) as e:
+        # Start anyway: the viewer shows the error, and with --watch the
+        # presentation loads once the file is fixed
+        click.echo(f"Warning: Could not parse {file.name}: {e}", err=True)
+
+    # Fingerprint and compress the viewer's files before the first request
+    from markdeck.bundle import static_bundle
+
+    static_bundle.load()
+
     # Enable watch mode if requested
     if watch:
         enable_watch_mode(True)
         click.echo("Hot reload enabled - presentation will update when file changes")
 
+    # Enable server-side rendering if requested
+    if prerender:
+        enable_prerender(True)
+
     # Build URL
     url = f"http://{host}:{port}"
 
     click.echo("Starting MarkDeck server...")
     click.echo(f"Presenting: {file.name}")
     click.echo(f"URL: {url}")
+
+    # Enable follow mode if requested; the browser opens the presenter view
+    if follow:
+        enable_follow_mode(True)
+        click.echo(f"Audience URL (follows the presenter): {url}/?follow")
+        url = f"{url}/?presenter={get_presenter_key()}"
+        click.echo(f"Presenter URL (keep it private): {url}")
+
     click.echo("\nPress Ctrl+C to stop the server")
 
     # Open browser
@@ -210,24 +251,29 @@ def validate(file: Path):
 
     Example: markdeck validate my-slides.md
     """
-    from markdeck.parser import SlideParser
+    from markdeck.parser import SlideParser, extract_title
 
     try:
         parser = SlideParser(file)
-        slides = parser.parse()
-        title = parser.get_title()
-
-        click.echo("✓ File is valid")
-        click.echo(f"  Title: {title}")
-        click.echo(f"  Slides: {len(slides)}")
+        title = file.stem
+        total = 0
 
-        # Check for potential issues
+        # Check for potential issues, one slide at a time
         warnings = []
-        for i, slide in enumerate(slides, 1):
-            if not slide.content.strip():
+        for i, slide in enumerate(parser.iter_slides(parallel=True), 1):
+            total = i
+            if i == 1:
+                title = extract_title([slide], file.stem)
+            # Slide markdown is enough here, so column blocks are never rendered
+            markdown = slide.markdown
+            if not markdown:
                 warnings.append(f"  - Slide {i}: Empty content")
-            if len(slide.content) > 2000:
-                warnings.append(f"  - Slide {i}: Very long content ({len(slide.content)} chars)")
+            if len(markdown) > 2000:
+                warnings.append(f"  - Slide {i}: Very long content ({len(markdown)} chars)")
+
+        click.echo("✓ File is valid")
+        click.echo(f"  Title: {title}")
+        click.echo(f"  Slides: {total}")
 
         if warnings:
             click.echo("\nWarnings:")
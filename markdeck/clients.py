@@ -0,0 +1,218 @@
+"""Outgoing WebSocket messages for connected MarkDeck viewers."""
+
+import asyncio
+import contextlib
+from collections import OrderedDict
+from typing import Any
+
+from fastapi import WebSocket
+
+from markdeck.encoding import dumps
+
+
+class ClientConnection:
+    """
+    Send queue and writer task for one connected viewer.
+
+    Messages are queued without waiting and written by a task of their own,
+    so a slow or stalled viewer never holds up the others. Pending messages
+    are coalesced by key: a newer message replaces an unsent one with the same
+    key. If more than ``MAX_PENDING`` keys are waiting, the oldest message is
+    dropped. Messages that are pending together are sent as one JSON array,
+    in a single frame. A viewer that takes longer than ``SEND_TIMEOUT`` seconds to
+    accept a message is disconnected; the viewer reconnects and reloads.
+    """
+
+    MAX_PENDING = 32
+    SEND_TIMEOUT = 10.0
+
+    def __init__(self, websocket: WebSocket):
+        """
+        Initialize the connection. Call start() to begin writing.
+
+        Args:
+            websocket: Accepted WebSocket connection
+        """
+        self.websocket = websocket
+        self.closed = False
+        self._pending: OrderedDict[str, str] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    def send(self, key: str, text: str) -> bool:
+        """
+        Queue a message without waiting for it to be written.
+
+        Args:
+            key: Coalescing key; replaces an unsent message with the same key
+            text: Serialized message
+
+        Returns:
+            False if the connection is closed
+        """
+        if self.closed:
+            return False
+        self._pending.pop(key, None)
+        self._pending[key] = text
+        if len(self._pending) > self.MAX_PENDING:
+            self._pending.popitem(last=False)
+        self._wakeup.set()
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be written."""
+        return len(self._pending)
+
+    async def close(self) -> None:
+        """Stop the writer task and drop unsent messages."""
+        self.closed = True
+        self._pending.clear()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Write queued messages until the connection fails or is closed."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                texts = list(self._pending.values())
+                self._pending.clear()
+                text = texts[0] if len(texts) == 1 else f"[{','.join(texts)}]"
+                # asyncio.timeout() rather than wait_for(), which can swallow
+                # the cancellation from close() on Python 3.11
+                try:
+                    async with asyncio.timeout(self.SEND_TIMEOUT):
+                        await self.websocket.send_text(text)
+                except TimeoutError:
+                    self._fail()
+                    # Closing makes the receive loop of the endpoint finish
+                    with contextlib.suppress(Exception):
+                        async with asyncio.timeout(1.0):
+                            await self.websocket.close(code=1013)
+                    return
+                except Exception:
+                    self._fail()
+                    return
+
+    def _fail(self) -> None:
+        """Mark the connection closed after a failed write."""
+        self.closed = True
+        self._pending.clear()
+
+
+def broadcast(
+    clients: set[ClientConnection], message: dict[str, Any], key: str | None = None
+) -> int:
+    """
+    Queue a message for every connected viewer, without waiting on any of them.
+
+    The message is serialized once for all viewers. Connections that have
+    failed are removed from the set.
+
+    Args:
+        clients: Connected viewers
+        message: JSON-serializable message with a "type" field
+        key: Coalescing key (defaults to the message type)
+
+    Returns:
+        Number of viewers the message was queued for
+    """
+    text = dumps(message).decode("utf-8")
+    key = key if key is not None else message["type"]
+    sent = 0
+    for client in list(clients):
+        if client.send(key, text):
+            sent += 1
+        else:
+            clients.discard(client)
+    return sent
+
+
+class FollowChannel:
+    """
+    Relay the presenter's position to the viewers that follow along.
+
+    Navigation is coalesced: however fast the presenter moves, followers get
+    at most one update per ``interval`` seconds, always with the latest
+    position. Each update is serialized once and queued on every follower's
+    connection, where a newer update replaces one that was not sent yet.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """
+        Initialize the channel.
+
+        Args:
+            interval: Minimum number of seconds between two updates
+        """
+        self.interval = interval
+        self.followers: set[ClientConnection] = set()
+        self.slide: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._sent_at = float("-inf")
+
+    def add(self, client: ClientConnection) -> None:
+        """
+        Add a follower and send it the current position, if any.
+
+        Args:
+            client: Connection of the follower
+        """
+        self.followers.add(client)
+        if self.slide is not None:
+            client.send("goto", self._message())
+
+    def discard(self, client: ClientConnection) -> None:
+        """
+        Remove a follower.
+
+        Args:
+            client: Connection of the follower
+        """
+        self.followers.discard(client)
+
+    def move(self, slide: int) -> None:
+        """
+        Record a new presenter position and schedule an update.
+
+        Must be called on the event loop.
+
+        Args:
+            slide: Zero-based index of the presenter's slide
+        """
+        self.slide = slide
+        if self._handle is not None:
+            # The scheduled update will send the latest position
+            return
+        loop = asyncio.get_running_loop()
+        delay = max(0.0, self._sent_at + self.interval - loop.time())
+        self._handle = loop.call_later(delay, self._flush, loop)
+
+    def close(self) -> None:
+        """Cancel a scheduled update and forget the position."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self.slide = None
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Send the latest position to all followers."""
+        self._handle = None
+        self._sent_at = loop.time()
+        text = self._message()
+        for client in list(self.followers):
+            if not client.send("goto", text):
+                self.followers.discard(client)
+
+    def _message(self) -> str:
+        """Serialize the current position."""
+        return dumps({"type": "goto", "slide": self.slide}).decode("utf-8")
@@ -0,0 +1,231 @@
+"""Pre-serialized, pre-compressed response bodies for MarkDeck."""
+
+import gzip
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without the extra
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Bodies smaller than this are always sent uncompressed
+MIN_COMPRESS_SIZE = 512
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON.
+
+    Uses orjson when it is installed (``pip install markdeck[speedups]``).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def choose_encoding(accept_encoding: str | None, available: tuple[str, ...]) -> str | None:
+    """
+    Pick the preferred content coding that the client accepts.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+        available: Codings that can be served, most preferred first
+
+    Returns:
+        Name of the coding, or None for the uncompressed body
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    for encoding in available:
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class EncodedBody:
+    """
+    A serialized response body with its compressed variants.
+
+    Compressed variants are built on first request and then kept, so each
+    variant of a body is compressed at most once.
+    """
+
+    def __init__(self, identity: bytes):
+        """
+        Initialize the body.
+
+        Args:
+            identity: Uncompressed body
+        """
+        self.identity = identity
+        self._variants: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        """Content codings this body can be served with, most preferred first."""
+        if len(self.identity) < MIN_COMPRESS_SIZE:
+            return ()
+        if brotli is not None:
+            return ("br", "gzip")
+        return ("gzip",)
+
+    def peek(self, encoding: str | None) -> bytes | None:
+        """
+        Get the body in a content coding if it has already been built.
+
+        Args:
+            encoding: 'br', 'gzip', or None for the uncompressed body
+
+        Returns:
+            Body bytes, or None if the variant still has to be compressed
+        """
+        if encoding is None:
+            return self.identity
+        with self._lock:
+            return self._variants.get(encoding)
+
+    def encoded(self, encoding: str | None) -> bytes:
+        """
+        Get the body in a content coding.
+
+        Args:
+            encoding: 'br', 'gzip', or None for the uncompressed body
+
+        Returns:
+            Body bytes
+        """
+        if encoding is None:
+            return self.identity
+        with self._lock:
+            variant = self._variants.get(encoding)
+            if variant is None:
+                if encoding == "br":
+                    variant = brotli.compress(self.identity, quality=BROTLI_QUALITY)
+                else:
+                    variant = gzip.compress(self.identity, compresslevel=GZIP_LEVEL, mtime=0)
+                self._variants[encoding] = variant
+        return variant
+
+
+class BodyCache:
+    """
+    Cache of encoded response bodies, in least-recently-used order.
+
+    Keys identify one version of one representation, so cached bodies never
+    need to be invalidated; old versions simply fall out of the cache once
+    either the entry limit or the memory cap is exceeded. Memory use is
+    approximated by the size of the uncompressed bodies.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of bodies to keep
+            max_bytes: Maximum total size of the uncompressed bodies to keep
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Any, EncodedBody] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: Any,
+        build: Callable[[], Any],
+        serialize: Callable[[Any], bytes] = dumps,
+    ) -> EncodedBody:
+        """
+        Get the encoded body for a key, serializing it on first use.
+
+        Args:
+            key: Hashable identifier of the body's version and variant
+            build: Returns the data to serialize if the body is not cached
+            serialize: Turns the data into the body (JSON by default)
+
+        Returns:
+            EncodedBody for the key
+        """
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                return body
+
+        body = EncodedBody(serialize(build()))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._entries[key] = body
+            self._bytes += len(body.identity)
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, old_body = self._entries.popitem(last=False)
+                self._bytes -= len(old_body.identity)
+        return body
+
+    def peek(self, key: Any) -> EncodedBody | None:
+        """
+        Get the encoded body for a key if it is cached.
+
+        Args:
+            key: Hashable identifier of the body's version and variant
+
+        Returns:
+            EncodedBody, or None if it has not been serialized yet
+        """
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def clear(self) -> None:
+        """Remove all cached bodies."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached bodies."""
+        return len(self._entries)
+
+
+body_cache = BodyCache()
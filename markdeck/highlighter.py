@@ -0,0 +1,181 @@
+"""Server-side syntax highlighting of code blocks for MarkDeck."""
+
+import hashlib
+import html
+import threading
+from collections import OrderedDict
+
+try:
+    from pygments import lex
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import (
+        Comment,
+        Generic,
+        Keyword,
+        Name,
+        Number,
+        Operator,
+        String,
+        _TokenType,
+    )
+    from pygments.util import ClassNotFound
+except ImportError:  # pragma: no cover - exercised only without the extra
+    lex = None
+
+# Pygments token types mapped onto highlight.js classes, so that the
+# highlight.js theme stylesheets loaded by the viewer style the markup.
+# More specific types come first.
+_HLJS_CLASSES: list[tuple["_TokenType", str]] = []
+if lex is not None:
+    _HLJS_CLASSES = [
+        (Keyword.Constant, "hljs-literal"),
+        (Keyword.Type, "hljs-type"),
+        (Keyword, "hljs-keyword"),
+        (Operator.Word, "hljs-keyword"),
+        (Name.Builtin.Pseudo, "hljs-variable language_"),
+        (Name.Builtin, "hljs-built_in"),
+        (Name.Function, "hljs-title function_"),
+        (Name.Class, "hljs-title class_"),
+        (Name.Decorator, "hljs-meta"),
+        (Name.Tag, "hljs-name"),
+        (Name.Attribute, "hljs-attr"),
+        (Name.Variable, "hljs-variable"),
+        (Name.Constant, "hljs-variable constant_"),
+        (String.Regex, "hljs-regexp"),
+        (String.Escape, "hljs-char escape_"),
+        (String.Interpol, "hljs-subst"),
+        (String, "hljs-string"),
+        (Number, "hljs-number"),
+        (Comment.Preproc, "hljs-meta"),
+        (Comment, "hljs-comment"),
+        (Generic.Deleted, "hljs-deletion"),
+        (Generic.Inserted, "hljs-addition"),
+        (Generic.Heading, "hljs-section"),
+        (Generic.Emph, "hljs-emphasis"),
+        (Generic.Strong, "hljs-strong"),
+    ]
+
+
+def is_available() -> bool:
+    """
+    Check whether server-side highlighting is available.
+
+    Returns:
+        True if Pygments is installed (``pip install markdeck[highlight]``)
+    """
+    return lex is not None
+
+
+class CodeHighlighter:
+    """
+    Highlight code blocks on the server with Pygments.
+
+    The markup uses highlight.js class names, so it works with whichever
+    highlight.js theme the viewer has loaded and does not depend on the
+    presentation theme. Results are cached by (language, code hash), in
+    least-recently-used order.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the highlighter.
+
+        Args:
+            max_entries: Maximum number of highlighted blocks to keep
+        """
+        self.max_entries = max_entries
+        self._cache: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+        self._classes: dict[_TokenType, str] = {}
+        self._lock = threading.Lock()
+
+    def highlight(self, code: str, language: str) -> str | None:
+        """
+        Highlight a code block, using the cache when possible.
+
+        Args:
+            code: Source code of the block
+            language: Language name from the fence (e.g. 'python')
+
+        Returns:
+            Highlighted HTML for the inside of the <code> element, or None if
+            Pygments is unavailable or does not know the language
+        """
+        if lex is None or not language:
+            return None
+
+        digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+        key = (language, digest)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        markup = self._highlight(code, language)
+
+        with self._lock:
+            self._cache[key] = markup
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return markup
+
+    def clear(self) -> None:
+        """Remove all cached highlighting."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached blocks."""
+        return len(self._cache)
+
+    def _highlight(self, code: str, language: str) -> str | None:
+        """
+        Highlight a code block with Pygments.
+
+        Args:
+            code: Source code of the block
+            language: Language name from the fence
+
+        Returns:
+            Highlighted HTML, or None if the language is unknown
+        """
+        try:
+            lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+        except ClassNotFound:
+            return None
+
+        # Merge adjacent tokens with the same class into a single span
+        runs: list[tuple[str, list[str]]] = []
+        for token_type, value in lex(code, lexer):
+            css_class = self._css_class(token_type)
+            if runs and runs[-1][0] == css_class:
+                runs[-1][1].append(value)
+            else:
+                runs.append((css_class, [value]))
+
+        pieces = []
+        for css_class, values in runs:
+            text = html.escape("".join(values), quote=False)
+            if css_class:
+                pieces.append(f'<span class="{css_class}">{text}</span>')
+            else:
+                pieces.append(text)
+        return "".join(pieces)
+
+    def _css_class(self, token_type: "_TokenType") -> str:
+        """
+        Find the highlight.js class for a Pygments token type.
+
+        Args:
+            token_type: Pygments token type
+
+        Returns:
+            highlight.js class names, or an empty string for plain text
+        """
+        css_class = self._classes.get(token_type)
+        if css_class is None:
+            css_class = next((name for parent, name in _HLJS_CLASSES if token_type in parent), "")
+            self._classes[token_type] = css_class
+        return css_class
+
+
+code_highlighter = CodeHighlighter()
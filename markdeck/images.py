@@ -0,0 +1,194 @@
+"""Resized and re-encoded variants of presentation images for MarkDeck."""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from markdeck.assets import AssetFile
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - exercised only without the extra
+    Image = None
+
+# Widths variants are made in; requested widths are rounded up to one of
+# these, so each image has only a handful of variants
+WIDTHS = (160, 320, 480, 640, 960, 1280, 1920, 2560, 3840)
+
+# Image types that can be resized, by Pillow format name
+_FORMATS = {"image/png": "png", "image/jpeg": "jpeg", "image/webp": "webp"}
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+_SAVE_OPTIONS = {
+    "png": {"optimize": True},
+    "jpeg": {"quality": 85, "optimize": True, "progressive": True},
+    "webp": {"quality": 80, "method": 4},
+}
+
+
+def is_available() -> bool:
+    """
+    Check whether image variants can be made.
+
+    Returns:
+        True if Pillow is installed (``pip install markdeck[images]``)
+    """
+    return Image is not None
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the directory image variants are cached in.
+
+    Returns:
+        ``markdeck/images`` in the user's cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "markdeck" / "images"
+
+
+class ImageVariants:
+    """
+    Make and cache smaller or WebP versions of presentation images.
+
+    Variants are written to a cache directory, named after the hash of the
+    source image's content, the width and the format. An edited image thus
+    gets new variants, and a variant is made at most once, even across
+    restarts. Once the cache grows beyond ``max_bytes``, the oldest variants
+    are deleted.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the variants.
+
+        Args:
+            directory: Cache directory (defaults to default_cache_dir())
+            max_bytes: Maximum total size of the cached variants
+        """
+        self.directory = directory if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self._digests: OrderedDict[tuple[Path, int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, asset: AssetFile, width: int | None, image_format: str | None) -> Path | None:
+        """
+        Get a variant of an image, making it if it is not cached.
+
+        Reads and possibly encodes the image, so call it off the event loop.
+
+        Args:
+            asset: Current version of the source image
+            width: Maximum width in pixels, or None to keep the width
+            image_format: 'webp', 'png' or 'jpeg', or None to keep the format
+
+        Returns:
+            Path of the variant, or None if the source image should be sent:
+            because it is not a resizable image, is already small enough in
+            the requested format, or Pillow is not installed
+        """
+        source_format = _FORMATS.get(asset.media_type)
+        if Image is None or source_format is None:
+            return None
+        target_format = image_format or source_format
+        width = next((size for size in WIDTHS if size >= width), WIDTHS[-1]) if width else None
+
+        digest = self._digest(asset)
+        path = self.directory / f"{digest}-{width or 0}.{_EXTENSIONS[target_format]}"
+        if path.is_file():
+            return path
+
+        try:
+            with Image.open(asset.path) as source:
+                if (width is None or width >= source.width) and target_format == source_format:
+                    return None
+                image = ImageOps.exif_transpose(source)
+                if width is not None and width < image.width:
+                    height = max(1, round(image.height * width / image.width))
+                    image = image.resize((width, height), Image.Resampling.LANCZOS)
+                image = self._convert(image, target_format)
+
+                self.directory.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+                image.save(temp_path, format=target_format, **_SAVE_OPTIONS[target_format])
+                os.replace(temp_path, path)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # Not a valid image after all, or too large to decode safely;
+            # send it as it is
+            return None
+
+        self._prune()
+        return path
+
+    def clear(self) -> None:
+        """Delete all cached variants."""
+        with self._lock:
+            self._digests.clear()
+        if self.directory.is_dir():
+            for path in self.directory.iterdir():
+                path.unlink(missing_ok=True)
+
+    def _digest(self, asset: AssetFile) -> str:
+        """
+        Hash the content of a source image, once per version.
+
+        Args:
+            asset: Current version of the source image
+
+        Returns:
+            Hex digest of the image's content
+        """
+        key = (asset.path, asset.mtime_ns, asset.size)
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest is not None:
+                self._digests.move_to_end(key)
+                return digest
+
+        with open(asset.path, "rb") as f:
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+        with self._lock:
+            self._digests[key] = digest
+            while len(self._digests) > 1024:
+                self._digests.popitem(last=False)
+        return digest
+
+    @staticmethod
+    def _convert(image: "Image.Image", image_format: str) -> "Image.Image":
+        """
+        Convert an image to a mode the target format can store.
+
+        Args:
+            image: Image to convert
+            image_format: Target format
+
+        Returns:
+            The image, converted if necessary
+        """
+        if image_format == "jpeg":
+            return image if image.mode in ("RGB", "L") else image.convert("RGB")
+        if image_format == "webp" and image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.mode or "transparency" in image.info
+            return image.convert("RGBA" if has_alpha else "RGB")
+        return image
+
+    def _prune(self) -> None:
+        """Delete the oldest variants while the cache is over its size limit."""
+        files = []
+        for path in self.directory.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+image_variants = ImageVariants()
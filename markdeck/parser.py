@@ -1,12 +1,463 @@
 """Markdown slide parser for MarkDeck."""
 
+import copy
+import hashlib
+import mmap
+import multiprocessing
+import os
 import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+
+# Single alternation used to walk a slide once. Column closers are matched as
+# the bare newline (with a lookahead) so that "\n:::columns" still yields both
+# the closer and the next column header.
+_TOKEN_PATTERN = re.compile(r"```|:::columns|\|\|\||\n(?=:::)")
+_WIDTH_PATTERN = re.compile(r"<!--\s*SLIDE:(wide|full|ultra-wide)\s*-->\s*", re.IGNORECASE)
+_NOTES_OPEN_PATTERN = re.compile(r"<!--\s*NOTES:\s*", re.IGNORECASE)
+_COLUMN_WIDTH_PATTERN = re.compile(r"\[(\d+)\]")
+# Any newline that universal newline mode turns into "\n"
+_NEWLINE_PATTERN = re.compile(r"\r\n?")
+# Include directives on a line of their own, and the fence lines that can hide them
+_INCLUDE_PATTERN = re.compile(
+    r"^[ \t]*(?:(```)|<!--\s*INCLUDE:\s*(.+?)\s*-->[ \t]*$)", re.IGNORECASE | re.MULTILINE
+)
+_INCLUDE_BYTES_PATTERN = re.compile(rb"<!--\s*INCLUDE:", re.IGNORECASE)
+
+# Metadata patterns, applied to single lines outside fenced code
+_HEADING_PATTERN = re.compile(r" {0,3}(#{1,6})\s+(.+?)(?:\s+#+)?\s*$")
+_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\(|<img\b", re.IGNORECASE)
+# KaTeX delimiters configured in slides.js; like auto-render, allow spaces
+# inside $...$
+_MATH_PATTERN = re.compile(r"\$\$|\$[^$]+\$|\\\[|\\\(")
+# Diagrams written as raw HTML, which Mermaid renders like fenced ones
+_MERMAID_HTML_PATTERN = re.compile(
+    r"<[a-z][^>]*\bclass\s*=\s*[\"']?[^\"'>]*\bmermaid\b", re.IGNORECASE
+)
+# Link targets and HTML tags do not count as words
+_NON_WORD_PATTERN = re.compile(r"\]\([^)]*\)|<[^>]*>")
+_WORD_PATTERN = re.compile(r"\w+")
+
+_FENCE = "```"
+_COLUMN_HEADER = ":::columns"
+_COLUMN_SEPARATOR = "|||"
+_COLUMN_CLOSER_LENGTH = len("\n:::")
+# Characters of slide source sent to a worker process at a time
+_PARALLEL_CHUNK_SIZE = 1024 * 1024
+
+
+def _strip_span(source: str, start: int, end: int) -> tuple[int, int]:
+    """
+    Narrow a span of the source so that it excludes surrounding whitespace.
+
+    Args:
+        source: Full source text
+        start: Start offset of the span
+        end: End offset of the span
+
+    Returns:
+        Tuple of (start, end) equivalent to ``source[start:end].strip()``
+    """
+    while start < end and source[start].isspace():
+        start += 1
+    while end > start and source[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _iter_slide_spans(source: str, delimiter: str) -> Iterator[tuple[int, int]]:
+    """
+    Find the stripped span of every non-empty slide in the source.
+
+    Boundaries follow ``str.split(delimiter)`` semantics exactly, including
+    that a delimiter consumes the newline that would start the next one.
+
+    Args:
+        source: Full markdown source
+        delimiter: Slide delimiter including its surrounding newlines
+
+    Yields:
+        Tuple of (start, end) offsets for each slide
+    """
+    marker = delimiter.strip()
+    position = 0
+    length = len(source)
+    while True:
+        cut = source.find(delimiter, position)
+        start, end = _strip_span(source, position, length if cut == -1 else cut)
+        if start < end and not (end - start == len(marker) and source.startswith(marker, start)):
+            yield start, end
+        if cut == -1:
+            return
+        position = cut + len(delimiter)
+
+
+def _extract_notes(source: str, start: int, end: int) -> tuple[str, str] | None:
+    """
+    Cut speaker notes (``<!--NOTES: ... -->``) out of a slide.
+
+    Every notes comment is removed, wherever it appears; the first one
+    provides the notes text.
+
+    Args:
+        source: Full source text
+        start: Start offset of the slide
+        end: End offset of the slide
+
+    Returns:
+        Tuple of (content without notes, notes), or None if the slide has
+        no speaker notes
+    """
+    notes = None
+    pieces = []
+    cursor = start
+    position = source.find("<!--", start, end)
+    while position != -1:
+        opening = _NOTES_OPEN_PATTERN.match(source, position, end)
+        closing = source.find("-->", opening.end(), end) if opening else -1
+        if closing == -1:
+            position = source.find("<!--", position + 4, end)
+            continue
+        if notes is None:
+            notes = source[opening.end() : closing].strip()
+        pieces.append(source[cursor:position])
+        cursor = closing + 3
+        position = source.find("<!--", cursor, end)
+    if notes is None:
+        return None
+    pieces.append(source[cursor:end])
+    return "".join(pieces).strip(), notes
+
+
+def _column_body_start(source: str, position: int, end: int) -> tuple[int, int, int] | None:
+    """
+    Walk the whitespace that follows a column header.
+
+    Args:
+        source: Source text
+        position: Offset just after the header (and optional width)
+        end: End offset of the slide
+
+    Returns:
+        Tuple of (body start, end of the whitespace run, newline count), where
+        the body starts after the last newline of the run, or None when the
+        run contains no newline
+    """
+    last_newline = -1
+    newlines = 0
+    while position < end and source[position].isspace():
+        if source[position] == "\n":
+            last_newline = position
+            newlines += 1
+        position += 1
+    if last_newline == -1:
+        return None
+    return last_newline + 1, position, newlines
+
+
+def _prepare_slide(source: str, start: int, end: int) -> tuple[str, int, int, str, str | None]:
+    """
+    Read the width directive and cut speaker notes out of one slide.
+
+    This is the cheap first stage of rendering a slide: it only looks at the
+    start of the slide and at HTML comments.
+
+    Args:
+        source: Full source text
+        start: Start offset of the slide
+        end: End offset of the slide
+
+    Returns:
+        Tuple of (text, start, end, notes, width_mode), where the span of the
+        text is the slide markdown without directive and notes. The text is
+        the source itself unless notes had to be cut out.
+    """
+    start, end = _strip_span(source, start, end)
+
+    # Only match the width directive at the start of the slide
+    width_mode = None
+    match = _WIDTH_PATTERN.match(source, start, end)
+    if match:
+        width_mode = match.group(1).lower()
+        start, end = _strip_span(source, match.end(), end)
+
+    extracted = _extract_notes(source, start, end)
+    if extracted is None:
+        return source, start, end, "", width_mode
+    text, notes = extracted
+    return text, 0, len(text), notes, width_mode
+
+
+def _transform_columns(source: str, start: int, end: int) -> str | None:
+    """
+    Rewrite column syntax in a prepared slide with a single forward token scan.
+
+    The slide is walked once over its significant tokens, tracking fenced
+    code state, and column syntax outside code blocks is rewritten into the
+    marker format that the frontend expects.
+
+    Column syntax:
+        :::columns
+        Left content
+        |||
+        Right content
+        :::
+
+    Or with percentage width:
+        :::columns[60]
+        Left content (60% width)
+        |||
+        Right content (40% width)
+        :::
+
+    Is rewritten into markers that slides.js renders after marked.js runs:
+        <!-- COLUMN:LEFT:START:60 -->
+        Left content (markdown)
+        <!-- COLUMN:LEFT:END -->
+        <!-- COLUMN:RIGHT:START -->
+        Right content (markdown)
+        <!-- COLUMN:RIGHT:END -->
+
+    Args:
+        source: Source text
+        start: Start offset of the slide markdown
+        end: End offset of the slide markdown
+
+    Returns:
+        The rewritten slide, or None if the slide has no column blocks
+    """
+    if source.find(_COLUMN_HEADER, start, end) == -1:
+        return None
+
+    headers: list[int] = []
+    separators: list[int] = []
+    closers: list[int] = []
+    # Tokens seen after an opening fence are dropped once the fence closes;
+    # an unmatched opening fence is plain text, so they are kept after all
+    fence_start = -1
+    pending: list[tuple[str, int]] = []
+    for token in _TOKEN_PATTERN.finditer(source, start, end):
+        text = token.group()
+        position = token.start()
+        if text == _FENCE:
+            if fence_start == -1:
+                fence_start = position
+            else:
+                fence_start = -1
+                pending.clear()
+        elif fence_start != -1:
+            pending.append((text, position))
+        elif text == _COLUMN_HEADER:
+            headers.append(position)
+        elif text == _COLUMN_SEPARATOR:
+            separators.append(position)
+        else:
+            closers.append(position)
+    for text, position in pending:
+        if text == _COLUMN_HEADER:
+            headers.append(position)
+        elif text == _COLUMN_SEPARATOR:
+            separators.append(position)
+        else:
+            closers.append(position)
+
+    pieces = []
+    cursor = start
+    resume = start
+    for header in headers:
+        if header < resume:
+            continue
+        position = header + len(_COLUMN_HEADER)
+        width_percent = None
+        width_match = _COLUMN_WIDTH_PATTERN.match(source, position, end)
+        if width_match:
+            width_percent = width_match.group(1)
+            position = width_match.end()
+
+        run = _column_body_start(source, position, end)
+        if run is None:
+            continue
+        body_start, run_end, newlines = run
+
+        closer_index = bisect_left(closers, body_start)
+        if closer_index == len(closers):
+            # A header followed by blank lines and a bare ":::" is still a
+            # (separator-less) block, so scanning resumes after it
+            if newlines > 1 and body_start == run_end and source.startswith(":::", run_end, end):
+                resume = run_end + 3
+            continue
+        closer = closers[closer_index]
+        resume = closer + _COLUMN_CLOSER_LENGTH
+
+        separator_index = bisect_left(separators, body_start)
+        if separator_index == len(separators) or separators[separator_index] > closer:
+            # If no separator found, keep the original content
+            continue
+        separator = separators[separator_index]
+
+        left_content = source[body_start:separator].strip()
+        right_content = source[separator + len(_COLUMN_SEPARATOR) : closer].strip()
+        if width_percent:
+            left_start_marker = f"<!-- COLUMN:LEFT:START:{width_percent} -->"
+        else:
+            left_start_marker = "<!-- COLUMN:LEFT:START -->"
+
+        pieces.append(source[cursor:header])
+        pieces.append(
+            f"{left_start_marker}\n"
+            f"{left_content}\n"
+            "<!-- COLUMN:LEFT:END -->\n"
+            "<!-- COLUMN:RIGHT:START -->\n"
+            f"{right_content}\n"
+            "<!-- COLUMN:RIGHT:END -->"
+        )
+        cursor = resume
+
+    if not pieces:
+        return None
+    pieces.append(source[cursor:end])
+    return "".join(pieces)
+
+
+def _split_includes(text: str, directory: Path) -> tuple[str | Path, ...]:
+    """
+    Split a file's text at its include directives.
+
+    An include directive (``<!--INCLUDE: path.md-->``) must be on a line of
+    its own and outside fenced code. Paths are relative to the directory of
+    the including file.
+
+    Args:
+        text: Text of the file
+        directory: Directory of the file
+
+    Returns:
+        Text pieces and resolved include paths, in order
+    """
+    if "<!--" not in text:
+        return (text,)
+
+    segments: list[str | Path] = []
+    cursor = 0
+    in_fence = False
+    for match in _INCLUDE_PATTERN.finditer(text):
+        if match.group(1):
+            in_fence = not in_fence
+        elif not in_fence:
+            segments.append(text[cursor : match.start()])
+            segments.append((directory / match.group(2)).resolve())
+            cursor = match.end()
+    segments.append(text[cursor:])
+    return tuple(segments)
+
+
+class SourceFile(NamedTuple):
+    """A version of one source file of a presentation, split at its includes."""
+
+    mtime_ns: int
+    size: int
+    segments: tuple[str | Path, ...]
+
+
+class SlideMetadata(NamedTuple):
+    """Structural summary of a slide, for outlines and tables of contents."""
+
+    headings: tuple[tuple[int, str], ...]
+    word_count: int
+    has_code: bool
+    has_mermaid: bool
+    has_math: bool
+    has_images: bool
+    has_notes: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the metadata to dictionary format.
+
+        Returns:
+            Dictionary representation of the metadata
+        """
+        return {
+            "headings": [{"level": level, "text": text} for level, text in self.headings],
+            "word_count": self.word_count,
+            "has_code": self.has_code,
+            "has_mermaid": self.has_mermaid,
+            "has_math": self.has_math,
+            "has_images": self.has_images,
+            "has_notes": self.has_notes,
+        }
+
+
+def _scan_metadata(markdown: str, notes: str) -> SlideMetadata:
+    """
+    Collect the metadata of a slide in one pass over its lines.
+
+    Fenced code is skipped apart from its language, and column syntax lines
+    are ignored. Words are counted outside code, without link targets and
+    HTML tags.
+
+    Args:
+        markdown: Slide markdown without width directive and notes
+        notes: Speaker notes of the slide
+
+    Returns:
+        SlideMetadata for the slide
+    """
+    headings = []
+    word_count = 0
+    has_code = has_mermaid = has_math = has_images = False
+    in_fence = False
+    for line in markdown.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith(_FENCE):
+            if not in_fence:
+                language = stripped[len(_FENCE) :].strip().lower()
+                if language == "mermaid":
+                    has_mermaid = True
+                else:
+                    has_code = True
+            in_fence = not in_fence
+            continue
+        if in_fence or stripped.startswith(_COLUMN_HEADER) or stripped in (":::", "|||"):
+            continue
+
+        heading = _HEADING_PATTERN.match(line)
+        if heading:
+            headings.append((len(heading.group(1)), heading.group(2)))
+        if not has_images and _IMAGE_PATTERN.search(line):
+            has_images = True
+        if not has_math and _MATH_PATTERN.search(line):
+            has_math = True
+        if not has_mermaid and _MERMAID_HTML_PATTERN.search(line):
+            has_mermaid = True
+        word_count += len(_WORD_PATTERN.findall(_NON_WORD_PATTERN.sub(" ", line)))
+
+    return SlideMetadata(
+        headings=tuple(headings),
+        word_count=word_count,
+        has_code=has_code,
+        has_mermaid=has_mermaid,
+        has_math=has_math,
+        has_images=has_images,
+        has_notes=bool(notes),
+    )
 
 
 class Slide:
-    """Represents a single slide in a presentation."""
+    """
+    Represents a single slide in a presentation.
+
+    Slides are lazy: they keep offsets into the shared source of the
+    presentation and only work out the width mode, notes and rendered content
+    when those are first accessed.
+    """
+
+    __slots__ = ("index", "_source", "_start", "_end", "_prepared", "_content", "_metadata")
 
     def __init__(self, content: str, index: int):
         """
@@ -16,148 +467,137 @@ class Slide:
             content: Raw markdown content of the slide
             index: Zero-based index of the slide
         """
-        self.content = content.strip()
         self.index = index
-        self.width_mode = self._extract_width_mode()
-        self.notes = self._extract_notes()
-        self._transform_columns()
+        self._source = content
+        self._start = 0
+        self._end = len(content)
+        self._prepared = None
+        self._content = None
+        self._metadata = None
 
-    def _extract_width_mode(self) -> str | None:
+    @classmethod
+    def from_source(cls, source: str, start: int, end: int, index: int) -> "Slide":
         """
-        Extract slide width mode directive.
+        Create a slide from a span of a larger source without copying it.
 
-        Supports:
-        - <!--SLIDE:wide--> (90% viewport)
-        - <!--SLIDE:full--> (95% viewport)
-        - <!--SLIDE:ultra-wide--> (98% viewport)
+        Args:
+            source: Full markdown source of the presentation
+            start: Start offset of the slide in the source
+            end: End offset of the slide in the source
+            index: Zero-based index of the slide
 
         Returns:
-            Width mode ('wide', 'full', 'ultra-wide') or None
-        """
-        # Only match directive at the start of content (after optional whitespace)
-        pattern = r"^\s*<!--\s*SLIDE:(wide|full|ultra-wide)\s*-->\s*"
-        match = re.match(pattern, self.content, re.IGNORECASE)
-        if match:
-            mode = match.group(1).lower()
-            # Remove only the directive at the start
-            self.content = re.sub(pattern, "", self.content, flags=re.IGNORECASE)
-            self.content = self.content.strip()
-            return mode
-        return None
+            Slide object
+        """
+        slide = cls.__new__(cls)
+        slide.index = index
+        slide._source = source
+        slide._start = start
+        slide._end = end
+        slide._prepared = None
+        slide._content = None
+        slide._metadata = None
+        return slide
 
-    def _extract_notes(self) -> str:
+    @classmethod
+    def from_rendered(
+        cls, markdown: str, notes: str, width_mode: str | None, content: str | None, index: int
+    ) -> "Slide":
         """
-        Extract speaker notes from HTML comments.
+        Create a slide from the results of rendering it elsewhere.
+
+        Args:
+            markdown: Slide markdown without width directive and notes
+            notes: Speaker notes
+            width_mode: Width mode or None
+            content: Content after the column transform, or None if unchanged
+            index: Zero-based index of the slide
 
         Returns:
-            Extracted notes or empty string
-        """
-        notes_pattern = r"<!--\s*NOTES:\s*(.*?)\s*-->"
-        match = re.search(notes_pattern, self.content, re.DOTALL | re.IGNORECASE)
-        if match:
-            # Remove the notes from content
-            self.content = re.sub(notes_pattern, "", self.content, flags=re.DOTALL | re.IGNORECASE)
-            self.content = self.content.strip()
-            return match.group(1).strip()
-        return ""
-
-    def _transform_columns(self) -> None:
-        """
-        Transform column syntax into marker format for frontend processing.
-
-        Converts:
-            :::columns
-            Left content
-            |||
-            Right content
-            :::
-
-        Or with percentage width:
-            :::columns[60]
-            Left content (60% width)
-            |||
-            Right content (40% width)
-            :::
-
-        Into special markers that the frontend will process:
-            <!-- COLUMN:LEFT:START -->
-            Left content (markdown)
-            <!-- COLUMN:LEFT:END -->
-            <!-- COLUMN:RIGHT:START -->
-            Right content (markdown)
-            <!-- COLUMN:RIGHT:END -->
-
-        Or with width:
-            <!-- COLUMN:LEFT:START:60 -->
-            Left content (markdown)
-            <!-- COLUMN:LEFT:END -->
-            <!-- COLUMN:RIGHT:START -->
-            Right content (markdown)
-            <!-- COLUMN:RIGHT:END -->
-
-        The frontend (slides.js) will find these markers and render the markdown
-        in each column, allowing mermaid diagrams and other features to work.
-
-        Note: Code blocks are protected from transformation to avoid transforming
-        example column syntax inside code blocks.
-        """
-        # First, protect code blocks by replacing them with placeholders
-        code_blocks = []
-        code_block_pattern = r"```.*?```"
-
-        def save_code_block(match):
-            code_blocks.append(match.group(0))
-            return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
-
-        # Save all code blocks
-        protected_content = re.sub(
-            code_block_pattern, save_code_block, self.content, flags=re.DOTALL
-        )
+            Slide object that needs no further rendering
+        """
+        slide = cls.from_source(markdown, 0, len(markdown), index)
+        slide._prepared = (markdown, 0, len(markdown), notes, width_mode)
+        slide._content = content
+        return slide
 
-        # Pattern to match column blocks with optional width percentage
-        # Matches: :::columns or :::columns[60]
-        column_pattern = r":::columns(?:\[(\d+)\])?\s*\n(.*?)\s*\n:::"
+    def _prepare(self) -> tuple[str, int, int, str, str | None]:
+        """
+        Extract the width mode and notes on first use.
 
-        def replace_columns(match):
-            width_percent = match.group(1)  # Can be None if no width specified
-            content = match.group(2)
-            # Split on ||| separator (more forgiving with whitespace)
-            parts = re.split(r"\s*\|\|\|\s*", content, maxsplit=1)
+        Returns:
+            Tuple of (text, start, end, notes, width_mode) from _prepare_slide
+        """
+        prepared = self._prepared
+        if prepared is None:
+            prepared = _prepare_slide(self._source, self._start, self._end)
+            self._prepared = prepared
+        return prepared
 
-            if len(parts) == 2:
-                left_content = parts[0].strip()
-                right_content = parts[1].strip()
+    @property
+    def width_mode(self) -> str | None:
+        """Width mode ('wide', 'full', 'ultra-wide') or None."""
+        return self._prepare()[4]
 
-                # Create marker structure that preserves markdown
-                # Include width in left column marker if specified
-                if width_percent:
-                    left_start_marker = f"<!-- COLUMN:LEFT:START:{width_percent} -->"
-                else:
-                    left_start_marker = "<!-- COLUMN:LEFT:START -->"
-
-                # The frontend will process these markers after marked.js runs
-                return (
-                    f"{left_start_marker}\n"
-                    f"{left_content}\n"
-                    "<!-- COLUMN:LEFT:END -->\n"
-                    "<!-- COLUMN:RIGHT:START -->\n"
-                    f"{right_content}\n"
-                    "<!-- COLUMN:RIGHT:END -->"
-                )
-            else:
-                # If no separator found, return original content
-                return match.group(0)
+    @property
+    def notes(self) -> str:
+        """Speaker notes, or an empty string."""
+        return self._prepare()[3]
 
-        # Transform columns in the protected content
-        protected_content = re.sub(
-            column_pattern, replace_columns, protected_content, flags=re.DOTALL
-        )
+    @property
+    def markdown(self) -> str:
+        """Slide markdown without width directive and notes, before the column transform."""
+        text, start, end, _, _ = self._prepare()
+        return text[start:end]
 
-        # Restore code blocks
-        for i, code_block in enumerate(code_blocks):
-            protected_content = protected_content.replace(f"__CODE_BLOCK_{i}__", code_block)
+    @property
+    def content(self) -> str:
+        """Slide content with column syntax rewritten into frontend markers."""
+        content = self._content
+        if content is None:
+            text, start, end, _, _ = self._prepare()
+            content = _transform_columns(text, start, end)
+            if content is None:
+                return text[start:end]
+            self._content = content
+        return content
 
-        self.content = protected_content
+    @property
+    def metadata(self) -> SlideMetadata:
+        """Headings, word count and content flags of the slide."""
+        metadata = self._metadata
+        if metadata is None:
+            text, start, end, notes, _ = self._prepare()
+            metadata = _scan_metadata(text[start:end], notes)
+            self._metadata = metadata
+        return metadata
+
+    def rebased(self, source: str, start: int, end: int, index: int) -> "Slide":
+        """
+        Copy the slide onto the same text in a new version of the source.
+
+        Rendered content and metadata are kept. The copy refers only to the
+        new source, so slides reused across versions do not keep every old
+        version of the presentation in memory.
+
+        Args:
+            source: Full markdown source of the new version
+            start: Start offset of the slide in the new source
+            end: End offset of the slide in the new source
+            index: Zero-based index of the slide in the new version
+
+        Returns:
+            Slide object
+        """
+        slide = copy.copy(self)
+        slide.index = index
+        slide._source = source
+        slide._start = start
+        slide._end = end
+        if self._prepared is not None and self._prepared[0] is self._source:
+            # Offsets into the old source; prepared again from the new one
+            slide._prepared = None
+        return slide
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -174,10 +614,298 @@ class Slide:
         }
 
 
+def extract_title(slides: Sequence[Slide], fallback: str) -> str:
+    """
+    Extract the presentation title from the first H1 of the first slide.
+
+    Args:
+        slides: Parsed slides
+        fallback: Title to use when there is no H1 (usually the filename)
+
+    Returns:
+        Title of the presentation or the fallback
+    """
+    if not slides:
+        return fallback
+
+    for level, text in slides[0].metadata.headings:
+        if level == 1:
+            return text
+
+    return fallback
+
+
+def _render_chunk(
+    source: str, spans: Sequence[tuple[int, int]]
+) -> list[tuple[str, str, str | None, str | None]]:
+    """
+    Prepare and transform a chunk of slides. Runs in a worker process.
+
+    Args:
+        source: Source text containing the slides
+        spans: Span of each slide in the source
+
+    Returns:
+        Tuple of (markdown, notes, width_mode, content) per slide, where
+        content is None if the column transform left the slide unchanged
+    """
+    rendered = []
+    for start, end in spans:
+        text, start, end, notes, width_mode = _prepare_slide(source, start, end)
+        rendered.append((text[start:end], notes, width_mode, _transform_columns(text, start, end)))
+    return rendered
+
+
+def _iter_chunks(
+    source: str, spans: Sequence[tuple[int, int]], chunk_size: int
+) -> Iterator[tuple[str, list[tuple[int, int]]]]:
+    """
+    Group slide spans into chunks of roughly ``chunk_size`` characters.
+
+    Each chunk carries only its own part of the source, so that workers are
+    not sent the whole presentation.
+
+    Args:
+        source: Full source text
+        spans: Span of each slide in the source
+        chunk_size: Target number of characters per chunk
+
+    Yields:
+        Tuple of (chunk source, spans relative to the chunk source)
+    """
+    first = 0
+    while first < len(spans):
+        offset = spans[first][0]
+        last = first + 1
+        while last < len(spans) and spans[last][1] - offset < chunk_size:
+            last += 1
+        chunk = source[offset : spans[last - 1][1]]
+        yield chunk, [(start - offset, end - offset) for start, end in spans[first:last]]
+        first = last
+
+
+def _render_parallel(
+    chunks: Iterable[tuple[str, Sequence[tuple[int, int]]]], workers: int | None = None
+) -> Iterator[Slide]:
+    """
+    Render chunks of slides in a process pool, yielding them in order.
+
+    At most two chunks per worker are in flight at a time, so chunks can be
+    produced lazily without the whole presentation being held in memory.
+
+    Args:
+        chunks: Tuples of (chunk source, slide spans in the chunk source)
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Yields:
+        Fully rendered Slide objects, in order
+    """
+    workers = workers or os.cpu_count() or 1
+    index = 0
+    # Parsing runs in threads of the server, and forking a multi-threaded
+    # process can deadlock the children, so start them fresh
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending: deque[Future] = deque()
+        chunks = iter(chunks)
+        while True:
+            for chunk in chunks:
+                pending.append(pool.submit(_render_chunk, *chunk))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+            for markdown, notes, width_mode, content in pending.popleft().result():
+                yield Slide.from_rendered(markdown, notes, width_mode, content, index)
+                index += 1
+
+
+def _common_slides(
+    old_source: str,
+    old_spans: Sequence[tuple[int, int]],
+    source: str,
+    spans: Sequence[tuple[int, int]],
+) -> tuple[int, int]:
+    """
+    Count the unchanged slides at the start and end of two versions of a deck.
+
+    Args:
+        old_source: Source of the old version
+        old_spans: Slide spans of the old version
+        source: Source of the new version
+        spans: Slide spans of the new version
+
+    Returns:
+        Tuple of (unchanged leading slides, unchanged trailing slides)
+    """
+
+    def unchanged(old_index: int, new_index: int) -> bool:
+        old_start, old_end = old_spans[old_index]
+        new_start, new_end = spans[new_index]
+        return (
+            old_end - old_start == new_end - new_start
+            and old_source[old_start:old_end] == source[new_start:new_end]
+        )
+
+    shortest = min(len(old_spans), len(spans))
+    prefix = 0
+    while prefix < shortest and unchanged(prefix, prefix):
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and unchanged(
+        len(old_spans) - 1 - suffix, len(spans) - 1 - suffix
+    ):
+        suffix += 1
+    return prefix, suffix
+
+
+class DeckDiff(NamedTuple):
+    """
+    Slide-level difference between two versions of a deck.
+
+    The changed slides always form one contiguous run: the old slides
+    ``removed + modified`` are replaced by the new slides ``modified + added``.
+    """
+
+    added: tuple[int, ...]
+    removed: tuple[int, ...]
+    modified: tuple[int, ...]
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the two versions have the same slides.
+
+        Returns:
+            True if no slide was added, removed or modified
+        """
+        return not (self.added or self.removed or self.modified)
+
+    @classmethod
+    def between(cls, old_count: int, new_count: int, prefix: int, suffix: int) -> "DeckDiff":
+        """
+        Build the difference from the unchanged slides at either end.
+
+        Args:
+            old_count: Number of slides in the old version
+            new_count: Number of slides in the new version
+            prefix: Number of unchanged leading slides
+            suffix: Number of unchanged trailing slides
+
+        Returns:
+            DeckDiff; removed slides are numbered as in the old version,
+            added and modified slides as in the new version
+        """
+        old_middle = old_count - prefix - suffix
+        new_middle = new_count - prefix - suffix
+        changed = min(old_middle, new_middle)
+        return cls(
+            added=tuple(range(prefix + changed, prefix + new_middle)),
+            removed=tuple(range(prefix + changed, prefix + old_middle)),
+            modified=tuple(range(prefix, prefix + changed)),
+        )
+
+
+class Deck(NamedTuple):
+    """
+    An immutable parsed presentation, shared by all consumers of a version.
+
+    The source and the slide spans are kept so that the next version can be
+    parsed incrementally against this one. ``files`` lists the presentation
+    file followed by every file it includes, directly or indirectly.
+    """
+
+    slides: tuple[Slide, ...]
+    title: str
+    version: str
+    source: str
+    spans: tuple[tuple[int, int], ...]
+    changes: DeckDiff | None = None
+    files: tuple[str, ...] = ()
+
+    def diff(self, previous: "Deck") -> DeckDiff:
+        """
+        Compare this deck with an earlier version of the same presentation.
+
+        Unlike ``changes``, which is relative to whichever version the deck
+        was parsed against, this works for any pair of versions.
+
+        Args:
+            previous: Earlier version of the deck
+
+        Returns:
+            Slide-level difference from the previous version to this one
+        """
+        prefix, suffix = _common_slides(previous.source, previous.spans, self.source, self.spans)
+        return DeckDiff.between(len(previous.spans), len(self.spans), prefix, suffix)
+
+    def features(self) -> dict[str, bool]:
+        """
+        Find which optional viewer features the presentation uses.
+
+        Returns:
+            Dictionary with whether any slide has math or Mermaid diagrams
+        """
+        metadata = [slide.metadata for slide in self.slides]
+        return {
+            "math": any(item.has_math for item in metadata),
+            "mermaid": any(item.has_mermaid for item in metadata),
+        }
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Convert the deck to JSON-serializable format.
+
+        Returns:
+            Dictionary with slides and metadata
+        """
+        return {
+            "slides": [slide.to_dict() for slide in self.slides],
+            "total": len(self.slides),
+            "title": self.title,
+        }
+
+    def outline(self) -> list[dict[str, Any]]:
+        """
+        Build the heading tree of the presentation.
+
+        Headings nest under the closest preceding heading of a lower level,
+        across slide boundaries.
+
+        Returns:
+            List of root nodes, each with title, level, slide and children
+        """
+        roots: list[dict[str, Any]] = []
+        stack: list[dict[str, Any]] = []
+        for slide in self.slides:
+            for level, text in slide.metadata.headings:
+                node = {"title": text, "level": level, "slide": slide.index, "children": []}
+                while stack and stack[-1]["level"] >= level:
+                    stack.pop()
+                (stack[-1]["children"] if stack else roots).append(node)
+                stack.append(node)
+        return roots
+
+    def to_outline(self) -> dict[str, Any]:
+        """
+        Convert the deck's metadata index to JSON-serializable format.
+
+        Returns:
+            Dictionary with the title, heading tree and per-slide metadata
+        """
+        return {
+            "title": self.title,
+            "total": len(self.slides),
+            "outline": self.outline(),
+            "slides": [{"id": slide.index, **slide.metadata.to_dict()} for slide in self.slides],
+        }
+
+
 class SlideParser:
     """Parser for markdown files containing slides."""
 
     SLIDE_DELIMITER = "---"
+    # Source size in bytes from which parallel parsing uses a process pool
+    PARALLEL_THRESHOLD = 8 * 1024 * 1024
 
     def __init__(self, file_path: str | Path):
         """
@@ -194,36 +922,211 @@ class SlideParser:
         """
         Parse the markdown file into slides.
 
+        The slides come from the shared parse cache, so an unchanged file is
+        not parsed again.
+
         Returns:
             List of Slide objects
         """
-        content = self.file_path.read_text(encoding="utf-8")
-        return self.parse_content(content)
+        return list(self.load().slides)
+
+    @classmethod
+    def _use_pool(cls, size: int) -> bool:
+        """
+        Decide whether parallel parsing of a source is worth a process pool.
+
+        Args:
+            size: Size of the source
+
+        Returns:
+            True if the source is large enough and there is more than one CPU
+        """
+        return size >= cls.PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
 
     @classmethod
     def parse_content(cls, content: str) -> list[Slide]:
         """
         Parse markdown content into slides.
 
+        The content is scanned once from start to end: slide boundaries are
+        found as the scan goes and each slide is rendered straight from its
+        span of the content, without intermediate copies.
+
         Args:
             content: Raw markdown content
 
         Returns:
             List of Slide objects
         """
-        # Split on delimiter with proper handling of edge cases
-        raw_slides = content.split(f"\n{cls.SLIDE_DELIMITER}\n")
+        delimiter = f"\n{cls.SLIDE_DELIMITER}\n"
+        return [
+            Slide.from_source(content, start, end, idx)
+            for idx, (start, end) in enumerate(_iter_slide_spans(content, delimiter))
+        ]
+
+    @classmethod
+    def parse_deck(
+        cls,
+        content: str,
+        fallback_title: str,
+        version: str,
+        previous: "Deck | None" = None,
+        parallel: bool = False,
+    ) -> "Deck":
+        """
+        Parse markdown content into a Deck, incrementally if possible.
+
+        When a previous version is given, the new slide boundaries are
+        compared against the previous ones: the unchanged slides before and
+        after the edit are reused, and only the slides in between are
+        rendered. The deck's ``changes`` report which slides differ.
+
+        A full parse in parallel mode renders every slide up front, fanning
+        chunks of slides out to a process pool when the content reaches
+        ``PARALLEL_THRESHOLD``.
+
+        Args:
+            content: Raw markdown content
+            fallback_title: Title to use when the first slide has no H1
+            version: Version identifier of the content
+            previous: Previously parsed version of the same presentation
+            parallel: Render all slides in a process pool if the content is large
+
+        Returns:
+            Deck object
+        """
+        delimiter = f"\n{cls.SLIDE_DELIMITER}\n"
+        spans = tuple(_iter_slide_spans(content, delimiter))
+        if previous is None:
+            if parallel and cls._use_pool(len(content)):
+                slides = tuple(_render_parallel(_iter_chunks(content, spans, _PARALLEL_CHUNK_SIZE)))
+            else:
+                slides = tuple(
+                    Slide.from_source(content, start, end, idx)
+                    for idx, (start, end) in enumerate(spans)
+                )
+            return Deck(slides, extract_title(slides, fallback_title), version, content, spans)
 
-        # Also handle delimiter at start or end of lines
+        old_spans = previous.spans
+        prefix, suffix = _common_slides(previous.source, old_spans, content, spans)
+
+        old_middle = len(old_spans) - prefix - suffix
+        new_middle = len(spans) - prefix - suffix
+        # Unchanged slides keep their rendering but move onto the new source
+        shift = new_middle - old_middle
         slides = []
-        for raw_slide in raw_slides:
-            # Remove leading/trailing delimiters if present
-            raw_slide = raw_slide.strip()
-            if raw_slide and raw_slide != cls.SLIDE_DELIMITER:
-                slides.append(raw_slide)
+        for idx, (start, end) in enumerate(spans):
+            if prefix <= idx < prefix + new_middle:
+                slides.append(Slide.from_source(content, start, end, idx))
+            else:
+                old = previous.slides[idx if idx < prefix else idx - shift]
+                slides.append(old.rebased(content, start, end, idx))
 
-        # Create Slide objects
-        return [Slide(content, idx) for idx, content in enumerate(slides)]
+        changes = DeckDiff.between(len(old_spans), len(spans), prefix, suffix)
+        slides = tuple(slides)
+        return Deck(slides, extract_title(slides, fallback_title), version, content, spans, changes)
+
+    def load(self, parallel: bool = False) -> "Deck":
+        """
+        Load the parsed presentation through the process-wide parse cache.
+
+        Args:
+            parallel: Parse in a process pool if the file is not cached and large
+
+        Returns:
+            The shared, immutable Deck for the current version of the file
+        """
+        return parse_cache.get(self.file_path, parallel=parallel)
+
+    def iter_slides(self, parallel: bool = False) -> Iterator[Slide]:
+        """
+        Parse the markdown file lazily, one slide at a time.
+
+        The file is memory-mapped and slide delimiters are searched for in the
+        mapped bytes, so only the slide being yielded is decoded. Memory use
+        stays bounded however large the file is, as long as the caller does
+        not keep the slides around.
+
+        In parallel mode, files of at least ``PARALLEL_THRESHOLD`` bytes are
+        rendered in a process pool a few chunks ahead of the caller. Files
+        with include directives are loaded as a whole instead.
+
+        Args:
+            parallel: Render slides in a process pool if the file is large
+
+        Yields:
+            Slide objects, in order
+        """
+        if self._has_includes():
+            # Included files have to be assembled first, so there is nothing to stream
+            yield from self.load(parallel=parallel).slides
+            return
+        if parallel and self._use_pool(self.file_path.stat().st_size):
+            yield from _render_parallel(self._iter_chunks())
+            return
+        for index, (text, start, stop) in enumerate(self._iter_slide_texts()):
+            yield Slide.from_source(text, start, stop, index)
+
+    def _has_includes(self) -> bool:
+        """
+        Check whether the file may contain include directives.
+
+        Returns:
+            True if an include directive appears anywhere in the file
+        """
+        with self.file_path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return _INCLUDE_BYTES_PATTERN.search(buffer) is not None
+
+    def _iter_slide_texts(self) -> Iterator[tuple[str, int, int]]:
+        """
+        Decode the slides of the memory-mapped file one at a time.
+
+        Yields:
+            Tuple of (decoded text, start, end) with the stripped slide span
+        """
+        newline = rb"(?:\r\n|\r|\n)"
+        marker = re.escape(self.SLIDE_DELIMITER.encode("utf-8"))
+        delimiter = re.compile(newline + marker + newline)
+        with self.file_path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                position = 0
+                while True:
+                    match = delimiter.search(buffer, position)
+                    end = match.start() if match else len(buffer)
+                    text = buffer[position:end].decode("utf-8")
+                    if "\r" in text:
+                        text = _NEWLINE_PATTERN.sub("\n", text)
+                    start, stop = _strip_span(text, 0, len(text))
+                    if start < stop and text[start:stop] != self.SLIDE_DELIMITER:
+                        yield text, start, stop
+                    if match is None:
+                        return
+                    position = match.end()
+
+    def _iter_chunks(self) -> Iterator[tuple[str, list[tuple[int, int]]]]:
+        """
+        Group the slides of the file into chunks for worker processes.
+
+        Yields:
+            Tuple of (chunk source, slide spans in the chunk source)
+        """
+        pieces: list[str] = []
+        spans: list[tuple[int, int]] = []
+        size = 0
+        for text, start, stop in self._iter_slide_texts():
+            pieces.append(text[start:stop])
+            spans.append((size, size + stop - start))
+            size += stop - start
+            if size >= _PARALLEL_CHUNK_SIZE:
+                yield "".join(pieces), spans
+                pieces, spans, size = [], [], 0
+        if spans:
+            yield "".join(pieces), spans
 
     def get_title(self) -> str:
         """
@@ -232,17 +1135,7 @@ class SlideParser:
         Returns:
             Title of the presentation or filename
         """
-        slides = self.parse()
-        if not slides:
-            return self.file_path.stem
-
-        # Try to find first H1 heading
-        first_slide = slides[0].content
-        h1_match = re.search(r"^#\s+(.+)$", first_slide, re.MULTILINE)
-        if h1_match:
-            return h1_match.group(1).strip()
-
-        return self.file_path.stem
+        return extract_title(self.parse(), self.file_path.stem)
 
     def to_json(self) -> dict[str, Any]:
         """
@@ -255,5 +1148,246 @@ class SlideParser:
         return {
             "slides": [slide.to_dict() for slide in slides],
             "total": len(slides),
-            "title": self.get_title(),
+            "title": extract_title(slides, self.file_path.stem),
         }
+
+
+class ParseCache:
+    """
+    Process-wide cache of parsed presentations.
+
+    Entries are keyed on (resolved path, (mtime_ns, size) of every file of
+    the presentation, content hash) and evicted in least-recently-used order
+    once either the entry limit or the memory cap is exceeded. Memory use is
+    approximated by the source size.
+
+    Each source file is also cached on its own, split at its include
+    directives, so that editing one included file only reads that file again.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of parsed versions to keep
+            max_bytes: Maximum total source size of the parsed versions to keep
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, tuple[tuple[int, int], ...], str], Deck] = (
+            OrderedDict()
+        )
+        self._files: dict[str, SourceFile] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str | Path, parallel: bool = False) -> "Deck":
+        """
+        Get the parsed presentation for the current version of a file.
+
+        A presentation whose files all have unchanged mtimes and sizes is
+        served without being read. Otherwise changed files are read again,
+        included files are spliced in, and a cached parse of the same content
+        is reused, so only genuinely new content is parsed. New content is
+        parsed incrementally against the most recently used version of the
+        same presentation.
+
+        Args:
+            file_path: Path to the markdown file
+            parallel: Parse in a process pool if the file has to be parsed
+                from scratch and is large (see SlideParser.parse_deck)
+
+        Returns:
+            The shared, immutable Deck for the file
+
+        Raises:
+            FileNotFoundError: If the file or an included file does not exist
+            ValueError: If files include each other in a cycle
+        """
+        deck = self.peek(file_path)
+        if deck is not None:
+            return deck
+
+        path = Path(file_path).resolve()
+        name = str(path)
+        files: dict[str, SourceFile] = {}
+        content = self._assemble(path, (), files)
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        stamp = tuple((source.mtime_ns, source.size) for source in files.values())
+        key = (name, stamp, digest)
+        names = tuple(files)
+
+        previous = None
+        with self._lock:
+            for old_key, deck in reversed(self._entries.items()):
+                if old_key[0] != name:
+                    continue
+                if old_key[2] == digest:
+                    if deck.files != names:
+                        deck = deck._replace(files=names)
+                    self._store(key, deck)
+                    return deck
+                if previous is None:
+                    previous = deck
+
+        deck = SlideParser.parse_deck(content, path.stem, digest, previous, parallel=parallel)
+        deck = deck._replace(files=names)
+
+        with self._lock:
+            self._store(key, deck)
+        return deck
+
+    def peek(self, file_path: str | Path) -> "Deck | None":
+        """
+        Get the cached presentation for a file, without reading or parsing it.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            The cached Deck if none of its files changed, otherwise None
+        """
+        name = str(Path(file_path).resolve())
+        with self._lock:
+            candidates = [(key, deck) for key, deck in reversed(self._entries.items())]
+        for key, deck in candidates:
+            if key[0] == name and self._stamp(deck.files) == key[1]:
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                return deck
+        return None
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._files.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached versions."""
+        return len(self._entries)
+
+    @staticmethod
+    def _stamp(files: Sequence[str]) -> tuple[tuple[int, int], ...] | None:
+        """
+        Read the current (mtime_ns, size) of each file.
+
+        Args:
+            files: Paths of the files
+
+        Returns:
+            Tuple of (mtime_ns, size) per file, or None if one of them is gone
+        """
+        stamp = []
+        for name in files:
+            try:
+                stat = os.stat(name)
+            except OSError:
+                return None
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamp)
+
+    def _assemble(self, path: Path, chain: tuple[Path, ...], files: dict[str, SourceFile]) -> str:
+        """
+        Build the full text of a file with its includes spliced in.
+
+        Args:
+            path: Resolved path of the file
+            chain: Files that include this one, outermost first
+            files: Collects the version of every file used, in include order
+
+        Returns:
+            Text of the file with include directives replaced
+
+        Raises:
+            FileNotFoundError: If an included file does not exist
+            ValueError: If files include each other in a cycle
+        """
+        source = self._read(path)
+        files.setdefault(str(path), source)
+        chain += (path,)
+        pieces = []
+        for segment in source.segments:
+            if isinstance(segment, str):
+                pieces.append(segment)
+                continue
+            if segment in chain:
+                cycle = " -> ".join(item.name for item in chain + (segment,))
+                raise ValueError(f"Include cycle: {cycle}")
+            try:
+                included = self._assemble(segment, chain, files)
+            except FileNotFoundError as e:
+                if e.filename != str(segment):
+                    raise
+                raise FileNotFoundError(
+                    f"Included file not found: {segment} (included from {path.name})"
+                ) from e
+            # The directive's own newline ends the included text
+            pieces.append(included.rstrip("\n"))
+        return "".join(pieces)
+
+    def _read(self, path: Path) -> SourceFile:
+        """
+        Get the current version of one source file, reading it only if it changed.
+
+        Args:
+            path: Resolved path of the file
+
+        Returns:
+            SourceFile for the file
+        """
+        name = str(path)
+        stat = path.stat()
+        with self._lock:
+            cached = self._files.get(name)
+        if cached is not None and (cached.mtime_ns, cached.size) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return cached
+
+        with path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            data = handle.read()
+        text = data.decode("utf-8")
+        if "\r" in text:
+            # Match the universal newline handling of Path.read_text()
+            text = _NEWLINE_PATTERN.sub("\n", text)
+        source = SourceFile(stat.st_mtime_ns, stat.st_size, _split_includes(text, path.parent))
+        with self._lock:
+            self._files[name] = source
+        return source
+
+    def _store(self, key: tuple[str, tuple[tuple[int, int], ...], str], deck: "Deck") -> None:
+        """
+        Insert an entry and evict least-recently-used ones over the limits.
+
+        Source files that no remaining entry uses are dropped as well. Must be
+        called with the lock held.
+
+        Args:
+            key: Cache key of the entry
+            deck: Parsed presentation to store
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = deck
+        self._bytes += len(deck.source)
+        evicted = False
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, old_deck = self._entries.popitem(last=False)
+            self._bytes -= len(old_deck.source)
+            evicted = True
+        if evicted:
+            used = {name for entry in self._entries.values() for name in entry.files}
+            for name in [name for name in self._files if name not in used]:
+                del self._files[name]
+
+
+parse_cache = ParseCache()
@@ -0,0 +1,176 @@
+"""Server-side HTML rendering of slides for MarkDeck."""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from html import unescape
+
+from markdown_it import MarkdownIt
+from mdit_py_plugins.tasklists import tasklists_plugin
+
+from markdeck.highlighter import code_highlighter
+from markdeck.parser import Slide
+
+# Column markers written by the parser (see parser._transform_columns)
+_LEFT_START_PATTERN = re.compile(r"<!-- COLUMN:LEFT:START(?::(\d+))? -->")
+_LEFT_END = "<!-- COLUMN:LEFT:END -->"
+_RIGHT_START = "<!-- COLUMN:RIGHT:START -->"
+_RIGHT_END = "<!-- COLUMN:RIGHT:END -->"
+
+_MERMAID_PATTERN = re.compile(r'<pre><code class="language-mermaid">(.*?)</code></pre>', re.DOTALL)
+_CODE_BLOCK_PATTERN = re.compile(
+    r'<pre><code class="language-([^"]+)">(.*?)</code></pre>', re.DOTALL
+)
+
+
+def _highlight_block(match: re.Match[str]) -> str:
+    """
+    Replace a labeled code block with server-highlighted markup.
+
+    Unlabeled blocks never match, and blocks in languages Pygments does not
+    know are left as they are; slides.js highlights those in the browser.
+
+    Args:
+        match: Match of _CODE_BLOCK_PATTERN
+
+    Returns:
+        Highlighted code block HTML, or the original block
+    """
+    language = match.group(1)
+    markup = code_highlighter.highlight(unescape(match.group(2)), language)
+    if markup is None:
+        return match.group(0)
+    return f'<pre><code class="hljs language-{language}">{markup}</code></pre>'
+
+
+class SlideRenderer:
+    """
+    Render slide markdown to HTML on the server.
+
+    Like marked.js in slides.js, this follows CommonMark with the GitHub
+    extensions (tables, strikethrough, task lists and bare URLs as links) and
+    turns single newlines into line breaks. Mermaid containers and two-column
+    layouts are built the same way too, so the viewer can insert the output
+    directly. Markup can still differ in details such as attribute order, but
+    not in how a slide looks. Rendered HTML is cached by a hash of the slide
+    content, in least-recently-used order.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the renderer.
+
+        Args:
+            max_entries: Maximum number of rendered slides to keep
+        """
+        self.max_entries = max_entries
+        self._markdown = MarkdownIt("gfm-like", {"breaks": True, "html": True})
+        self._markdown.use(tasklists_plugin)
+        # marked writes strikethrough as <del>, markdown-it as <s>
+        self._markdown.add_render_rule("s_open", lambda *args: "<del>")
+        self._markdown.add_render_rule("s_close", lambda *args: "</del>")
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, slide: Slide) -> str:
+        """
+        Render a slide to HTML, using the cache when possible.
+
+        Args:
+            slide: Slide to render
+
+        Returns:
+            HTML for the slide content
+        """
+        content = slide.content
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        with self._lock:
+            html = self._cache.get(key)
+            if html is not None:
+                self._cache.move_to_end(key)
+                return html
+
+            html = self._render_columns(content)
+            if html is None:
+                html = self._convert(content)
+
+            self._cache[key] = html
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        """Remove all cached HTML."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached slides."""
+        return len(self._cache)
+
+    def _convert(self, text: str) -> str:
+        """
+        Convert markdown to HTML. Must be called with the lock held.
+
+        Args:
+            text: Markdown to convert
+
+        Returns:
+            HTML output
+        """
+        html = self._markdown.render(text).rstrip("\n")
+        # Mermaid reads the diagram source from the container's text
+        html = _MERMAID_PATTERN.sub(r'<div class="mermaid">\1</div>', html)
+        return _CODE_BLOCK_PATTERN.sub(_highlight_block, html)
+
+    def _render_columns(self, content: str) -> str | None:
+        """
+        Render a slide with column markers as a two-column layout.
+
+        Mirrors processColumnMarkers() in slides.js. Must be called with the
+        lock held.
+
+        Args:
+            content: Slide content with column markers
+
+        Returns:
+            HTML for the slide, or None if it has no (complete) column markers
+        """
+        left_start_match = _LEFT_START_PATTERN.search(content)
+        if not left_start_match:
+            return None
+
+        left_start_idx = left_start_match.start()
+        left_end_idx = content.find(_LEFT_END)
+        right_start_idx = content.find(_RIGHT_START)
+        right_end_idx = content.find(_RIGHT_END)
+        if -1 in (left_end_idx, right_start_idx, right_end_idx):
+            return None
+
+        left_markdown = content[left_start_match.end() : left_end_idx].strip()
+        right_markdown = content[right_start_idx + len(_RIGHT_START) : right_end_idx].strip()
+
+        left_style = ""
+        right_style = ""
+        if left_start_match.group(1):
+            # Validate width is between 1 and 99
+            width = max(1, min(99, int(left_start_match.group(1))))
+            left_style = f' style="flex: 0 0 {width}%;"'
+            right_style = ' style="flex: 1;"'
+
+        columns_html = (
+            '<div class="columns-container">'
+            f'<div class="column-left"{left_style}>{self._convert(left_markdown)}</div>'
+            f'<div class="column-right"{right_style}>{self._convert(right_markdown)}</div>'
+            "</div>"
+        )
+
+        before = content[:left_start_idx].strip()
+        after = content[right_end_idx + len(_RIGHT_END) :].strip()
+        before_html = self._convert(before) if before else ""
+        after_html = self._convert(after) if after else ""
+        return before_html + columns_html + after_html
+
+
+slide_renderer = SlideRenderer()
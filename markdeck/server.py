@@ -1,22 +1,65 @@
 """FastAPI server for MarkDeck presentation viewer."""
 
+import asyncio
+import hashlib
+import json
+import os
+import secrets
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
 import click
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
-from markdeck.parser import SlideParser
+from markdeck.assets import asset_store, byte_range, iter_file
+from markdeck.bundle import StaticFile, static_bundle
+from markdeck.clients import ClientConnection, FollowChannel, broadcast
+from markdeck.encoding import EncodedBody, body_cache, choose_encoding, dumps
+from markdeck.images import WIDTHS as IMAGE_WIDTHS
+from markdeck.images import image_variants
+from markdeck.images import is_available as images_available
+from markdeck.parser import Deck, Slide, SlideParser, extract_title, parse_cache
+from markdeck.renderer import slide_renderer
+from markdeck.terminal import terminal_writer
+from markdeck.vendor import vendor_assets
 
 app = FastAPI(title="MarkDeck", description="Markdown presentation tool")
 
 # Global variable to store the current presentation file
 _current_file: Path | None = None
 _watch_enabled: bool = False
-_websocket_clients: list[WebSocket] = []
+_prerender_enabled: bool = False
+_follow_enabled: bool = False
+_websocket_clients: set[ClientConnection] = set()
+# Viewers that follow the presenter, and the key that identifies the presenter
+_follow = FollowChannel()
+_presenter_key: str | None = None
+
+# Cache-Control of responses whose URL changes with their content
+_IMMUTABLE = "public, max-age=31536000, immutable"
+# Cache-Control of presentation assets, which keep their URL when they change
+_ASSET_CACHE_CONTROL = "public, max-age=86400"
+
+# Number of slides embedded in the viewer page
+_BOOTSTRAP_SLIDES = 3
+
+# Size in bytes of the NDJSON batches sent by /api/slides.ndjson
+_NDJSON_BATCH_SIZE = 64 * 1024
+
+# Presentations are read and parsed in this pool, never on the event loop.
+# Large files are additionally rendered in a process pool by the parser.
+_parse_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="markdeck-parse"
+)
+# In-flight loads by resolved path, shared by concurrent requests
+_parse_inflight: dict[str, asyncio.Future[Deck]] = {}
+# In-flight response bodies by body cache key, likewise
+_body_inflight: dict[Any, asyncio.Future[EncodedBody]] = {}
 
 
 def set_presentation_file(file_path: str | Path | None) -> None:
@@ -41,19 +84,254 @@ def enable_watch_mode(enabled: bool = True) -> None:
     _watch_enabled = enabled
 
 
+def enable_prerender(enabled: bool = True) -> None:
+    """
+    Enable or disable server-side HTML rendering of slides.
+
+    Args:
+        enabled: Whether to include pre-rendered HTML in /api/slides
+    """
+    global _prerender_enabled
+    _prerender_enabled = enabled
+
+
+def enable_follow_mode(enabled: bool = True) -> None:
+    """
+    Enable or disable follow mode, where viewers follow the presenter's slides.
+
+    Enabling it generates a new presenter key (see get_presenter_key()).
+
+    Args:
+        enabled: Whether to enable follow mode
+    """
+    global _follow_enabled, _presenter_key
+    _follow_enabled = enabled
+    _presenter_key = secrets.token_urlsafe(16) if enabled else None
+    _follow.close()
+
+
+def get_presenter_key() -> str | None:
+    """
+    Get the key that identifies the presenter in follow mode.
+
+    The presenter's viewer passes it as ``?presenter=<key>``; only navigation
+    from a WebSocket connected with the key is relayed to the followers.
+
+    Returns:
+        The presenter key, or None if follow mode is disabled
+    """
+    return _presenter_key
+
+
 async def notify_clients_reload() -> None:
-    """Notify all connected WebSocket clients to reload."""
-    disconnected = []
-    for client in _websocket_clients:
-        try:
-            await client.send_json({"type": "reload"})
-        except Exception:
-            disconnected.append(client)
+    """
+    Notify all connected WebSocket clients to reload.
+
+    The message is only queued for each client, so this returns without
+    waiting on slow connections.
+    """
+    broadcast(_websocket_clients, {"type": "reload"})
+
+
+async def notify_clients_changed(previous: Deck | None, deck: Deck | None) -> None:
+    """
+    Push the slides that changed between two versions to all WebSocket clients.
+
+    Clients holding the previous version patch their slides in place; others
+    reload the deck. Without both versions, clients are told to reload.
+
+    Args:
+        previous: Version the clients were last notified of, if any
+        deck: New version, or None if it failed to load
+    """
+    if previous is None or deck is None:
+        await notify_clients_reload()
+        return
+    if previous.version == deck.version:
+        return
+
+    changes = deck.diff(previous)
+    changed = changes.modified or changes.added or changes.removed
+    # Edits outside the slides, such as trailing whitespace, change the
+    # version but no slide; the patch then only moves clients to the new one
+    first = changed[0] if changed else 0
+    message = {
+        "type": "patch",
+        "base": previous.version,
+        "version": deck.version,
+        "title": deck.title,
+        "total": len(deck.slides),
+        "start": first,
+        "modified": list(changes.modified),
+        "added": list(changes.added),
+        "removed": list(changes.removed),
+        "slides": [_slide_data(deck.slides[i]) for i in changes.modified + changes.added],
+        "features": deck.features(),
+    }
+    # Shares the key of reload messages: a newer patch or reload replaces an
+    # unsent one, and clients that miss a patch notice the version mismatch
+    broadcast(_websocket_clients, message, key="reload")
+
+
+async def load_deck(file_path: Path) -> Deck:
+    """
+    Load a presentation through the parse cache without blocking the event loop.
+
+    The file is read and parsed in a bounded worker pool. Concurrent calls for
+    the same file wait for a single in-flight load instead of each starting
+    their own.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        The shared, immutable Deck for the current version of the file
+
+    Raises:
+        FileNotFoundError: If the file or an included file does not exist
+        ValueError: If files include each other in a cycle
+    """
+    return await _run_once(_parse_inflight, str(file_path.resolve()), _parse, file_path)
+
+
+async def _run_once(
+    inflight: dict[Any, asyncio.Future[Any]], key: Any, func: Callable[..., Any], *args: Any
+) -> Any:
+    """
+    Run a function in the worker pool, once for all concurrent callers.
+
+    Args:
+        inflight: Futures of the calls in progress, by key
+        key: Identifies the call; callers with the same key share its result
+        func: Function to run
+        *args: Arguments for the function
+
+    Returns:
+        The function's result
+    """
+    loop = asyncio.get_running_loop()
+    future = inflight.get(key)
+    if future is None or future.get_loop() is not loop:
+        future = loop.run_in_executor(_parse_executor, func, *args)
+        inflight[key] = future
+
+        def forget(done: asyncio.Future[Any]) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+
+        future.add_done_callback(forget)
+
+    # A cancelled request must not cancel the call for the other waiters
+    return await asyncio.shield(future)
+
+
+async def _cached_body(
+    key: Any, build: Callable[[], Any], serialize: Callable[[Any], bytes] = dumps
+) -> EncodedBody:
+    """
+    Get a response body from the body cache without blocking the event loop.
+
+    Slides are rendered lazily, so building a body can be most of the work
+    of loading a presentation; it runs in the worker pool, once per key.
+
+    Args:
+        key: Body cache key
+        build: Returns the data to serialize if the body is not cached
+        serialize: Turns the data into the body (JSON by default)
+
+    Returns:
+        EncodedBody for the key
+    """
+    body = body_cache.peek(key)
+    if body is not None:
+        return body
+    return await _run_once(_body_inflight, key, body_cache.get, key, build, serialize)
+
+
+def _parse(file_path: Path) -> Deck:
+    """
+    Load a presentation through the parse cache. Runs in the worker pool.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        The shared, immutable Deck for the current version of the file
+    """
+    return parse_cache.get(file_path, parallel=True)
+
+
+def _validators(deck: Deck) -> dict[str, str]:
+    """
+    Build the cache validators for the slides of a deck.
+
+    The ETag is derived from the deck version, and from whether the response
+    includes pre-rendered HTML. Last-Modified is the latest mtime of the
+    presentation and the files it includes.
+
+    Args:
+        deck: Loaded presentation
+
+    Returns:
+        Response headers with ETag, Last-Modified, Cache-Control and Vary
+    """
+    etag = f'"{deck.version}-html"' if _prerender_enabled else f'"{deck.version}"'
+    mtime = max((os.stat(name).st_mtime for name in deck.files), default=0)
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(mtime, usegmt=True),
+        # Let clients keep the response, but always revalidate it
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+
+def _encoded_etag(etag: str, encoding: str | None) -> str:
+    """
+    Derive the ETag of a compressed variant, so each variant has its own.
+
+    Args:
+        etag: ETag of the uncompressed response
+        encoding: Content coding of the variant, or None
+
+    Returns:
+        ETag of the variant
+    """
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _is_not_modified(request: Request, validators: dict[str, str]) -> bool:
+    """
+    Evaluate the conditional headers of a GET request.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+
+    Args:
+        request: Incoming request
+        validators: Headers with the ETag and, optionally, Last-Modified of
+            the current version
+
+    Returns:
+        True if the client's copy is current and a 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        etag = validators["ETag"]
+        variants = {_encoded_etag(etag, encoding) for encoding in (None, "gzip", "br")}
+        return "*" in tags or not tags.isdisjoint(variants)
 
-    # Remove disconnected clients
-    for client in disconnected:
-        if client in _websocket_clients:
-            _websocket_clients.remove(client)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and "Last-Modified" in validators:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            modified = parsedate_to_datetime(validators["Last-Modified"])
+        except (TypeError, ValueError):
+            return False
+        return since.tzinfo is not None and modified <= since
+    return False
 
 
 def get_static_dir() -> Path:
@@ -61,68 +339,299 @@ def get_static_dir() -> Path:
     return Path(__file__).parent / "static"
 
 
-# Mount static files
-app.mount("/static", StaticFiles(directory=get_static_dir()), name="static")
+async def _encoded_response(
+    request: Request, body: EncodedBody, media_type: str, validators: dict[str, str]
+) -> Response:
+    """
+    Send a body in the content coding the client prefers.
+
+    A variant that has not been compressed yet is compressed in the worker
+    pool.
+
+    Args:
+        request: Incoming request, for its Accept-Encoding header
+        body: Body to send
+        media_type: MIME type of the body
+        validators: Caching headers of the uncompressed body
+
+    Returns:
+        Response with the body and headers
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding"), body.encodings)
+    headers = dict(validators, ETag=_encoded_etag(validators["ETag"], encoding))
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    content = body.peek(encoding)
+    if content is None:
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(_parse_executor, body.encoded, encoding)
+    return Response(content, media_type=media_type, headers=headers)
+
+
+async def _static_response(request: Request, file: StaticFile, immutable: bool) -> Response:
+    """
+    Send a file of the viewer from memory.
+
+    Args:
+        request: Incoming request, for its conditional and encoding headers
+        file: File to send
+        immutable: Whether the URL is content-hashed, so the file may be
+            cached forever; otherwise clients revalidate it on every use
+
+    Returns:
+        Response with the file in the preferred content coding, or an empty
+        304 response
+    """
+    validators = {
+        "ETag": f'"{file.digest}"',
+        "Last-Modified": file.modified,
+        "Cache-Control": _IMMUTABLE if immutable else "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if _is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    return await _encoded_response(request, file.body, file.media_type, validators)
 
 
-@app.get("/assets/{file_path:path}")
-async def serve_asset(file_path: str) -> FileResponse:
+@app.get("/static/{file_path:path}", response_model=None)
+async def serve_static(request: Request, file_path: str) -> Response:
     """
-    Serve assets (images, etc.) from the presentation's directory.
+    Serve a file of the viewer, as /static/<hash>/<name> or /static/<name>.
+
+    Content-hashed URLs are cached forever. A hash that does not match the
+    current file, for example from a page loaded before a restart, gets the
+    current file, to be revalidated like an unhashed URL.
 
     Args:
+        request: Incoming request, for its conditional and encoding headers
+        file_path: File name, optionally preceded by its content hash
+
+    Returns:
+        The requested file, or an empty 304 response
+    """
+    digest, _, name = file_path.rpartition("/")
+    file = static_bundle.get(name)
+    if file is None or "/" in digest:
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
+    return await _static_response(request, file, immutable=digest == file.digest)
+
+
+@app.get("/assets/{file_path:path}", response_model=None)
+async def serve_asset(
+    request: Request,
+    file_path: str,
+    width: int | None = Query(None, ge=1, le=10000),
+    image_format: str | None = Query(None, alias="format", pattern="^(webp|png|jpeg)$"),
+) -> Response:
+    """
+    Serve assets (images, videos, etc.) from the presentation's directory.
+
+    Responses carry an ETag and Last-Modified, and conditional requests for
+    an unchanged file are answered with 304 Not Modified. A single byte range
+    can be requested, so browsers can seek in videos. Small files are served
+    from memory. Larger whole files are sent with FileResponse, which lets
+    the server send them from disk itself where it supports that.
+
+    PNG, JPEG and WebP images can be requested smaller or in another format;
+    the variants are made once and cached on disk. Without Pillow, or for
+    other files, the original is sent.
+
+    Args:
+        request: Incoming request, for its conditional and Range headers
         file_path: Relative path to the asset file
+        width: Maximum width of an image, rounded up to one of images.WIDTHS
+        image_format: Format to send an image in ('webp', 'png' or 'jpeg')
 
     Returns:
-        The requested file
+        The requested file or part of it, or an empty 304 response
     """
     if not _current_file:
         raise HTTPException(status_code=400, detail="No presentation file loaded")
 
-    # Get the directory containing the presentation file
-    presentation_dir = _current_file.parent
+    # Security check: the path must stay within the presentation directory
+    asset_path = asset_store.resolve(_current_file.parent, file_path)
+    if asset_path is None:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    asset = asset_store.stat(asset_path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail=f"Asset not found: {file_path}")
+
+    if width is not None or image_format is not None:
+        loop = asyncio.get_running_loop()
+        variant = await loop.run_in_executor(None, image_variants.get, asset, width, image_format)
+        if variant is not None:
+            asset = asset_store.stat(variant) or asset
 
-    # Resolve the asset path relative to the presentation directory
-    asset_path = (presentation_dir / file_path).resolve()
+    validators = {
+        "ETag": asset.etag,
+        "Last-Modified": asset.modified,
+        # With hot reload, a replaced image must show up on the next reload
+        "Cache-Control": "no-cache" if _watch_enabled else _ASSET_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+    if _is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
 
-    # Security check: ensure the resolved path is within the presentation directory
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() not in (asset.etag, asset.modified):
+        # The client's partial copy is outdated, so it gets the whole file
+        range_header = None
     try:
-        asset_path.relative_to(presentation_dir.resolve())
+        span = byte_range(range_header, asset.size)
     except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+        headers = dict(validators, **{"Content-Range": f"bytes */{asset.size}"})
+        return Response(status_code=416, headers=headers)
 
-    if not asset_path.exists():
-        raise HTTPException(status_code=404, detail=f"Asset not found: {file_path}")
+    content = asset_store.peek(asset)
+    if content is None and asset.size <= asset_store.max_file_size:
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(None, asset_store.read, asset)
+    if content is None and range_header is None:
+        # Whole files can go out by zero-copy pathsend. Requests with a Range
+        # header are answered below: FileResponse ignores ranges before
+        # Starlette 0.39, and later versions treat ranges ignored here differently
+        return FileResponse(asset.path, media_type=asset.media_type, headers=validators)
 
-    return FileResponse(asset_path)
+    headers = dict(validators)
+    status_code = 200
+    start, end = 0, asset.size - 1
+    if span is not None:
+        start, end = span
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{asset.size}"
+
+    if content is None:
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            iter_file(asset.path, start, end),
+            status_code=status_code,
+            media_type=asset.media_type,
+            headers=headers,
+        )
+    return Response(
+        content[start : end + 1],
+        status_code=status_code,
+        media_type=asset.media_type,
+        headers=headers,
+    )
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root() -> HTMLResponse:
+@app.get("/vendor/{digest}/{file_path:path}")
+async def serve_vendor(digest: str, file_path: str) -> FileResponse:
+    """
+    Serve a bundled front-end library under its content-hashed URL.
+
+    The URL changes whenever the file does, so it may be cached forever.
+
+    Args:
+        digest: Content hash from the URL
+        file_path: Path of the file in the vendor directory
+
+    Returns:
+        The requested file
+    """
+    path = vendor_assets.find(digest, file_path)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Library file not found: {file_path}")
+    return FileResponse(path, headers={"Cache-Control": _IMMUTABLE})
+
+
+@app.get("/", response_model=None)
+async def root(request: Request) -> Response:
     """
     Serve the main presentation viewer HTML.
 
+    The page embeds the bootstrap data of the current presentation (see
+    _bootstrap_data()), so the viewer can show the first slide without
+    another request. It is rendered once per version of the presentation and
+    served from memory; clients revalidate it on every load.
+
+    Args:
+        request: Incoming request, for its conditional and encoding headers
+
     Returns:
-        HTML response with the viewer page
+        HTML response with the viewer page, or an empty 304 response
     """
-    html_file = get_static_dir() / "index.html"
-    if not html_file.exists():
+    page = static_bundle.get("index.html")
+    if page is None:
         raise HTTPException(status_code=500, detail="Viewer HTML not found")
 
-    content = html_file.read_text(encoding="utf-8")
-    return HTMLResponse(content=content)
+    target_file, deck = None, None
+    if _current_file is not None:
+        try:
+            target_file, deck = await _load_deck(None)
+        except HTTPException:
+            # The viewer fetches the slides itself and reports the error
+            pass
+
+    deck_tag = _validators(deck)["ETag"].strip('"') if deck is not None else "none"
+    flags = f"{_watch_enabled:d}{_follow_enabled:d}"
+    validators = {
+        "ETag": f'"{page.digest}-{deck_tag}-{flags}"',
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if _is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    key = (str(target_file.resolve()) if target_file else None, "page", validators["ETag"])
+    body = await _cached_body(
+        key, lambda: _bootstrap_data(deck), lambda data: _render_page(page.body.identity, data)
+    )
+    return await _encoded_response(request, body, page.media_type, validators)
 
 
-@app.get("/api/slides")
-async def get_slides(file: str | None = None) -> dict[str, Any]:
+def _bootstrap_data(deck: Deck | None) -> dict[str, Any]:
     """
-    Get parsed slides from the markdown file.
+    Build the data the viewer starts with, to be embedded in the page.
+
+    Args:
+        deck: Current presentation, or None if it is not available
+
+    Returns:
+        The watch and follow flags of /api/watch-enabled, the widths /assets
+        can scale images to (none without Pillow) and, with a deck, the first
+        slides in the format of /api/slides
+    """
+    data: dict[str, Any] = {
+        "watch_enabled": _watch_enabled,
+        "follow_enabled": _follow_enabled,
+        "image_widths": list(IMAGE_WIDTHS) if images_available() else [],
+    }
+    if deck is not None:
+        data.update(_slides_data(deck, 0, _BOOTSTRAP_SLIDES))
+    return data
+
+
+def _render_page(page: bytes, data: dict[str, Any]) -> bytes:
+    """
+    Embed bootstrap data in the viewer page.
+
+    Args:
+        page: Viewer HTML with a {{bootstrap}} placeholder
+        data: Bootstrap data
+
+    Returns:
+        Viewer HTML
+    """
+    # Escape "<" so slide content cannot end the <script> element early
+    return page.replace(b"{{bootstrap}}", dumps(data).replace(b"<", b"\\u003c"))
+
+
+def _target_file(file: str | None) -> Path:
+    """
+    Find the requested presentation file.
 
     Args:
         file: Optional file path (uses current file if not provided)
 
     Returns:
-        JSON with slides and metadata
+        Path of the presentation file
+
+    Raises:
+        HTTPException: If no file is set or it does not exist
     """
     target_file = Path(file) if file else _current_file
 
@@ -132,12 +641,290 @@ async def get_slides(file: str | None = None) -> dict[str, Any]:
     if not target_file.exists():
         raise HTTPException(status_code=404, detail=f"File not found: {target_file}")
 
+    return target_file
+
+
+async def _load_deck(file: str | None) -> tuple[Path, Deck]:
+    """
+    Load the requested presentation through the parse cache.
+
+    Args:
+        file: Optional file path (uses current file if not provided)
+
+    Returns:
+        Tuple of (presentation file, loaded deck)
+
+    Raises:
+        HTTPException: If no file is set, it does not exist or fails to parse
+    """
+    target_file = _target_file(file)
+    try:
+        return target_file, await load_deck(target_file)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error parsing file: {str(e)}")
+
+
+async def _json_response(
+    request: Request,
+    target_file: Path,
+    deck: Deck,
+    variant: tuple[Any, ...],
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Send JSON derived from a deck, with caching and conditional requests.
+
+    Conditional requests for an unchanged deck are answered with 304 Not
+    Modified. Otherwise the body is built, serialized and compressed (per
+    Accept-Encoding) once per deck version, in the worker pool, and served
+    from the body cache.
+
+    Args:
+        request: Incoming request, for its conditional and encoding headers
+        target_file: Presentation file
+        deck: Loaded presentation
+        variant: Identifies which data about the deck is sent
+        build: Returns the data to send, if it is not cached yet
+
+    Returns:
+        JSON response, or an empty 304 response
+    """
+    validators = _validators(deck)
+    if _is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+
+    key = (str(target_file.resolve()), validators["ETag"], *variant)
     try:
-        parser = SlideParser(target_file)
-        return parser.to_json()
+        body = await _cached_body(key, build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error parsing file: {str(e)}")
 
+    return await _encoded_response(request, body, "application/json", validators)
+
+
+def _slide_data(slide: Slide) -> dict[str, Any]:
+    """
+    Build the API data of one slide.
+
+    Args:
+        slide: Slide to convert
+
+    Returns:
+        JSON-serializable slide, with HTML if pre-rendering is enabled
+    """
+    data = slide.to_dict()
+    if _prerender_enabled:
+        data["html"] = slide_renderer.render(slide)
+    return data
+
+
+def _slide_hash(slide: Slide) -> str:
+    """
+    Hash everything the viewer shows of a slide.
+
+    Args:
+        slide: Slide to hash
+
+    Returns:
+        Short hex digest of the slide's content, notes and width mode
+    """
+    text = f"{slide.width_mode}\0{slide.notes}\0{slide.content}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _slides_data(deck: Deck, start: int, count: int | None) -> dict[str, Any]:
+    """
+    Build the /api/slides data for a range of slides.
+
+    Args:
+        deck: Loaded presentation
+        start: Index of the first slide
+        count: Number of slides (all remaining slides if None)
+
+    Returns:
+        JSON-serializable slides with the deck's metadata
+    """
+    end = len(deck.slides) if count is None else start + count
+    return {
+        "slides": [_slide_data(slide) for slide in deck.slides[start:end]],
+        "total": len(deck.slides),
+        "title": deck.title,
+        "version": deck.version,
+        "start": start,
+        "features": deck.features(),
+    }
+
+
+@app.get("/api/slides", response_model=None)
+async def get_slides(
+    request: Request,
+    file: str | None = None,
+    start: int = Query(0, ge=0),
+    count: int | None = Query(None, ge=0),
+) -> Response:
+    """
+    Get parsed slides from the markdown file, or a range of them.
+
+    Responses carry an ETag and Last-Modified, and conditional requests for
+    an unchanged deck are answered with 304 Not Modified. Each version is
+    serialized (and compressed, per Accept-Encoding) only once.
+
+    Args:
+        request: Incoming request, for its conditional headers
+        file: Optional file path (uses current file if not provided)
+        start: Index of the first slide to return
+        count: Number of slides to return (all remaining slides if omitted)
+
+    Returns:
+        JSON with slides and metadata, or an empty 304 response
+    """
+    target_file, deck = await _load_deck(file)
+    return await _json_response(
+        request,
+        target_file,
+        deck,
+        ("slides", start, count),
+        lambda: _slides_data(deck, start, count),
+    )
+
+
+def _ndjson_lines(slides: Iterable[Slide], fallback_title: str) -> Iterator[bytes]:
+    """
+    Serialize slides to NDJSON as they are produced.
+
+    The stream is a "deck" line with the title, one "slide" line per slide
+    and an "end" line with the total, or an "error" line if parsing fails.
+    Lines are sent in batches, except that the first slide goes out alone.
+
+    Args:
+        slides: Slides, possibly still being parsed
+        fallback_title: Title to use when the first slide has no H1
+
+    Yields:
+        Chunks of NDJSON
+    """
+    batch: list[bytes] = []
+    size = 0
+    total = 0
+    try:
+        for slide in slides:
+            if total == 0:
+                batch.append(
+                    dumps({"type": "deck", "title": extract_title([slide], fallback_title)})
+                )
+            batch.append(dumps({"type": "slide", "slide": _slide_data(slide)}))
+            size += len(batch[-1])
+            total += 1
+            if total == 1 or size >= _NDJSON_BATCH_SIZE:
+                yield b"\n".join(batch) + b"\n"
+                batch, size = [], 0
+        if total == 0:
+            batch.append(dumps({"type": "deck", "title": fallback_title}))
+        batch.append(dumps({"type": "end", "total": total}))
+    except Exception as e:
+        batch.append(dumps({"type": "error", "detail": f"Error parsing file: {str(e)}"}))
+    yield b"\n".join(batch) + b"\n"
+
+
+@app.get("/api/slides.ndjson")
+async def stream_slides(file: str | None = None) -> StreamingResponse:
+    """
+    Stream the slides as newline-delimited JSON, one slide per line.
+
+    A deck in the parse cache is streamed from there; otherwise the file is
+    parsed while it is being sent, so the first slide does not wait for the
+    rest of the deck.
+
+    Args:
+        file: Optional file path (uses current file if not provided)
+
+    Returns:
+        Streaming NDJSON response
+    """
+    target_file = _target_file(file)
+    loop = asyncio.get_running_loop()
+    deck = await loop.run_in_executor(_parse_executor, parse_cache.peek, target_file)
+    slides = deck.slides if deck is not None else SlideParser(target_file).iter_slides()
+    return StreamingResponse(
+        _ndjson_lines(slides, target_file.stem),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@app.get("/api/slides/{slide_id}", response_model=None)
+async def get_slide(request: Request, slide_id: int, file: str | None = None) -> Response:
+    """
+    Get a single parsed slide.
+
+    Args:
+        request: Incoming request, for its conditional headers
+        slide_id: Zero-based index of the slide
+        file: Optional file path (uses current file if not provided)
+
+    Returns:
+        JSON with the slide, or an empty 304 response
+    """
+    target_file, deck = await _load_deck(file)
+    if slide_id < 0 or slide_id >= len(deck.slides):
+        raise HTTPException(status_code=404, detail=f"Slide not found: {slide_id}")
+
+    slide = deck.slides[slide_id]
+    return await _json_response(
+        request, target_file, deck, ("slide", slide_id), lambda: _slide_data(slide)
+    )
+
+
+@app.get("/api/manifest", response_model=None)
+async def get_manifest(request: Request, file: str | None = None) -> Response:
+    """
+    Get a lightweight manifest of the slides: ids, titles and content hashes.
+
+    Args:
+        request: Incoming request, for its conditional headers
+        file: Optional file path (uses current file if not provided)
+
+    Returns:
+        JSON with the title, version and one entry per slide, or an empty
+        304 response
+    """
+    target_file, deck = await _load_deck(file)
+
+    def build() -> dict[str, Any]:
+        entries = []
+        for slide in deck.slides:
+            headings = slide.metadata.headings
+            entries.append(
+                {
+                    "id": slide.index,
+                    "title": headings[0][1] if headings else None,
+                    "hash": _slide_hash(slide),
+                }
+            )
+        return {
+            "title": deck.title,
+            "total": len(deck.slides),
+            "version": deck.version,
+            "slides": entries,
+        }
+
+    return await _json_response(request, target_file, deck, ("manifest",), build)
+
+
+@app.get("/api/outline")
+async def get_outline(file: str | None = None) -> dict[str, Any]:
+    """
+    Get the metadata index of the markdown file.
+
+    Args:
+        file: Optional file path (uses current file if not provided)
+
+    Returns:
+        JSON with the title, heading outline and per-slide metadata
+    """
+    _, deck = await _load_deck(file)
+    return deck.to_outline()
+
 
 @app.get("/health")
 async def health() -> dict[str, str]:
@@ -151,34 +938,102 @@ async def health() -> dict[str, str]:
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket) -> None:
+async def websocket_endpoint(
+    websocket: WebSocket, follow: bool = False, presenter: str | None = None
+) -> None:
     """
-    WebSocket endpoint for hot reloading.
+    Event channel between the server and a viewer.
+
+    Every viewer keeps one connection open. Messages are JSON objects with a
+    "type" field, or JSON arrays of them when several are sent at once.
+
+    From the viewer:
+        navigate: ``{"type": "navigate", "slide": n}``; logs the slide's
+            speaker notes, and in follow mode moves the followers if sent by
+            the presenter
+
+    To the viewer:
+        reload: the presentation changed; fetch it again
+        patch: the presentation changed; replace the slides listed
+            (see notify_clients_changed())
+        goto: ``{"type": "goto", "slide": n}``; in follow mode, the
+            presenter's position
 
     Args:
         websocket: WebSocket connection
+        follow: Whether the viewer follows the presenter
+        presenter: Presenter key, if this is the presenter's viewer
     """
     await websocket.accept()
-    _websocket_clients.append(websocket)
+    client = ClientConnection(websocket)
+    client.start()
+    _websocket_clients.add(client)
+    is_presenter = (
+        _presenter_key is not None
+        and presenter is not None
+        and secrets.compare_digest(presenter, _presenter_key)
+    )
+    is_follower = follow and _follow_enabled
+    if is_follower:
+        _follow.add(client)
 
     try:
-        # Keep connection alive
         while True:
-            await websocket.receive_text()
+            text = await websocket.receive_text()
+            await _handle_viewer_events(text, is_presenter, is_follower)
     except WebSocketDisconnect:
-        if websocket in _websocket_clients:
-            _websocket_clients.remove(websocket)
+        pass
+    finally:
+        _websocket_clients.discard(client)
+        _follow.discard(client)
+        await client.close()
+
+
+async def _handle_viewer_events(text: str, is_presenter: bool, is_follower: bool) -> None:
+    """
+    Handle a message or batch of messages from a viewer.
+
+    Only the last navigation of a batch is acted on. Malformed messages are
+    ignored.
+
+    Args:
+        text: Message received from the viewer
+        is_presenter: Whether the viewer connected with the presenter key
+        is_follower: Whether the viewer follows the presenter
+    """
+    try:
+        events = json.loads(text)
+    except ValueError:
+        return
+    if isinstance(events, dict):
+        events = [events]
+    if not isinstance(events, list):
+        return
+
+    slide = None
+    for event in events:
+        if isinstance(event, dict) and event.get("type") == "navigate":
+            value = event.get("slide")
+            if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                slide = value
+    if slide is None:
+        return
+
+    if is_presenter:
+        _follow.move(slide)
+    if not is_follower:
+        await _log_notes(slide)
 
 
 @app.get("/api/watch-enabled")
 async def watch_enabled() -> dict[str, bool]:
     """
-    Check if watch mode is enabled.
+    Check if watch mode and follow mode are enabled.
 
     Returns:
-        Dictionary with watch_enabled status
+        Dictionary with watch_enabled and follow_enabled status
     """
-    return {"watch_enabled": _watch_enabled}
+    return {"watch_enabled": _watch_enabled, "follow_enabled": _follow_enabled}
 
 
 class SlideNotification(BaseModel):
@@ -187,6 +1042,53 @@ class SlideNotification(BaseModel):
     slide_index: int
 
 
+def _format_notes(slides: tuple[Slide, ...], index: int) -> str:
+    """
+    Format the speaker notes of a slide for the terminal.
+
+    Args:
+        slides: Slides of the presentation
+        index: Zero-based index of the slide
+
+    Returns:
+        Styled text to write to the terminal
+    """
+    rule = click.style("━" * 60, fg="blue")
+    lines = [
+        rule,
+        click.style(f"Slide {index + 1} / {len(slides)}", fg="blue", bold=True),
+        rule,
+    ]
+    if slides[index].notes:
+        lines.append(click.style("SPEAKER NOTES:", fg="cyan", bold=True))
+        lines.append(slides[index].notes)
+    else:
+        lines.append(
+            click.style("(No speaker notes for this slide)", fg="bright_black", italic=True)
+        )
+    lines.append(rule)
+    return "\n".join(lines)
+
+
+async def _log_notes(index: int) -> None:
+    """
+    Log the speaker notes of a slide of the current presentation.
+
+    Errors are ignored, so a viewer's navigation never fails.
+
+    Args:
+        index: Zero-based index of the slide
+    """
+    if _current_file is None:
+        return
+    try:
+        slides = (await load_deck(_current_file)).slides
+    except Exception:
+        return
+    if index < len(slides):
+        terminal_writer.echo(_format_notes(slides, index))
+
+
 @app.post("/api/log-notes")
 async def log_speaker_notes(notification: SlideNotification) -> dict[str, str]:
     """
@@ -202,34 +1104,18 @@ async def log_speaker_notes(notification: SlideNotification) -> dict[str, str]:
         raise HTTPException(status_code=400, detail="No presentation file loaded")
 
     try:
-        parser = SlideParser(_current_file)
-        slides = parser.parse()
+        # The deck of the current version is cached, and each slide extracts
+        # its notes once, so this is an index into the cached slides
+        slides = (await load_deck(_current_file)).slides
 
         if notification.slide_index < 0 or notification.slide_index >= len(slides):
             raise HTTPException(status_code=400, detail="Invalid slide index")
 
-        slide = slides[notification.slide_index]
-
-        # Log to terminal with formatting
-        click.echo(click.style("━" * 60, fg="blue"))
-        click.echo(
-            click.style(
-                f"Slide {notification.slide_index + 1} / {len(slides)}", fg="blue", bold=True
-            )
-        )
-        click.echo(click.style("━" * 60, fg="blue"))
-
-        if slide.notes:
-            click.echo(click.style("SPEAKER NOTES:", fg="cyan", bold=True))
-            click.echo(slide.notes)
-        else:
-            click.echo(
-                click.style("(No speaker notes for this slide)", fg="bright_black", italic=True)
-            )
-
-        click.echo(click.style("━" * 60, fg="blue"))
-
+        # The writer thread does the actual output
+        terminal_writer.echo(_format_notes(slides, notification.slide_index))
         return {"status": "ok"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error logging notes: {str(e)}")
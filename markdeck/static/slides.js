@@ -6,6 +6,33 @@ class SlideShow {
         this.totalSlides = 0;
         this.title = '';
         this.isFullscreen = false;
+        // Validators of the last /api/slides response, for conditional requests
+        this.slidesETag = null;
+        this.slidesLastModified = null;
+        // Version of the deck in this.slides, to apply hot reload patches to
+        this.deckVersion = null;
+        // Pending background load of the full deck, if any
+        this.slidesLoading = null;
+        // Follow mode: the presenter's view has ?presenter=<key>, the audience's ?follow
+        const params = new URLSearchParams(window.location.search);
+        this.presenterKey = params.get('presenter');
+        this.following = params.has('follow');
+        this.socket = null;
+        // Events to send on the WebSocket, and whether a send is scheduled
+        this.outbox = [];
+        this.outboxScheduled = false;
+        // URLs of the front-end libraries and of our own files, filled in by the server
+        const libraries = document.getElementById('markdeck-libraries');
+        this.libraries = libraries ? JSON.parse(libraries.textContent) : {};
+        const staticUrls = document.getElementById('markdeck-static');
+        this.staticUrls = staticUrls ? JSON.parse(staticUrls.textContent) : {};
+        // Loads of the libraries for optional features (math, mermaid)
+        this.featureLoads = {};
+        // First slides and settings embedded in the page by the server, if any
+        const bootstrap = document.getElementById('markdeck-bootstrap');
+        this.bootstrap = bootstrap ? JSON.parse(bootstrap.textContent) : null;
+        // Widths /assets can scale images down to (none without Pillow)
+        this.imageWidths = (this.bootstrap && this.bootstrap.image_widths) || [];
 
         this.elements = {
             loading: document.getElementById('loading'),
@@ -61,14 +88,14 @@ class SlideShow {
                 }
             });
 
-            // Load slides from API
-            await this.loadSlides();
+            // Load the first slide only, so it can be shown right away
+            await this.loadFirstSlide();
 
             // Set up event listeners
             this.setupEventListeners();
 
-            // Set up WebSocket for hot reloading
-            await this.setupHotReload();
+            // Connect the event channel (hot reload, notes, follow mode)
+            this.connectEvents();
 
             // Show first slide
             this.showSlide(0);
@@ -76,21 +103,87 @@ class SlideShow {
             // Hide loading, show presentation
             this.elements.loading.classList.add('hidden');
             this.elements.presentation.classList.remove('hidden');
+
+            // Fetch the rest of the deck in the background
+            this.slidesLoading = this.loadSlides().catch((error) => {
+                console.error('Failed to load slides:', error);
+            });
         } catch (error) {
             this.showError(error.message);
         }
     }
 
+    async loadFirstSlide() {
+        // Use the slides embedded in the page, and only fetch without them
+        let data = this.bootstrap && this.bootstrap.slides ? this.bootstrap : null;
+        this.bootstrap = null;
+        if (!data) {
+            const response = await fetch('/api/slides?start=0&count=1');
+            if (!response.ok) {
+                throw new Error(`Failed to load slides: ${response.statusText}`);
+            }
+            data = await response.json();
+        }
+
+        // Placeholders stand in for the slides that are not loaded yet
+        this.slides = Array.from({ length: data.total }, (_, id) => ({ id, content: null }));
+        data.slides.forEach((slide) => {
+            this.slides[slide.id] = slide;
+        });
+        this.totalSlides = data.total;
+        this.title = data.title;
+        this.deckVersion = data.version;
+        this.loadFeatures(data.features);
+
+        if (this.totalSlides === 0) {
+            throw new Error('No slides found in presentation');
+        }
+
+        document.title = `${this.title} - MarkDeck`;
+        this.elements.totalSlidesEl.textContent = this.totalSlides;
+    }
+
+    async fetchSlide(index) {
+        const response = await fetch(`/api/slides/${index}`);
+        if (!response.ok) {
+            throw new Error(`Failed to load slide ${index + 1}: ${response.statusText}`);
+        }
+
+        const slide = await response.json();
+        if (this.slides[index] && this.slides[index].content === null) {
+            this.slides[index] = slide;
+        }
+        if (this.currentSlideIndex === index) {
+            this.showSlide(index);
+        }
+    }
+
     async loadSlides() {
-        const response = await fetch('/api/slides');
+        // Revalidate the slides we have, so an unchanged deck is not sent again
+        const headers = {};
+        if (this.slidesETag) {
+            headers['If-None-Match'] = this.slidesETag;
+        }
+        if (this.slidesLastModified) {
+            headers['If-Modified-Since'] = this.slidesLastModified;
+        }
+
+        const response = await fetch('/api/slides', { headers });
+        if (response.status === 304) {
+            return false;
+        }
         if (!response.ok) {
             throw new Error(`Failed to load slides: ${response.statusText}`);
         }
 
+        this.slidesETag = response.headers.get('ETag');
+        this.slidesLastModified = response.headers.get('Last-Modified');
         const data = await response.json();
         this.slides = data.slides;
         this.totalSlides = data.total;
         this.title = data.title;
+        this.deckVersion = data.version;
+        this.loadFeatures(data.features);
 
         if (this.totalSlides === 0) {
             throw new Error('No slides found in presentation');
@@ -98,6 +191,7 @@ class SlideShow {
 
         document.title = `${this.title} - MarkDeck`;
         this.elements.totalSlidesEl.textContent = this.totalSlides;
+        return true;
     }
 
     setupEventListeners() {
@@ -118,56 +212,100 @@ class SlideShow {
         });
     }
 
-    async setupHotReload() {
-        // Check if watch mode is enabled
-        try {
-            const response = await fetch('/api/watch-enabled');
-            const data = await response.json();
+    connectEvents() {
+        // One WebSocket per viewer carries navigation, reloads and follow mode
+        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        const query = new URLSearchParams();
+        if (this.presenterKey !== null) {
+            query.set('presenter', this.presenterKey);
+        } else if (this.following) {
+            query.set('follow', 'true');
+        }
+        const wsUrl = `${protocol}//${window.location.host}/ws?${query}`;
 
-            if (!data.watch_enabled) {
-                return;
-            }
+        const connectWebSocket = () => {
+            const ws = new WebSocket(wsUrl);
 
-            // Connect to WebSocket for hot reload
-            const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-            const wsUrl = `${protocol}//${window.location.host}/ws`;
+            ws.onopen = () => {
+                console.log('Event channel connected');
+                this.socket = ws;
+                if (this.presenterKey !== null) {
+                    // Bring followers to where the presenter is
+                    this.sendEvent({ type: 'navigate', slide: this.currentSlideIndex });
+                }
+                this.flushEvents();
+            };
+
+            ws.onmessage = async (event) => {
+                // Messages sent together arrive as one array
+                const data = JSON.parse(event.data);
+                for (const message of Array.isArray(data) ? data : [data]) {
+                    await this.handleMessage(message);
+                }
+            };
 
-            const connectWebSocket = () => {
-                const ws = new WebSocket(wsUrl);
+            ws.onerror = (error) => {
+                console.error('WebSocket error:', error);
+            };
 
-                ws.onopen = () => {
-                    console.log('Hot reload connected');
-                };
+            ws.onclose = () => {
+                this.socket = null;
+                console.log('WebSocket closed, reconnecting in 2s...');
+                setTimeout(connectWebSocket, 2000);
+            };
+        };
 
-                ws.onmessage = async (event) => {
-                    const message = JSON.parse(event.data);
-                    if (message.type === 'reload') {
-                        console.log('File changed, reloading slides...');
-                        await this.reloadPresentation();
-                    }
-                };
+        connectWebSocket();
+    }
 
-                ws.onerror = (error) => {
-                    console.error('WebSocket error:', error);
-                };
+    async handleMessage(message) {
+        if (message.type === 'goto') {
+            if (this.following && message.slide !== this.currentSlideIndex) {
+                this.showSlide(Math.min(message.slide, this.totalSlides - 1));
+            }
+        } else if (message.type === 'patch') {
+            console.log('File changed, updating slides...');
+            await this.applyPatch(message);
+        } else if (message.type === 'reload') {
+            console.log('File changed, reloading slides...');
+            await this.reloadPresentation();
+        }
+    }
 
-                ws.onclose = () => {
-                    console.log('WebSocket closed, reconnecting in 2s...');
-                    setTimeout(connectWebSocket, 2000);
-                };
-            };
+    sendEvent(event) {
+        // A newer navigation replaces one that has not been sent yet
+        if (event.type === 'navigate') {
+            this.outbox = this.outbox.filter((pending) => pending.type !== 'navigate');
+        }
+        this.outbox.push(event);
+        if (!this.outboxScheduled) {
+            // Send everything queued by the current task as one batch
+            this.outboxScheduled = true;
+            queueMicrotask(() => {
+                this.outboxScheduled = false;
+                this.flushEvents();
+            });
+        }
+    }
 
-            connectWebSocket();
-        } catch (error) {
-            console.error('Failed to set up hot reload:', error);
+    flushEvents() {
+        // Events wait in the outbox while the socket is (re)connecting
+        if (!this.socket || this.socket.readyState !== WebSocket.OPEN || this.outbox.length === 0) {
+            return;
         }
+        const events = this.outbox;
+        this.outbox = [];
+        this.socket.send(JSON.stringify(events.length === 1 ? events[0] : events));
     }
 
     async reloadPresentation() {
         const currentSlide = this.currentSlideIndex;
 
         try {
-            await this.loadSlides();
+            if (!(await this.loadSlides())) {
+                // The server confirmed that our slides are current
+                return;
+            }
             // Try to stay on the same slide, or go to last slide if current doesn't exist
             const targetSlide = Math.min(currentSlide, this.totalSlides - 1);
             this.showSlide(targetSlide);
@@ -179,6 +317,49 @@ class SlideShow {
         }
     }
 
+    async applyPatch(patch) {
+        // Let a background load finish first, so it cannot overwrite the patch
+        if (this.slidesLoading) {
+            await this.slidesLoading;
+        }
+
+        if (patch.base !== this.deckVersion) {
+            // We missed a version, so fetch the whole deck
+            await this.reloadPresentation();
+            return;
+        }
+
+        // The changed slides are one contiguous run: the old modified and
+        // removed slides are replaced by the new modified and added slides
+        const currentSlide = this.currentSlideIndex;
+        this.slides.splice(
+            patch.start,
+            patch.modified.length + patch.removed.length,
+            ...patch.slides
+        );
+        if (patch.added.length !== patch.removed.length) {
+            for (let id = patch.start + patch.slides.length; id < this.slides.length; id++) {
+                this.slides[id].id = id;
+            }
+        }
+
+        this.totalSlides = patch.total;
+        this.title = patch.title;
+        this.deckVersion = patch.version;
+        this.loadFeatures(patch.features);
+        // Our validators are for the previous version
+        this.slidesETag = null;
+        this.slidesLastModified = null;
+
+        document.title = `${this.title} - MarkDeck`;
+        this.elements.totalSlidesEl.textContent = this.totalSlides;
+
+        if (this.totalSlides > 0) {
+            this.showSlide(Math.min(currentSlide, this.totalSlides - 1));
+        }
+        this.showReloadNotification();
+    }
+
     showReloadNotification() {
         // Create a temporary notification
         const notification = document.createElement('div');
@@ -327,6 +508,24 @@ class SlideShow {
         return beforeHtml + columnsHtml + afterHtml;
     }
 
+    renderSlideHtml(slide) {
+        // Slides that are still loading are left blank
+        if (slide.content === null) {
+            return '';
+        }
+
+        // Use the HTML rendered by the server when it is available (--prerender)
+        if (typeof slide.html === 'string') {
+            return slide.html;
+        }
+
+        // Process column markers if present (BEFORE parsing)
+        const html = this.processColumnMarkers(slide.content);
+
+        // If no columns, parse markdown normally
+        return html === null ? marked.parse(slide.content) : html;
+    }
+
     applyWidthMode(widthMode) {
         const container = this.elements.slideContainer;
         const content = this.elements.slideContent;
@@ -363,63 +562,37 @@ class SlideShow {
 
         this.currentSlideIndex = index;
         const slide = this.slides[index];
+        if (slide.content === null) {
+            // Not loaded yet: fetch it ahead of the rest of the deck
+            this.fetchSlide(index).catch((error) => {
+                console.error('Failed to load slide:', error);
+            });
+        }
 
         // Apply width mode to slide container and content
         this.applyWidthMode(slide.width_mode);
 
-        // Process column markers if present (BEFORE parsing)
-        let html = this.processColumnMarkers(slide.content);
+        this.elements.slideContent.innerHTML = this.renderSlideHtml(slide);
 
-        // If no columns, parse markdown normally
-        if (html === null) {
-            html = marked.parse(slide.content);
-        }
-
-        this.elements.slideContent.innerHTML = html;
+        // Rewrite relative image paths to use /assets/ endpoint; a slide is
+        // never wider than the window
+        this.rewriteImages(this.elements.slideContent, window.innerWidth);
 
-        // Rewrite relative image paths to use /assets/ endpoint
-        this.elements.slideContent.querySelectorAll('img').forEach((img) => {
-            const src = img.getAttribute('src');
-            if (src && !src.startsWith('http://') && !src.startsWith('https://') && !src.startsWith('//') && !src.startsWith('/')) {
-                // Remove leading ./ if present
-                const cleanPath = src.startsWith('./') ? src.slice(2) : src;
-                img.setAttribute('src', '/assets/' + cleanPath);
-            }
-        });
-
-        // Apply syntax highlighting to code blocks
-        this.elements.slideContent.querySelectorAll('pre code').forEach((block) => {
+        // Apply syntax highlighting to code blocks not already highlighted by the server
+        this.elements.slideContent.querySelectorAll('pre code:not(.hljs)').forEach((block) => {
             hljs.highlightElement(block);
         });
 
-        // Render math equations with KaTeX
-        if (window.renderMathInElement) {
-            renderMathInElement(this.elements.slideContent, {
-                delimiters: [
-                    { left: '$$', right: '$$', display: true },
-                    { left: '$', right: '$', display: false },
-                    { left: '\\[', right: '\\]', display: true },
-                    { left: '\\(', right: '\\)', display: false }
-                ],
-                throwOnError: false
-            });
-        }
+        // Render math equations and mermaid diagrams
+        this.renderMath(this.elements.slideContent);
+        this.renderDiagrams(this.elements.slideContent);
 
-        // Render mermaid diagrams if present
-        const mermaidElements = this.elements.slideContent.querySelectorAll('.mermaid');
-        if (mermaidElements.length > 0 && window.mermaid) {
-            // Run mermaid on all diagrams in the current slide
-            mermaidElements.forEach((element) => {
-                element.removeAttribute('data-processed');
-            });
-            window.mermaid.run({
-                nodes: mermaidElements
-            });
+        // Notify server to log speaker notes to terminal (and, from the
+        // presenter, to move the followers)
+        if (!this.following) {
+            this.notifySlideChange(index);
         }
 
-        // Notify server to log speaker notes to terminal
-        this.notifySlideChange(index);
-
         // Update progress indicator
         this.elements.currentSlide.textContent = index + 1;
         const progressPercent = ((index + 1) / this.totalSlides) * 100;
@@ -429,19 +602,8 @@ class SlideShow {
         this.elements.slideContainer.scrollTop = 0;
     }
 
-    async notifySlideChange(index) {
-        try {
-            await fetch('/api/log-notes', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ slide_index: index }),
-            });
-        } catch (error) {
-            // Silently fail - don't interrupt presentation
-            console.error('Failed to notify server of slide change:', error);
-        }
+    notifySlideChange(index) {
+        this.sendEvent({ type: 'navigate', slide: index });
     }
 
     nextSlide() {
@@ -513,14 +675,14 @@ class SlideShow {
         // Update theme CSS
         const themeCss = document.getElementById('theme-css');
         if (themeCss) {
-            themeCss.href = `/static/${newTheme}.css`;
+            themeCss.href = this.staticUrls[`${newTheme}.css`] || `/static/${newTheme}.css`;
         }
 
         // Update highlight.js theme
         const highlightCss = document.getElementById('highlight-css');
         if (highlightCss) {
-            const hlTheme = newTheme === 'dark' ? 'github-dark' : 'github';
-            highlightCss.href = `https://cdn.jsdelivr.net/gh/highlightjs/cdn-release@11.9.0/build/styles/${hlTheme}.min.css`;
+            const hlTheme = newTheme === 'dark' ? 'highlight-dark' : 'highlight-light';
+            highlightCss.href = this.libraries[hlTheme];
         }
 
         // Update mermaid theme by reinitializing
@@ -583,39 +745,19 @@ class SlideShow {
             const slideContent = document.createElement('div');
             slideContent.className = 'grid-slide-content';
 
-            // Process column markers if present (same as showSlide)
-            let html = this.processColumnMarkers(slide.content);
-            if (html === null) {
-                html = marked.parse(slide.content);
-            }
-            slideContent.innerHTML = html;
-
-            // Rewrite relative image paths to use /assets/ endpoint
-            slideContent.querySelectorAll('img').forEach((img) => {
-                const src = img.getAttribute('src');
-                if (src && !src.startsWith('http://') && !src.startsWith('https://') && !src.startsWith('//') && !src.startsWith('/')) {
-                    const cleanPath = src.startsWith('./') ? src.slice(2) : src;
-                    img.setAttribute('src', '/assets/' + cleanPath);
-                }
-            });
+            slideContent.innerHTML = this.renderSlideHtml(slide);
+
+            // Rewrite relative image paths to use /assets/ endpoint; grid
+            // tiles are at most about 600px wide
+            this.rewriteImages(slideContent, Math.min(window.innerWidth, 640));
 
-            // Apply syntax highlighting to code blocks
-            slideContent.querySelectorAll('pre code').forEach((block) => {
+            // Apply syntax highlighting to code blocks not already highlighted by the server
+            slideContent.querySelectorAll('pre code:not(.hljs)').forEach((block) => {
                 hljs.highlightElement(block);
             });
 
             // Render math equations with KaTeX
-            if (window.renderMathInElement) {
-                renderMathInElement(slideContent, {
-                    delimiters: [
-                        { left: '$$', right: '$$', display: true },
-                        { left: '$', right: '$', display: false },
-                        { left: '\\[', right: '\\]', display: true },
-                        { left: '\\(', right: '\\)', display: false }
-                    ],
-                    throwOnError: false
-                });
-            }
+            this.renderMath(slideContent);
 
             gridSlide.appendChild(slideContent);
 
@@ -629,7 +771,51 @@ class SlideShow {
         });
 
         // Render mermaid diagrams after all slides are added to the DOM
-        const mermaidElements = this.elements.gridContainer.querySelectorAll('.mermaid');
+        this.renderDiagrams(this.elements.gridContainer);
+    }
+
+    rewriteImages(container, maxWidth) {
+        // Images are drawn at most maxWidth wide, and at their natural size
+        // when narrower. A WebP version at least that wide in device pixels
+        // thus looks the same as the original: the server only scales down,
+        // and sends an image narrower than the requested width as it is.
+        const needed = maxWidth * (window.devicePixelRatio || 1);
+        const widths = this.imageWidths;
+        const width = widths.find((candidate) => candidate >= needed) || widths[widths.length - 1];
+
+        container.querySelectorAll('img').forEach((img) => {
+            const src = img.getAttribute('src');
+            if (!src || src.startsWith('http://') || src.startsWith('https://') || src.startsWith('//') || src.startsWith('/')) {
+                return;
+            }
+            // Remove leading ./ if present
+            const url = '/assets/' + (src.startsWith('./') ? src.slice(2) : src);
+            img.setAttribute('src', url);
+
+            if (width && /\.(png|jpe?g|webp)$/i.test(url)) {
+                img.setAttribute('src', `${url}?width=${width}&format=webp`);
+            }
+        });
+    }
+
+    renderMath(container) {
+        // Render math equations with KaTeX, once it is loaded
+        if (window.renderMathInElement) {
+            renderMathInElement(container, {
+                delimiters: [
+                    { left: '$$', right: '$$', display: true },
+                    { left: '$', right: '$', display: false },
+                    { left: '\\[', right: '\\]', display: true },
+                    { left: '\\(', right: '\\)', display: false }
+                ],
+                throwOnError: false
+            });
+        }
+    }
+
+    renderDiagrams(container) {
+        // Render mermaid diagrams, once mermaid is loaded
+        const mermaidElements = container.querySelectorAll('.mermaid');
         if (mermaidElements.length > 0 && window.mermaid) {
             mermaidElements.forEach((element) => {
                 element.removeAttribute('data-processed');
@@ -640,6 +826,66 @@ class SlideShow {
         }
     }
 
+    loadFeatures(features) {
+        // KaTeX and mermaid are large, so they are only loaded for decks that use them
+        if (!features) {
+            return;
+        }
+        if (features.math && !this.featureLoads.math) {
+            this.featureLoads.math = this.loadMath().then(() => {
+                this.renderMath(this.elements.slideContent);
+            }).catch((error) => {
+                console.error('Failed to load KaTeX:', error);
+            });
+        }
+        if (features.mermaid && !this.featureLoads.mermaid) {
+            this.featureLoads.mermaid = this.loadMermaid().then(() => {
+                this.renderDiagrams(this.elements.slideContent);
+            }).catch((error) => {
+                console.error('Failed to load mermaid:', error);
+            });
+        }
+    }
+
+    async loadMath() {
+        if (window.renderMathInElement) {
+            return;
+        }
+        this.loadStylesheet(this.libraries['katex-css']);
+        // The auto-render extension needs KaTeX itself
+        await this.loadScript(this.libraries.katex);
+        await this.loadScript(this.libraries['katex-auto-render']);
+    }
+
+    async loadMermaid() {
+        if (window.mermaid) {
+            return;
+        }
+        await this.loadScript(this.libraries.mermaid);
+        const theme = localStorage.getItem('markdeck-theme') || 'dark';
+        window.mermaid.initialize({
+            startOnLoad: false,
+            theme: theme === 'dark' ? 'dark' : 'default'
+        });
+    }
+
+    loadScript(url) {
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = url;
+            script.onload = () => resolve();
+            script.onerror = () => reject(new Error(`Failed to load ${url}`));
+            document.head.appendChild(script);
+        });
+    }
+
+    loadStylesheet(url) {
+        const link = document.createElement('link');
+        link.rel = 'stylesheet';
+        link.href = url;
+        document.head.appendChild(link);
+    }
+
     showError(message) {
         this.elements.loading.classList.add('hidden');
         this.elements.error.classList.remove('hidden');
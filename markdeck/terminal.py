@@ -0,0 +1,75 @@
+"""Background terminal output for MarkDeck."""
+
+import queue
+import threading
+from collections.abc import Callable
+
+import click
+
+
+class TerminalWriter:
+    """
+    Write to the terminal from a background thread.
+
+    Request handlers hand their output to a queue and return immediately, so
+    a slow terminal never blocks the server's event loop. Messages are
+    written in the order they were queued.
+    """
+
+    def __init__(self):
+        """Initialize the writer. The thread starts with the first message."""
+        self._queue: queue.SimpleQueue[str | Callable[[], None]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def echo(self, message: str) -> None:
+        """
+        Queue a message to be written to the terminal.
+
+        Args:
+            message: Text to write (may contain click styles)
+        """
+        self._start()
+        self._queue.put(message)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all queued messages have been written.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever
+
+        Returns:
+            True if the queue was drained in time
+        """
+        done = threading.Event()
+        self._start()
+        self._queue.put(done.set)
+        return done.wait(timeout)
+
+    def _start(self) -> None:
+        """Start the writer thread if it is not running yet."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="markdeck-terminal", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued messages until the process exits."""
+        while True:
+            item = self._queue.get()
+            if callable(item):
+                item()
+                continue
+            try:
+                click.echo(item)
+            except Exception:
+                # A closed or broken terminal must not stop the writer
+                pass
+
+
+terminal_writer = TerminalWriter()
@@ -0,0 +1,181 @@
+"""Bundled front-end libraries for the MarkDeck viewer."""
+
+import hashlib
+import re
+import threading
+import urllib.request
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Library(NamedTuple):
+    """One file of a pinned front-end library."""
+
+    path: str
+    url: str
+
+
+_JSDELIVR = "https://cdn.jsdelivr.net"
+_HIGHLIGHT = f"{_JSDELIVR}/gh/highlightjs/cdn-release@11.9.0/build"
+_KATEX = f"{_JSDELIVR}/npm/katex@0.16.9/dist"
+
+# Library files by name. Paths are relative to the vendor directory, URLs
+# point at the same file on the CDN, which is used when it is not bundled.
+LIBRARIES: dict[str, Library] = {
+    "marked": Library("marked/marked.min.js", f"{_JSDELIVR}/npm/marked@11.0.0/marked.min.js"),
+    "highlight": Library("highlight/highlight.min.js", f"{_HIGHLIGHT}/highlight.min.js"),
+    "highlight-dark": Library(
+        "highlight/styles/github-dark.min.css", f"{_HIGHLIGHT}/styles/github-dark.min.css"
+    ),
+    "highlight-light": Library(
+        "highlight/styles/github.min.css", f"{_HIGHLIGHT}/styles/github.min.css"
+    ),
+    "katex": Library("katex/katex.min.js", f"{_KATEX}/katex.min.js"),
+    "katex-css": Library("katex/katex.min.css", f"{_KATEX}/katex.min.css"),
+    "katex-auto-render": Library(
+        "katex/contrib/auto-render.min.js", f"{_KATEX}/contrib/auto-render.min.js"
+    ),
+    # The UMD build, so it can be loaded with a plain script tag on demand
+    "mermaid": Library(
+        "mermaid/mermaid.min.js", f"{_JSDELIVR}/npm/mermaid@11.4.1/dist/mermaid.min.js"
+    ),
+}
+
+# Relative references in stylesheets, such as the KaTeX fonts
+_CSS_URL_PATTERN = re.compile(r"url\(\s*['\"]?(?!data:|https?:|/)([^'\")?#]+)")
+
+
+class VendorAssets:
+    """
+    Content-hashed URLs for the bundled front-end libraries.
+
+    Bundled files are served as ``/vendor/<hash>/<path>``, where the hash is
+    taken from the file's content, so browsers can cache them forever and a
+    new version always gets a new URL. Files a stylesheet refers to, like the
+    KaTeX fonts, resolve under the stylesheet's hash. Libraries that are not
+    bundled are loaded from the CDN instead.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize the assets. Files are hashed on first use.
+
+        Args:
+            directory: Directory the libraries are bundled into
+        """
+        self.directory = directory
+        self._digests: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def url(self, name: str) -> str:
+        """
+        Get the URL of a library file.
+
+        Args:
+            name: Key in LIBRARIES
+
+        Returns:
+            Content-hashed URL of the bundled file, or its CDN URL
+        """
+        library = LIBRARIES[name]
+        digest = self._hashes().get(library.path)
+        if digest is None:
+            return library.url
+        return f"/vendor/{digest}/{library.path}"
+
+    def urls(self) -> dict[str, str]:
+        """
+        Get the URLs of all library files.
+
+        Returns:
+            Dictionary of URLs by library name
+        """
+        return {name: self.url(name) for name in LIBRARIES}
+
+    def find(self, digest: str, path: str) -> Path | None:
+        """
+        Find the bundled file for a vendor URL.
+
+        Args:
+            digest: Hash from the URL
+            path: Path from the URL, relative to the vendor directory
+
+        Returns:
+            Path of the file, or None if it does not exist, lies outside the
+            vendor directory, or has changed since the URL was issued
+        """
+        expected = self._hashes().get(path)
+        if expected is not None and expected != digest:
+            return None
+        file_path = (self.directory / path).resolve()
+        try:
+            file_path.relative_to(self.directory.resolve())
+        except ValueError:
+            return None
+        return file_path if file_path.is_file() else None
+
+    def clear(self) -> None:
+        """Forget the hashes, so files are hashed again on next use."""
+        with self._lock:
+            self._digests = None
+
+    def _hashes(self) -> dict[str, str]:
+        """Hash the bundled library files, once."""
+        digests = self._digests
+        if digests is not None:
+            return digests
+        with self._lock:
+            if self._digests is None:
+                digests = {}
+                for library in LIBRARIES.values():
+                    file_path = self.directory / library.path
+                    if file_path.is_file():
+                        content = file_path.read_bytes()
+                        digests[library.path] = hashlib.blake2b(content, digest_size=8).hexdigest()
+                self._digests = digests
+            return self._digests
+
+
+def fetch(directory: Path, timeout: float = 30.0) -> list[Path]:
+    """
+    Download the pinned libraries into a vendor directory.
+
+    Files referenced by the stylesheets (the KaTeX fonts) are downloaded too.
+
+    Args:
+        directory: Directory to bundle the libraries into
+        timeout: Timeout in seconds for each download
+
+    Returns:
+        Paths of the downloaded files
+    """
+    downloaded = []
+    queue = list(LIBRARIES.values())
+    seen = {library.path for library in queue}
+    while queue:
+        library = queue.pop(0)
+        with urllib.request.urlopen(library.url, timeout=timeout) as response:
+            content = response.read()
+        file_path = directory / library.path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+        downloaded.append(file_path)
+
+        if library.path.endswith(".css"):
+            base_path = library.path.rpartition("/")[0]
+            base_url = library.url.rpartition("/")[0]
+            for reference in _CSS_URL_PATTERN.findall(content.decode("utf-8")):
+                path = f"{base_path}/{reference}"
+                if path not in seen:
+                    seen.add(path)
+                    queue.append(Library(path, f"{base_url}/{reference}"))
+    return downloaded
+
+
+vendor_assets = VendorAssets(Path(__file__).parent / "static" / "vendor")
+
+
+if __name__ == "__main__":
+    # python -m markdeck.vendor: bundle the libraries before building a release
+    for file_path in fetch(vendor_assets.directory):
+        print(file_path.relative_to(vendor_assets.directory))
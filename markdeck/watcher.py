@@ -5,24 +5,85 @@ from pathlib import Path
 
 from watchfiles import awatch
 
-from markdeck.server import notify_clients_reload
+from markdeck.parser import Deck
+from markdeck.server import load_deck, notify_clients_changed
+
+
+def describe_changes(previous: Deck | None, deck: Deck) -> str:
+    """
+    Describe how a new version of a deck differs from the previous one.
+
+    Args:
+        previous: Previously loaded version, if any
+        deck: Newly loaded version
+
+    Returns:
+        Short human-readable summary of the slide changes
+    """
+    if previous is None:
+        return f"{len(deck.slides)} slides parsed"
+    if previous.version == deck.version:
+        return "no slide changes"
+
+    changes = deck.diff(previous)
+    parts = []
+    for label, ids in (
+        ("modified", changes.modified),
+        ("added", changes.added),
+        ("removed", changes.removed),
+    ):
+        if ids:
+            numbers = ", ".join(str(slide_id + 1) for slide_id in ids[:5])
+            if len(ids) > 5:
+                numbers += ", ..."
+            parts.append(f"{label}: {numbers}")
+    return "; ".join(parts) or "no slide changes"
 
 
 async def watch_file(file_path: Path) -> None:
     """
-    Watch a file for changes and notify clients to reload.
+    Watch a presentation and the files it includes, and notify clients to reload.
+
+    The set of watched files follows the include directives of the latest
+    version that parsed successfully.
 
     Args:
-        file_path: Path to the file to watch
+        file_path: Path to the presentation file to watch
     """
     print(f"Watching {file_path.name} for changes...")
 
-    async for changes in awatch(file_path):
-        # Filter out non-modify events and only trigger on actual file changes
-        for change_type, changed_path in changes:
-            if Path(changed_path) == file_path:
-                print(f"File changed: {file_path.name}, reloading...")
-                await notify_clients_reload()
+    # Keep the parsed deck warm so each change is parsed incrementally
+    previous = None
+    try:
+        previous = await load_deck(file_path)
+    except Exception as e:
+        print(f"Could not parse {file_path.name}: {e}")
+
+    while True:
+        watched = {Path(name) for name in previous.files} if previous else {file_path}
+        async for changes in awatch(*watched):
+            # Filter out non-modify events and only trigger on actual file changes
+            changed = sorted({Path(path) for _, path in changes} & watched)
+            if not changed:
+                continue
+            notified = previous
+            try:
+                deck = await load_deck(file_path)
+                summary = describe_changes(previous, deck)
+                previous = deck
+            except Exception as e:
+                deck = None
+                summary = f"parse failed: {e}"
+            names = ", ".join(path.name for path in changed)
+            print(f"File changed: {names} ({summary}), reloading...")
+            # Clients get just the changed slides when they have the last version
+            try:
+                await notify_clients_changed(notified, deck)
+            except Exception as e:
+                # Keep watching; clients catch up on the next change
+                print(f"Could not notify clients: {e}")
+            if previous is not None and {Path(name) for name in previous.files} != watched:
+                # Includes were added or removed, so watch the new set of files
                 break
 
 
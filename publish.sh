@@ -46,10 +46,23 @@ if [ $? -ne 0 ]; then
     exit 1
 fi
 
+# Bundle the front-end libraries, so the package works without internet access
+echo "📚 Fetching front-end libraries..."
+python -m markdeck.vendor
+if [ -z "$(ls -A markdeck/static/vendor 2>/dev/null)" ]; then
+    echo "❌ Error: markdeck/static/vendor/ is empty"
+    exit 1
+fi
+
 # Build the package
 echo "📦 Building package..."
 python -m build
 
+if ! python -m zipfile -l dist/*.whl | grep -q "markdeck/static/vendor/"; then
+    echo "❌ Error: the wheel does not include markdeck/static/vendor/"
+    exit 1
+fi
+
 # Check the package
 echo "🔍 Checking package..."
 python -m twine check dist/*
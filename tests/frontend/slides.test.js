@@ -394,6 +394,31 @@ describe('SlideShow', () => {
       expect(slideshow.elements.slideContent.innerHTML).toContain('Slide 1');
     });
 
+    test('showSlide uses server-rendered HTML when present', () => {
+      slideshow.notifySlideChange = jest.fn();
+      slideshow.slides[0] = { content: '# Slide 1', html: '<h1>Slide 1</h1>' };
+
+      slideshow.showSlide(0);
+
+      expect(global.marked.parse).not.toHaveBeenCalled();
+      expect(slideshow.elements.slideContent.innerHTML).toBe('<h1>Slide 1</h1>');
+    });
+
+    test('showSlide skips code blocks highlighted by the server', () => {
+      slideshow.notifySlideChange = jest.fn();
+      slideshow.slides[0] = {
+        content: '```python\nx = 1\n```\n\n```\nplain\n```',
+        html:
+          '<pre><code class="hljs language-python">x = 1</code></pre>' +
+          '<pre><code>plain</code></pre>',
+      };
+
+      slideshow.showSlide(0);
+
+      expect(global.hljs.highlightElement).toHaveBeenCalledTimes(1);
+      expect(global.hljs.highlightElement.mock.calls[0][0].textContent).toBe('plain');
+    });
+
     test('showSlide updates progress indicator', () => {
       slideshow.notifySlideChange = jest.fn();
       slideshow.totalSlides = 3;
@@ -445,4 +470,309 @@ describe('SlideShow', () => {
       expect(slideshow.toggleGrid).toHaveBeenCalled();
     });
   });
+
+  describe('Loading Slides', () => {
+    const jsonResponse = (body, headers = {}) => ({
+      ok: true,
+      status: 200,
+      headers: { get: (name) => headers[name] || null },
+      json: async () => body
+    });
+
+    test('loadSlides sends the validators of the previous response', async () => {
+      global.fetch
+        .mockResolvedValueOnce(
+          jsonResponse(
+            { slides: [{ content: '# A' }], total: 1, title: 'A' },
+            { ETag: '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT' }
+          )
+        )
+        .mockResolvedValueOnce({ ok: false, status: 304, headers: { get: () => null } });
+
+      expect(await slideshow.loadSlides()).toBe(true);
+      expect(await slideshow.loadSlides()).toBe(false);
+
+      expect(global.fetch.mock.calls[1][1].headers).toEqual({
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+      });
+      expect(slideshow.slides).toEqual([{ content: '# A' }]);
+      expect(slideshow.totalSlides).toBe(1);
+    });
+
+    test('loadFirstSlide fills the rest of the deck with placeholders', async () => {
+      global.fetch.mockResolvedValueOnce(
+        jsonResponse({ slides: [{ id: 0, content: '# A' }], total: 3, title: 'Deck', start: 0 })
+      );
+
+      await slideshow.loadFirstSlide();
+
+      expect(global.fetch).toHaveBeenCalledWith('/api/slides?start=0&count=1');
+      expect(slideshow.totalSlides).toBe(3);
+      expect(slideshow.slides[0].content).toBe('# A');
+      expect(slideshow.slides[2]).toEqual({ id: 2, content: null });
+    });
+
+    test('loadFirstSlide uses the slides embedded in the page', async () => {
+      slideshow.bootstrap = {
+        watch_enabled: true,
+        follow_enabled: false,
+        slides: [{ id: 0, content: '# A' }, { id: 1, content: '# B' }],
+        total: 3,
+        title: 'Deck',
+        version: 'v1',
+        start: 0
+      };
+
+      await slideshow.loadFirstSlide();
+
+      expect(global.fetch).not.toHaveBeenCalled();
+      expect(slideshow.slides[1].content).toBe('# B');
+      expect(slideshow.slides[2]).toEqual({ id: 2, content: null });
+      expect(slideshow.deckVersion).toBe('v1');
+    });
+
+    test('showSlide fetches a slide that is not loaded yet', async () => {
+      slideshow.notifySlideChange = jest.fn();
+      slideshow.slides[1] = { id: 1, content: null };
+      global.fetch.mockResolvedValueOnce(jsonResponse({ id: 1, content: '# Fetched' }));
+
+      slideshow.showSlide(1);
+      expect(slideshow.elements.slideContent.innerHTML).toBe('');
+      await new Promise((resolve) => setTimeout(resolve, 0));
+
+      expect(global.fetch).toHaveBeenCalledWith('/api/slides/1');
+      expect(slideshow.slides[1].content).toBe('# Fetched');
+      expect(global.marked.parse).toHaveBeenCalledWith('# Fetched');
+    });
+
+    test('reloadPresentation keeps the current slide when not modified', async () => {
+      slideshow.showSlide = jest.fn();
+      slideshow.showReloadNotification = jest.fn();
+      global.fetch.mockResolvedValueOnce({ ok: false, status: 304, headers: { get: () => null } });
+
+      await slideshow.reloadPresentation();
+
+      expect(slideshow.showSlide).not.toHaveBeenCalled();
+      expect(slideshow.showReloadNotification).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('Hot Reload Patches', () => {
+    beforeEach(() => {
+      slideshow.showSlide = jest.fn();
+      slideshow.showReloadNotification = jest.fn();
+      slideshow.reloadPresentation = jest.fn();
+      slideshow.slides = [0, 1, 2, 3].map((id) => ({ id, content: `# ${id}` }));
+      slideshow.totalSlides = 4;
+      slideshow.deckVersion = 'v1';
+    });
+
+    const patch = (fields) => ({
+      type: 'patch',
+      base: 'v1',
+      version: 'v2',
+      title: 'Deck',
+      modified: [],
+      added: [],
+      removed: [],
+      slides: [],
+      ...fields
+    });
+
+    test('applyPatch replaces a modified slide in place', async () => {
+      const third = slideshow.slides[3];
+
+      await slideshow.applyPatch(
+        patch({ total: 4, start: 1, modified: [1], slides: [{ id: 1, content: '# New' }] })
+      );
+
+      expect(slideshow.slides.map((slide) => slide.content)).toEqual(['# 0', '# New', '# 2', '# 3']);
+      expect(slideshow.slides[3]).toBe(third);
+      expect(slideshow.deckVersion).toBe('v2');
+      expect(slideshow.showReloadNotification).toHaveBeenCalled();
+      expect(slideshow.reloadPresentation).not.toHaveBeenCalled();
+    });
+
+    test('applyPatch renumbers the slides after an insertion', async () => {
+      await slideshow.applyPatch(
+        patch({ total: 5, start: 2, added: [2], slides: [{ id: 2, content: '# Inserted' }] })
+      );
+
+      expect(slideshow.slides.map((slide) => slide.id)).toEqual([0, 1, 2, 3, 4]);
+      expect(slideshow.slides[3].content).toBe('# 2');
+      expect(slideshow.totalSlides).toBe(5);
+    });
+
+    test('applyPatch removes slides and stays in range', async () => {
+      slideshow.currentSlideIndex = 3;
+
+      await slideshow.applyPatch(patch({ total: 2, start: 2, removed: [2, 3] }));
+
+      expect(slideshow.slides.map((slide) => slide.content)).toEqual(['# 0', '# 1']);
+      expect(slideshow.showSlide).toHaveBeenCalledWith(1);
+    });
+
+    test('applyPatch reloads the deck on a version mismatch', async () => {
+      await slideshow.applyPatch(patch({ base: 'v0', total: 4, start: 0, modified: [0] }));
+
+      expect(slideshow.reloadPresentation).toHaveBeenCalled();
+      expect(slideshow.slides[0].content).toBe('# 0');
+    });
+  });
+  describe('Event Channel', () => {
+    const flushMicrotasks = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+    beforeEach(() => {
+      slideshow.slides = [0, 1, 2].map((id) => ({ id, content: `# ${id}` }));
+      slideshow.totalSlides = 3;
+      slideshow.socket = { readyState: WebSocket.OPEN, send: jest.fn() };
+    });
+
+    test('navigation is sent over the WebSocket instead of an HTTP POST', async () => {
+      slideshow.showSlide(2);
+      await flushMicrotasks();
+
+      expect(slideshow.socket.send).toHaveBeenCalledWith(
+        JSON.stringify({ type: 'navigate', slide: 2 })
+      );
+      expect(global.fetch).not.toHaveBeenCalled();
+    });
+
+    test('rapid navigation is coalesced into the latest position', async () => {
+      slideshow.showSlide(1);
+      slideshow.showSlide(2);
+      slideshow.showSlide(0);
+      await flushMicrotasks();
+
+      expect(slideshow.socket.send).toHaveBeenCalledTimes(1);
+      expect(slideshow.socket.send).toHaveBeenCalledWith(
+        JSON.stringify({ type: 'navigate', slide: 0 })
+      );
+    });
+
+    test('events queued together are sent as one batch', async () => {
+      slideshow.sendEvent({ type: 'navigate', slide: 1 });
+      slideshow.sendEvent({ type: 'other' });
+      await flushMicrotasks();
+
+      expect(slideshow.socket.send).toHaveBeenCalledWith(
+        JSON.stringify([{ type: 'navigate', slide: 1 }, { type: 'other' }])
+      );
+    });
+
+    test('events wait for the socket to connect', async () => {
+      slideshow.socket = null;
+      slideshow.sendEvent({ type: 'navigate', slide: 1 });
+      await flushMicrotasks();
+
+      slideshow.socket = { readyState: WebSocket.OPEN, send: jest.fn() };
+      slideshow.flushEvents();
+
+      expect(slideshow.socket.send).toHaveBeenCalledWith(
+        JSON.stringify({ type: 'navigate', slide: 1 })
+      );
+    });
+
+    test('followers go to the presenter position and do not send navigation', async () => {
+      slideshow.following = true;
+
+      await slideshow.handleMessage({ type: 'goto', slide: 1 });
+      await flushMicrotasks();
+
+      expect(slideshow.currentSlideIndex).toBe(1);
+      expect(slideshow.socket.send).not.toHaveBeenCalled();
+    });
+
+    test('viewers that do not follow ignore the presenter position', async () => {
+      await slideshow.handleMessage({ type: 'goto', slide: 2 });
+
+      expect(slideshow.currentSlideIndex).toBe(0);
+    });
+  });
+
+  describe('Optional Libraries', () => {
+    beforeEach(() => {
+      delete global.mermaid;
+      delete global.renderMathInElement;
+      slideshow.libraries = {
+        katex: '/vendor/1/katex/katex.min.js',
+        'katex-css': '/vendor/2/katex/katex.min.css',
+        'katex-auto-render': '/vendor/3/katex/contrib/auto-render.min.js',
+        mermaid: '/vendor/4/mermaid/mermaid.min.js'
+      };
+      slideshow.featureLoads = {};
+      // Scripts "load" as soon as they are added to the page
+      slideshow.loadScript = jest.fn(async (url) => {
+        if (url === slideshow.libraries.mermaid) {
+          global.mermaid = { initialize: jest.fn(), run: jest.fn() };
+        }
+      });
+    });
+
+    test('libraries are not loaded for decks without math or diagrams', () => {
+      slideshow.loadFeatures({ math: false, mermaid: false });
+
+      expect(slideshow.loadScript).not.toHaveBeenCalled();
+    });
+
+    test('KaTeX is loaded once for decks with math', async () => {
+      slideshow.loadFeatures({ math: true, mermaid: false });
+      slideshow.loadFeatures({ math: true, mermaid: false });
+      await slideshow.featureLoads.math;
+
+      expect(slideshow.loadScript.mock.calls.map((call) => call[0])).toEqual([
+        '/vendor/1/katex/katex.min.js',
+        '/vendor/3/katex/contrib/auto-render.min.js'
+      ]);
+      expect(document.querySelector('link[href="/vendor/2/katex/katex.min.css"]')).not.toBeNull();
+    });
+
+    test('diagrams on the current slide render once mermaid has loaded', async () => {
+      slideshow.elements.slideContent.innerHTML = '<div class="mermaid">graph TD</div>';
+
+      slideshow.loadFeatures({ math: false, mermaid: true });
+      await slideshow.featureLoads.mermaid;
+
+      expect(global.mermaid.initialize).toHaveBeenCalled();
+      expect(global.mermaid.run).toHaveBeenCalled();
+    });
+  });
+
+  describe('Image Variants', () => {
+    const html = '<img src="./images/photo.png"><img src="diagram.svg"><img src="https://example.com/a.png">';
+
+    function rewrite(maxWidth) {
+      const container = document.createElement('div');
+      container.innerHTML = html;
+      slideshow.rewriteImages(container, maxWidth);
+      return Array.from(container.querySelectorAll('img')).map((img) => img.getAttribute('src'));
+    }
+
+    afterEach(() => {
+      window.devicePixelRatio = 1;
+    });
+
+    test('relative images are served from /assets', () => {
+      slideshow.imageWidths = [];
+
+      expect(rewrite(1024)).toEqual([
+        '/assets/images/photo.png',
+        '/assets/diagram.svg',
+        'https://example.com/a.png'
+      ]);
+    });
+
+    test('raster images are requested at the width they can be drawn at', () => {
+      slideshow.imageWidths = [320, 640, 1280, 1920];
+
+      expect(rewrite(1024)[0]).toBe('/assets/images/photo.png?width=1280&format=webp');
+      expect(rewrite(600)[0]).toBe('/assets/images/photo.png?width=640&format=webp');
+      expect(rewrite(1024)[1]).toBe('/assets/diagram.svg');
+
+      window.devicePixelRatio = 2;
+      expect(rewrite(600)[0]).toBe('/assets/images/photo.png?width=1280&format=webp');
+      expect(rewrite(5000)[0]).toBe('/assets/images/photo.png?width=1920&format=webp');
+    });
+  });
 });
@@ -0,0 +1,231 @@
+"""Tests for the presentation assets."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from markdeck import server
+from markdeck.assets import AssetStore, byte_range, iter_file
+from markdeck.server import app, enable_watch_mode, set_presentation_file
+
+
+class TestByteRange(unittest.TestCase):
+    """Test parsing of Range headers."""
+
+    def test_ranges(self):
+        """Test the forms of a single byte range."""
+        self.assertEqual(byte_range("bytes=0-99", 1000), (0, 99))
+        self.assertEqual(byte_range("bytes=500-", 1000), (500, 999))
+        self.assertEqual(byte_range("bytes=-100", 1000), (900, 999))
+        self.assertEqual(byte_range("bytes=900-5000", 1000), (900, 999))
+        self.assertEqual(byte_range("bytes=-5000", 1000), (0, 999))
+
+    def test_ignored(self):
+        """Test that headers without a usable single range are ignored."""
+        for header in (None, "", "bytes=0-1,5-6", "items=0-1", "bytes=9-1", "bytes=-", "x"):
+            self.assertIsNone(byte_range(header, 1000), header)
+
+    def test_unsatisfiable(self):
+        """Test that ranges beyond the end of the file are rejected."""
+        for header in ("bytes=1000-", "bytes=2000-3000", "bytes=-0"):
+            with self.assertRaises(ValueError):
+                byte_range(header, 1000)
+
+
+class TestAssetStore(unittest.TestCase):
+    """Test the AssetStore class."""
+
+    def setUp(self):
+        """Create a presentation directory with an image."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.image = self.directory / "image.png"
+        self.image.write_bytes(b"x" * 100)
+        self.store = AssetStore(max_file_size=1000, max_bytes=250)
+
+    def tearDown(self):
+        """Remove the directory."""
+        self.temp_dir.cleanup()
+
+    def test_resolve_is_memoized(self):
+        """Test that each path is resolved only once."""
+        patch = mock.patch.object(Path, "resolve", autospec=True, side_effect=Path.absolute)
+        with patch as resolve:
+            first = self.store.resolve(self.directory, "image.png")
+            calls = resolve.call_count
+            second = self.store.resolve(self.directory, "image.png")
+
+        self.assertEqual(first, second)
+        self.assertEqual(resolve.call_count, calls)
+
+    def test_resolve_rejects_traversal(self):
+        """Test that paths outside the directory are rejected."""
+        self.assertIsNone(self.store.resolve(self.directory, "../secret.txt"))
+        self.assertEqual(
+            self.store.resolve(self.directory, "sub/../image.png"), self.image.resolve()
+        )
+
+    def test_read_is_cached_until_changed(self):
+        """Test that small files are read once per version."""
+        asset = self.store.stat(self.image)
+        self.assertEqual(self.store.read(asset), b"x" * 100)
+        self.assertEqual(self.store.peek(asset), b"x" * 100)
+
+        self.image.write_bytes(b"y" * 120)
+        changed = self.store.stat(self.image)
+        self.assertNotEqual(changed.etag, asset.etag)
+        self.assertIsNone(self.store.peek(changed))
+        self.assertEqual(self.store.read(changed), b"y" * 120)
+
+    def test_large_files_not_cached(self):
+        """Test that files above the size limit are not kept in memory."""
+        self.image.write_bytes(b"x" * 2000)
+        self.assertIsNone(self.store.read(self.store.stat(self.image)))
+        self.assertEqual(len(self.store), 0)
+
+    def test_eviction(self):
+        """Test that the least recently used files are evicted over the memory cap."""
+        for name in ("a.png", "b.png", "c.png"):
+            path = self.directory / name
+            path.write_bytes(b"x" * 100)
+            self.store.read(self.store.stat(path))
+
+        self.assertEqual(len(self.store), 2)
+        self.assertIsNone(self.store.peek(self.store.stat(self.directory / "a.png")))
+
+    def test_stat_missing_or_directory(self):
+        """Test that only regular files are found."""
+        self.assertIsNone(self.store.stat(self.directory / "missing.png"))
+        self.assertIsNone(self.store.stat(self.directory))
+
+    def test_iter_file(self):
+        """Test that part of a file is read in chunks."""
+        self.image.write_bytes(bytes(range(200)))
+        with mock.patch("markdeck.assets.CHUNK_SIZE", 16):
+            chunks = list(iter_file(self.image, 10, 59))
+
+        self.assertEqual(b"".join(chunks), bytes(range(10, 60)))
+        self.assertEqual(max(len(chunk) for chunk in chunks), 16)
+
+
+class TestAssetsEndpoint(unittest.TestCase):
+    """Test serving the presentation's assets."""
+
+    def setUp(self):
+        """Create a presentation with a small image and a large video."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        directory = Path(self.temp_dir.name)
+        (directory / "slides.md").write_text("# Slide\n\n![](image.png)")
+        (directory / "image.png").write_bytes(bytes(range(256)))
+        self.video = bytes(range(256)) * 2048
+        (directory / "video.mp4").write_bytes(self.video)
+        set_presentation_file(directory / "slides.md")
+        server.asset_store.clear()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        """Clean up."""
+        set_presentation_file(None)
+        enable_watch_mode(False)
+        self.temp_dir.cleanup()
+
+    def test_validators_and_not_modified(self):
+        """Test that assets can be revalidated."""
+        response = self.client.get("/assets/image.png")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, bytes(range(256)))
+        self.assertEqual(response.headers["content-type"], "image/png")
+        self.assertEqual(response.headers["accept-ranges"], "bytes")
+        self.assertIn("max-age", response.headers["cache-control"])
+
+        etag = response.headers["etag"]
+        response = self.client.get("/assets/image.png", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_watch_mode_revalidates(self):
+        """Test that assets are revalidated on every use while editing."""
+        enable_watch_mode(True)
+        response = self.client.get("/assets/image.png")
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+    def test_small_file_served_from_memory(self):
+        """Test that a small file is read from disk only once."""
+        self.client.get("/assets/image.png")
+        with mock.patch.object(Path, "read_bytes", side_effect=AssertionError):
+            response = self.client.get("/assets/image.png")
+        self.assertEqual(response.content, bytes(range(256)))
+
+    def test_range(self):
+        """Test that byte ranges are served, from memory and from disk."""
+        for name, content in (("image.png", bytes(range(256))), ("video.mp4", self.video)):
+            size = len(content)
+            response = self.client.get(f"/assets/{name}", headers={"Range": "bytes=10-19"})
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response.content, content[10:20])
+            self.assertEqual(response.headers["content-range"], f"bytes 10-19/{size}")
+            self.assertEqual(response.headers["content-length"], "10")
+
+            response = self.client.get(f"/assets/{name}", headers={"Range": "bytes=-6"})
+            self.assertEqual(response.content, content[-6:])
+
+    def test_large_file(self):
+        """Test that a large file is streamed whole."""
+        response = self.client.get("/assets/video.mp4")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.video)
+        self.assertEqual(response.headers["content-length"], str(len(self.video)))
+
+    def test_large_file_if_range(self):
+        """Test that the validators of a streamed file also decide If-Range."""
+        etag = self.client.get("/assets/video.mp4").headers["etag"]
+        headers = {"Range": "bytes=0-9"}
+
+        response = self.client.get("/assets/video.mp4", headers={**headers, "If-Range": etag})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, self.video[:10])
+        response = self.client.get("/assets/video.mp4", headers={**headers, "If-Range": '"old"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.content), len(self.video))
+
+    def test_large_file_range_without_starlette_support(self):
+        """Test that ranges of large files do not depend on FileResponse handling them."""
+        with mock.patch.object(server, "FileResponse", side_effect=AssertionError):
+            response = self.client.get("/assets/video.mp4", headers={"Range": "bytes=100-199"})
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, self.video[100:200])
+        self.assertEqual(response.headers["content-length"], "100")
+
+    def test_unsatisfiable_range(self):
+        """Test that a range beyond the end of the file is rejected."""
+        response = self.client.get("/assets/image.png", headers={"Range": "bytes=256-"})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers["content-range"], "bytes */256")
+
+    def test_if_range(self):
+        """Test that a range for an outdated copy gets the whole file."""
+        etag = self.client.get("/assets/image.png").headers["etag"]
+        headers = {"Range": "bytes=0-9"}
+
+        response = self.client.get("/assets/image.png", headers={**headers, "If-Range": etag})
+        self.assertEqual(response.status_code, 206)
+        response = self.client.get("/assets/image.png", headers={**headers, "If-Range": '"old"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.content), 256)
+
+    def test_access_denied_and_missing(self):
+        """Test that files outside the directory or missing are not served."""
+        self.assertEqual(self.client.get("/assets/..%2F..%2Fetc%2Fpasswd").status_code, 403)
+        self.assertEqual(self.client.get("/assets/missing.png").status_code, 404)
+
+    def test_no_presentation(self):
+        """Test that assets need a presentation."""
+        set_presentation_file(None)
+        self.assertEqual(self.client.get("/assets/image.png").status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the in-memory viewer files."""
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from markdeck.bundle import StaticBundle
+from markdeck.vendor import LIBRARIES, VendorAssets
+
+
+class TestStaticBundle(unittest.TestCase):
+    """Test the StaticBundle class."""
+
+    def setUp(self):
+        """Create a directory with a page, a script and a stylesheet."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        (self.directory / "app.js").write_text("console.log('app');\n" * 100)
+        (self.directory / "dark.css").write_text("body { color: white; }")
+        (self.directory / "index.html").write_text(
+            '<script id="urls" type="application/json">{{static}}</script>\n'
+            '<link rel="stylesheet" href="{{static:dark.css}}">\n'
+            '<script src="{{library:marked}}"></script>\n'
+            '<script src="{{static:app.js}}"></script>\n'
+        )
+        vendor = VendorAssets(self.directory / "vendor")
+        self.bundle = StaticBundle(self.directory, vendor=vendor)
+
+    def tearDown(self):
+        """Remove the directory."""
+        self.temp_dir.cleanup()
+
+    def page(self) -> str:
+        """Get the rendered page."""
+        return self.bundle.get("index.html").body.identity.decode("utf-8")
+
+    def test_placeholders_replaced(self):
+        """Test that the page links the content-hashed URLs."""
+        page = self.page()
+
+        self.assertIn(f'href="{self.bundle.url("dark.css")}"', page)
+        self.assertIn(f'src="{self.bundle.url("app.js")}"', page)
+        self.assertIn(f'src="{LIBRARIES["marked"].url}"', page)
+        self.assertRegex(self.bundle.url("app.js"), r"^/static/[0-9a-f]{16}/app\.js$")
+
+    def test_url_map(self):
+        """Test that the page lists the URLs of the other files as JSON."""
+        urls = json.loads(self.page().split("\n")[0].split(">")[1].split("<")[0])
+
+        self.assertEqual(
+            urls, {"app.js": self.bundle.url("app.js"), "dark.css": self.bundle.url("dark.css")}
+        )
+
+    def test_url_changes_with_content(self):
+        """Test that a changed file gets a new URL, and so does the page."""
+        url, page = self.bundle.url("app.js"), self.page()
+        (self.directory / "app.js").write_text("console.log('changed');")
+        self.bundle.clear()
+
+        self.assertNotEqual(self.bundle.url("app.js"), url)
+        self.assertNotEqual(self.page(), page)
+
+    def test_files_precompressed(self):
+        """Test that compressed variants are built when the files are loaded."""
+        body = self.bundle.get("app.js").body
+
+        self.assertIn("gzip", body._variants)
+        self.assertEqual(gzip.decompress(body.encoded("gzip")), body.identity)
+
+    def test_media_types(self):
+        """Test that files are served with their media type."""
+        self.assertEqual(self.bundle.get("dark.css").media_type, "text/css")
+        self.assertEqual(self.bundle.get("index.html").media_type, "text/html")
+        self.assertIsNone(self.bundle.get("missing.js"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""Tests for the per-client WebSocket send queues."""
+
+import asyncio
+import json
+import time
+import unittest
+
+from markdeck.clients import ClientConnection, FollowChannel, broadcast
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records messages, optionally blocking."""
+
+    def __init__(self, blocked: bool = False):
+        """Initialize the socket; a blocked socket never completes a send."""
+        self.messages: list[dict] = []
+        self.frames = 0
+        self.closed_with: int | None = None
+        self.blocked = blocked
+        self.fail = False
+
+    async def send_text(self, text: str) -> None:
+        """Record a message."""
+        if self.fail:
+            raise RuntimeError("connection lost")
+        if self.blocked:
+            await asyncio.Event().wait()
+        self.frames += 1
+        data = json.loads(text)
+        # Messages pending together arrive as one batch
+        self.messages.extend(data if isinstance(data, list) else [data])
+
+    async def close(self, code: int = 1000) -> None:
+        """Record the close code."""
+        self.closed_with = code
+
+
+async def _settle() -> None:
+    """Let the writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestClientConnection(unittest.TestCase):
+    """Test the ClientConnection class."""
+
+    def test_messages_sent_in_order(self):
+        """Test that messages with different keys are all sent in order."""
+
+        async def run():
+            websocket = FakeWebSocket()
+            client = ClientConnection(websocket)
+            client.start()
+            client.send("a", '{"n": 1}')
+            client.send("b", '{"n": 2}')
+            await _settle()
+            client.send("c", '{"n": 3}')
+            await _settle()
+            await client.close()
+            return websocket
+
+        websocket = asyncio.run(run())
+        self.assertEqual(websocket.messages, [{"n": 1}, {"n": 2}, {"n": 3}])
+        # The first two were pending together and went out as one batch
+        self.assertEqual(websocket.frames, 2)
+
+    def test_pending_messages_coalesced(self):
+        """Test that a newer message replaces an unsent one with the same key."""
+
+        async def run():
+            websocket = FakeWebSocket()
+            client = ClientConnection(websocket)
+            for n in range(10):
+                client.send("reload", json.dumps({"n": n}))
+            self.assertEqual(client.pending, 1)
+            client.start()
+            await _settle()
+            await client.close()
+            return websocket.messages
+
+        self.assertEqual(asyncio.run(run()), [{"n": 9}])
+
+    def test_pending_messages_bounded(self):
+        """Test that the oldest message is dropped when too many are pending."""
+        client = ClientConnection(FakeWebSocket())
+        for n in range(ClientConnection.MAX_PENDING + 5):
+            client.send(f"key-{n}", "{}")
+        self.assertEqual(client.pending, ClientConnection.MAX_PENDING)
+
+    def test_stalled_client_disconnected(self):
+        """Test that a client that does not accept a message is closed."""
+
+        async def run():
+            websocket = FakeWebSocket(blocked=True)
+            client = ClientConnection(websocket)
+            client.SEND_TIMEOUT = 0.01
+            client.start()
+            client.send("reload", "{}")
+            await asyncio.sleep(0.05)
+            return client, websocket
+
+        client, websocket = asyncio.run(run())
+        self.assertTrue(client.closed)
+        self.assertEqual(websocket.closed_with, 1013)
+        self.assertFalse(client.send("reload", "{}"))
+
+
+class TestBroadcast(unittest.TestCase):
+    """Test the broadcast function."""
+
+    def test_failed_clients_removed(self):
+        """Test that clients whose writes failed are removed from the set."""
+
+        async def run():
+            good, bad = FakeWebSocket(), FakeWebSocket()
+            bad.fail = True
+            clients = {ClientConnection(good), ClientConnection(bad)}
+            for client in clients:
+                client.start()
+            broadcast(clients, {"type": "reload"})
+            await _settle()
+            sent = broadcast(clients, {"type": "reload"})
+            await _settle()
+            for client in clients:
+                await client.close()
+            return sent, len(clients), good.messages
+
+        sent, remaining, messages = asyncio.run(run())
+        self.assertEqual(sent, 1)
+        self.assertEqual(remaining, 1)
+        self.assertEqual(messages, [{"type": "reload"}, {"type": "reload"}])
+
+    def test_many_clients_with_stalled_ones(self):
+        """Test fan-out to a room of viewers, some of which never read."""
+
+        async def run():
+            sockets = [FakeWebSocket(blocked=n % 50 == 0) for n in range(500)]
+            clients = {ClientConnection(websocket) for websocket in sockets}
+            for client in clients:
+                client.start()
+
+            started = time.perf_counter()
+            for _ in range(20):
+                broadcast(clients, {"type": "reload"})
+            elapsed = time.perf_counter() - started
+
+            await _settle()
+            for client in clients:
+                await client.close()
+            return sockets, elapsed
+
+        sockets, elapsed = asyncio.run(run())
+        # Queuing never waits on a socket
+        self.assertLess(elapsed, 1.0)
+        for n, websocket in enumerate(sockets):
+            if n % 50 == 0:
+                self.assertEqual(websocket.messages, [])
+            else:
+                # Every reader got the latest reload, coalesced
+                self.assertGreaterEqual(len(websocket.messages), 1)
+                self.assertLessEqual(len(websocket.messages), 20)
+
+
+class TestFollowChannel(unittest.TestCase):
+    """Test relaying the presenter's position to followers."""
+
+    def test_rapid_navigation_coalesced(self):
+        """Test that a burst of navigation sends the latest position at a capped rate."""
+
+        async def run():
+            websocket = FakeWebSocket()
+            client = ClientConnection(websocket)
+            client.start()
+            channel = FollowChannel(interval=0.02)
+            channel.add(client)
+            for slide in range(100):
+                channel.move(slide)
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.05)
+            await client.close()
+            return websocket.messages
+
+        messages = asyncio.run(run())
+        # About 100 ms of key repeat at one update per 20 ms
+        self.assertLessEqual(len(messages), 15)
+        self.assertEqual(messages[-1], {"type": "goto", "slide": 99})
+
+    def test_first_move_sent_immediately(self):
+        """Test that a single move is not delayed by the rate cap."""
+
+        async def run():
+            websocket = FakeWebSocket()
+            client = ClientConnection(websocket)
+            client.start()
+            channel = FollowChannel(interval=10.0)
+            channel.add(client)
+            channel.move(3)
+            await _settle()
+            channel.close()
+            await client.close()
+            return websocket.messages
+
+        self.assertEqual(asyncio.run(run()), [{"type": "goto", "slide": 3}])
+
+    def test_new_follower_gets_position(self):
+        """Test that a follower that joins late is sent the current slide."""
+
+        async def run():
+            channel = FollowChannel()
+            channel.move(4)
+            await asyncio.sleep(0.01)
+            websocket = FakeWebSocket()
+            client = ClientConnection(websocket)
+            client.start()
+            channel.add(client)
+            await _settle()
+            await client.close()
+            return websocket.messages
+
+        self.assertEqual(asyncio.run(run()), [{"type": "goto", "slide": 4}])
+
+    def test_thousand_followers(self):
+        """Load test: 1,000 followers, some stalled, and a presenter holding a key down."""
+
+        async def run():
+            sockets = [FakeWebSocket(blocked=n % 100 == 0) for n in range(1000)]
+            clients = [ClientConnection(websocket) for websocket in sockets]
+            channel = FollowChannel(interval=0.02)
+            for client in clients:
+                client.start()
+                channel.add(client)
+
+            started = time.perf_counter()
+            for slide in range(200):
+                channel.move(slide)
+                if slide % 10 == 0:
+                    await asyncio.sleep(0.005)
+            await asyncio.sleep(0.05)
+            elapsed = time.perf_counter() - started
+
+            for client in clients:
+                await client.close()
+            return sockets, elapsed
+
+        sockets, elapsed = asyncio.run(run())
+        self.assertLess(elapsed, 5.0)
+        # At most one update per interval, instead of one per keypress
+        limit = elapsed / 0.02 + 2
+        for n, websocket in enumerate(sockets):
+            if n % 100 == 0:
+                self.assertEqual(websocket.messages, [])
+            else:
+                self.assertLessEqual(len(websocket.messages), limit)
+                self.assertLess(len(websocket.messages), 200)
+                self.assertEqual(websocket.messages[-1], {"type": "goto", "slide": 199})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for pre-serialized response bodies."""
+
+import gzip
+import json
+import unittest
+
+from markdeck import encoding
+from markdeck.encoding import BodyCache, EncodedBody, choose_encoding, dumps
+
+
+class TestChooseEncoding(unittest.TestCase):
+    """Test Accept-Encoding negotiation."""
+
+    def test_preferred_order(self):
+        """Test that the most preferred available coding wins."""
+        self.assertEqual(choose_encoding("gzip, deflate, br", ("br", "gzip")), "br")
+        self.assertEqual(choose_encoding("gzip, deflate", ("br", "gzip")), "gzip")
+
+    def test_no_header(self):
+        """Test that a missing header means no compression."""
+        self.assertIsNone(choose_encoding(None, ("br", "gzip")))
+        self.assertIsNone(choose_encoding("", ("br", "gzip")))
+
+    def test_q_values(self):
+        """Test that codings with q=0 are refused."""
+        self.assertEqual(choose_encoding("br;q=0, gzip;q=0.5", ("br", "gzip")), "gzip")
+        self.assertIsNone(choose_encoding("*;q=0", ("br", "gzip")))
+        self.assertEqual(choose_encoding("*", ("br", "gzip")), "br")
+
+
+class TestEncodedBody(unittest.TestCase):
+    """Test the EncodedBody class."""
+
+    def setUp(self):
+        """Set up a body large enough to compress."""
+        self.data = {"slides": [{"id": i, "content": f"# Slide {i}"} for i in range(100)]}
+        self.body = EncodedBody(dumps(self.data))
+
+    def test_dumps_is_compact_json(self):
+        """Test that serialization round-trips and keeps non-ASCII text."""
+        data = {"title": "Ünïcode", "total": 1}
+
+        self.assertEqual(json.loads(dumps(data)), data)
+        self.assertIn("Ünïcode".encode(), dumps(data))
+        self.assertNotIn(b" ", dumps(data))
+
+    def test_gzip_variant(self):
+        """Test that the gzip variant decompresses to the body and is built once."""
+        variant = self.body.encoded("gzip")
+
+        self.assertEqual(gzip.decompress(variant), self.body.identity)
+        self.assertIs(self.body.encoded("gzip"), variant)
+        self.assertLess(len(variant), len(self.body.identity))
+
+    def test_peek(self):
+        """Test that peek returns only variants that are already built."""
+        self.assertIs(self.body.peek(None), self.body.identity)
+        self.assertIsNone(self.body.peek("gzip"))
+
+        variant = self.body.encoded("gzip")
+        self.assertIs(self.body.peek("gzip"), variant)
+
+    @unittest.skipUnless(encoding.brotli, "brotli is not installed")
+    def test_brotli_variant(self):
+        """Test that the brotli variant decompresses to the body."""
+        variant = self.body.encoded("br")
+
+        self.assertEqual(encoding.brotli.decompress(variant), self.body.identity)
+        self.assertEqual(self.body.encodings[0], "br")
+
+    def test_small_bodies_are_not_compressed(self):
+        """Test that tiny bodies offer no compressed variants."""
+        self.assertEqual(EncodedBody(b"{}").encodings, ())
+
+
+class TestBodyCache(unittest.TestCase):
+    """Test the BodyCache class."""
+
+    def test_builds_once_per_key(self):
+        """Test that a body is serialized only on first use."""
+        cache = BodyCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"total": 1}
+
+        first = cache.get("v1", build)
+        second = cache.get("v1", build)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_peek(self):
+        """Test that peek never builds a body."""
+        cache = BodyCache()
+        self.assertIsNone(cache.peek("v1"))
+
+        body = cache.get("v1", dict)
+        self.assertIs(cache.peek("v1"), body)
+
+    def test_custom_serializer(self):
+        """Test that bodies other than JSON can be cached."""
+        cache = BodyCache()
+        body = cache.get("page", lambda: "Deck", lambda title: f"<h1>{title}</h1>".encode())
+
+        self.assertEqual(body.identity, b"<h1>Deck</h1>")
+
+    def test_eviction(self):
+        """Test that the least recently used body is evicted."""
+        cache = BodyCache(max_entries=2)
+        for version in ("v1", "v2", "v3"):
+            cache.get(version, dict)
+
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for server-side syntax highlighting."""
+
+import unittest
+
+from markdeck.highlighter import CodeHighlighter, is_available
+
+
+@unittest.skipUnless(is_available(), "Pygments is not installed")
+class TestCodeHighlighter(unittest.TestCase):
+    """Test the CodeHighlighter class."""
+
+    def setUp(self):
+        """Set up a private highlighter."""
+        self.highlighter = CodeHighlighter()
+
+    def test_highlight_uses_hljs_classes(self):
+        """Test that tokens get highlight.js class names."""
+        markup = self.highlighter.highlight("def f():\n    return 'x'  # done\n", "python")
+
+        self.assertIn('<span class="hljs-keyword">def</span>', markup)
+        self.assertIn('<span class="hljs-title function_">f</span>', markup)
+        self.assertIn("<span class=\"hljs-string\">'x'</span>", markup)
+        self.assertIn('<span class="hljs-comment"># done</span>', markup)
+
+    def test_highlight_escapes_html(self):
+        """Test that code is HTML-escaped."""
+        markup = self.highlighter.highlight("<div class='a'>&</div>", "html")
+
+        self.assertNotIn("<div", markup)
+        self.assertIn("&lt;", markup)
+        self.assertIn("&amp;", markup)
+
+    def test_highlight_preserves_text(self):
+        """Test that highlighting does not change the code text."""
+        code = "  x = [1, 2]\n\n\ty = x\n"
+        markup = self.highlighter.highlight(code, "python")
+
+        text = markup
+        while "<span" in text:
+            start = text.index("<span")
+            text = text[:start] + text[text.index(">", start) + 1 :]
+        self.assertEqual(text.replace("</span>", ""), code)
+
+    def test_unknown_language(self):
+        """Test that unknown languages are left for the client."""
+        self.assertIsNone(self.highlighter.highlight("x", "no-such-language"))
+        self.assertIsNone(self.highlighter.highlight("x", ""))
+
+    def test_cache_by_language_and_code(self):
+        """Test that results are cached per language and code."""
+        first = self.highlighter.highlight("x = 1", "python")
+        second = self.highlighter.highlight("x = 1", "python")
+        self.highlighter.highlight("x = 1", "ruby")
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.highlighter), 2)
+
+    def test_cache_eviction(self):
+        """Test that the least recently used block is evicted."""
+        highlighter = CodeHighlighter(max_entries=2)
+        for i in range(3):
+            highlighter.highlight(f"x = {i}", "python")
+
+        self.assertEqual(len(highlighter), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
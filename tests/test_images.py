@@ -0,0 +1,174 @@
+"""Tests for the resized and re-encoded image variants."""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from markdeck import server
+from markdeck.assets import AssetStore
+from markdeck.images import ImageVariants, is_available
+from markdeck.server import app, set_presentation_file
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - exercised only without the extra
+    Image = None
+
+
+def _write_image(path: Path, size: tuple[int, int], image_format: str, mode: str = "RGB") -> None:
+    """Write a test image with a gradient, so it does not compress to nothing."""
+    image = Image.new(mode, size)
+    width, height = size
+    pixels = [(x % 256, y % 256, 128, (x + y) % 256) for y in range(height) for x in range(width)]
+    image.putdata([pixel[: len(mode)] for pixel in pixels])
+    image.save(path, format=image_format)
+
+
+@unittest.skipUnless(is_available(), "Pillow is not installed")
+class TestImageVariants(unittest.TestCase):
+    """Test the ImageVariants class."""
+
+    def setUp(self):
+        """Create a source image and an empty cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        directory = Path(self.temp_dir.name)
+        self.source = directory / "photo.png"
+        _write_image(self.source, (800, 400), "PNG")
+        self.store = AssetStore()
+        self.variants = ImageVariants(directory / "cache")
+
+    def tearDown(self):
+        """Remove the directories."""
+        self.temp_dir.cleanup()
+
+    def test_resize_keeps_aspect_ratio(self):
+        """Test that an image is scaled down to the rounded-up width."""
+        path = self.variants.get(self.store.stat(self.source), 300, None)
+
+        with Image.open(path) as image:
+            self.assertEqual(image.size, (320, 160))
+            self.assertEqual(image.format, "PNG")
+
+    def test_webp(self):
+        """Test that an image is re-encoded as WebP."""
+        path = self.variants.get(self.store.stat(self.source), None, "webp")
+
+        with Image.open(path) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, (800, 400))
+
+    def test_original_when_nothing_to_do(self):
+        """Test that the source is used when it is already small enough."""
+        self.assertIsNone(self.variants.get(self.store.stat(self.source), 1280, None))
+        self.assertIsNone(self.variants.get(self.store.stat(self.source), None, "png"))
+
+    def test_cached_on_disk(self):
+        """Test that a variant is made once and reused, also by a new instance."""
+        asset = self.store.stat(self.source)
+        path = self.variants.get(asset, 480, "webp")
+
+        other = ImageVariants(self.variants.directory)
+        with mock.patch.object(Image, "open", side_effect=AssertionError):
+            self.assertEqual(other.get(asset, 480, "webp"), path)
+
+    def test_new_variant_when_source_changes(self):
+        """Test that the cache is keyed by the content of the source."""
+        first = self.variants.get(self.store.stat(self.source), 320, None)
+        _write_image(self.source, (640, 640), "PNG")
+
+        second = self.variants.get(self.store.stat(self.source), 320, None)
+        self.assertNotEqual(first, second)
+        with Image.open(second) as image:
+            self.assertEqual(image.size, (320, 320))
+
+    def test_transparency_preserved(self):
+        """Test that an image with alpha keeps it as WebP, and loses it as JPEG."""
+        _write_image(self.source, (400, 200), "PNG", mode="RGBA")
+        asset = self.store.stat(self.source)
+
+        with Image.open(self.variants.get(asset, None, "webp")) as image:
+            self.assertEqual(image.mode, "RGBA")
+        with Image.open(self.variants.get(asset, None, "jpeg")) as image:
+            self.assertEqual(image.mode, "RGB")
+
+    def test_not_an_image(self):
+        """Test that other files and broken images are sent as they are."""
+        text = self.source.with_name("notes.txt")
+        text.write_text("hello")
+        broken = self.source.with_name("broken.png")
+        broken.write_bytes(b"not a png")
+
+        self.assertIsNone(self.variants.get(self.store.stat(text), 320, "webp"))
+        self.assertIsNone(self.variants.get(self.store.stat(broken), 320, "webp"))
+
+    def test_huge_image(self):
+        """Test that images too large to decode safely are sent as they are."""
+        with mock.patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            self.assertIsNone(self.variants.get(self.store.stat(self.source), 320, "webp"))
+
+    def test_prune(self):
+        """Test that the oldest variants are deleted over the size limit."""
+        asset = self.store.stat(self.source)
+        first = self.variants.get(asset, 640, "png")
+        self.variants.max_bytes = first.stat().st_size
+        second = self.variants.get(asset, 320, "png")
+
+        self.assertFalse(first.exists())
+        self.assertTrue(second.exists())
+
+
+@unittest.skipUnless(is_available(), "Pillow is not installed")
+class TestImageVariantsEndpoint(unittest.TestCase):
+    """Test requesting image variants from /assets."""
+
+    def setUp(self):
+        """Create a presentation with a large image."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        directory = Path(self.temp_dir.name)
+        (directory / "slides.md").write_text("# Slide\n\n![](photo.jpg)")
+        _write_image(directory / "photo.jpg", (1000, 500), "JPEG")
+        set_presentation_file(directory / "slides.md")
+        variants = ImageVariants(directory / "cache")
+        patcher = mock.patch.object(server, "image_variants", variants)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        """Clean up."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def test_sized_webp(self):
+        """Test that a smaller WebP version is sent, with validators."""
+        response = self.client.get("/assets/photo.jpg?width=480&format=webp")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "image/webp")
+        with Image.open(io.BytesIO(response.content)) as image:
+            self.assertEqual(image.size, (480, 240))
+
+        etag = response.headers["etag"]
+        response = self.client.get(
+            "/assets/photo.jpg?width=480&format=webp", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_original(self):
+        """Test that the original is sent without parameters."""
+        response = self.client.get("/assets/photo.jpg")
+        with Image.open(io.BytesIO(response.content)) as image:
+            self.assertEqual(image.size, (1000, 500))
+
+    def test_invalid_parameters(self):
+        """Test that unknown formats and widths are rejected."""
+        self.assertEqual(self.client.get("/assets/photo.jpg?format=bmp").status_code, 422)
+        self.assertEqual(self.client.get("/assets/photo.jpg?width=0").status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
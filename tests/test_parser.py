@@ -1,10 +1,15 @@
 """Tests for the markdown parser."""
 
+import gc
+import os
 import tempfile
+import tracemalloc
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from markdeck.parser import Slide, SlideParser
+from markdeck import parser as parser_module
+from markdeck.parser import ParseCache, Slide, SlideParser
 
 
 class TestSlide(unittest.TestCase):
@@ -524,12 +529,124 @@ Content 3"""
         result = parser.to_json()
 
         self.assertIn("slides", result)
+        self.assertEqual(result["title"], "Slide 1")
         self.assertIn("total", result)
         self.assertIn("title", result)
         self.assertEqual(result["total"], 2)
         self.assertEqual(len(result["slides"]), 2)
 
 
+class TestSinglePassScanner(unittest.TestCase):
+    """Test the single-pass slide scanner used by parse_content."""
+
+    def test_column_syntax_inside_code_block_untouched(self):
+        """Test that column syntax inside a fenced code block is not transformed."""
+        content = "```md\n:::columns\nA\n|||\nB\n:::\n```"
+        slides = SlideParser.parse_content(content)
+
+        self.assertEqual(slides[0].content, content)
+
+    def test_code_block_inside_column_is_kept(self):
+        """Test that separators and closers inside code blocks are ignored."""
+        content = ":::columns\nA\n```\n|||\n:::\n```\n|||\nB\n:::"
+        slides = SlideParser.parse_content(content)
+
+        self.assertEqual(
+            slides[0].content,
+            "<!-- COLUMN:LEFT:START -->\nA\n```\n|||\n:::\n```\n<!-- COLUMN:LEFT:END -->\n"
+            "<!-- COLUMN:RIGHT:START -->\nB\n<!-- COLUMN:RIGHT:END -->",
+        )
+
+    def test_unclosed_code_block_is_plain_text(self):
+        """Test that an unmatched fence does not protect the rest of the slide."""
+        content = "```\nunclosed\n\n:::columns\nA\n|||\nB\n:::"
+        slides = SlideParser.parse_content(content)
+
+        self.assertIn("<!-- COLUMN:LEFT:START -->", slides[0].content)
+        self.assertTrue(slides[0].content.startswith("```\nunclosed"))
+
+    def test_notes_inside_column_block(self):
+        """Test that notes inside a column block are cut before the transform."""
+        content = ":::columns\nLeft\n|||\nRight\n<!--NOTES: column notes -->\n:::"
+        slide = SlideParser.parse_content(content)[0]
+
+        self.assertEqual(slide.notes, "column notes")
+        self.assertTrue(slide.content.endswith("Right\n<!-- COLUMN:RIGHT:END -->"))
+
+    def test_consecutive_delimiters(self):
+        """Test that consecutive delimiters split like str.split."""
+        slides = SlideParser.parse_content("a\n---\n---\nb")
+
+        self.assertEqual([slide.content for slide in slides], ["a", "---\nb"])
+
+    def test_from_source_matches_constructor(self):
+        """Test that a slide built from a source span equals one built from text."""
+        source = "# Intro\n---\n<!--SLIDE:wide-->\n:::columns[70]\nL\n|||\nR\n:::\n<!--NOTES:n-->"
+        start = source.index("<!--SLIDE")
+        slide = Slide.from_source(source, start, len(source), 1)
+
+        self.assertEqual(slide.to_dict(), Slide(source[start:], 1).to_dict())
+
+
+class TestLazySlide(unittest.TestCase):
+    """Test that slides compute their fields lazily."""
+
+    def test_slides_have_no_instance_dict(self):
+        """Test that slides use __slots__ instead of a per-instance dict."""
+        slide = Slide("# Test", 0)
+
+        self.assertFalse(hasattr(slide, "__dict__"))
+
+    def test_fields_are_read_only(self):
+        """Test that the computed fields cannot be reassigned."""
+        slide = Slide("# Test", 0)
+
+        with self.assertRaises(AttributeError):
+            slide.content = "changed"
+
+    def test_parse_does_not_render(self):
+        """Test that parsing alone never runs the column transform."""
+        content = "# Deck\n---\n:::columns\nL\n|||\nR\n:::\n<!--NOTES: n -->"
+        with mock.patch.object(
+            parser_module, "_transform_columns", wraps=parser_module._transform_columns
+        ) as transform:
+            slides = SlideParser.parse_content(content)
+            self.assertEqual(slides[1].notes, "n")
+            self.assertIsNone(slides[1].width_mode)
+            self.assertTrue(slides[1].markdown.startswith(":::columns"))
+            transform.assert_not_called()
+
+            self.assertIn("<!-- COLUMN:LEFT:START -->", slides[1].content)
+            transform.assert_called_once()
+
+    def test_content_is_computed_once(self):
+        """Test that the rendered content is cached after first access."""
+        slide = Slide(":::columns\nL\n|||\nR\n:::", 0)
+
+        self.assertIs(slide.content, slide.content)
+
+    def test_lazy_slides_use_less_memory_than_source(self):
+        """Test that parsed slides keep offsets instead of copies of their text."""
+        body = "Some text on this slide. " * 40
+        content = "\n---\n".join(
+            f"# Slide {i}\n\n{body}\n<!--NOTES: notes {i} -->" for i in range(2000)
+        )
+
+        tracemalloc.start()
+        try:
+            slides = SlideParser.parse_content(content)
+            lazy_bytes = tracemalloc.get_traced_memory()[0]
+            for slide in slides:
+                slide.content
+            rendered_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        per_slide = lazy_bytes / len(slides)
+        self.assertLess(per_slide, len(content) / len(slides) / 4)
+        self.assertLess(lazy_bytes, rendered_bytes / 4)
+
+
 class TestSlideParserWithFiles(unittest.TestCase):
     """Test SlideParser with actual files."""
 
@@ -571,6 +688,55 @@ Conclusion"""
             self.assertEqual(slides[1].notes, "Speaker notes for testing")
             self.assertEqual(slides[2].index, 2)
 
+    def test_iter_slides_matches_parse(self):
+        """Test that iter_slides yields the same slides as parse."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "test.md"
+            content = """---
+<!--SLIDE:wide-->
+# First
+
+:::columns
+Left
+|||
+Right
+:::
+
+---
+
+---
+
+# Second ünicode
+
+<!--NOTES: notes -->
+---"""
+            test_file.write_text(content, encoding="utf-8")
+
+            parser = SlideParser(test_file)
+            streamed = [slide.to_dict() for slide in parser.iter_slides()]
+
+            self.assertEqual(streamed, [slide.to_dict() for slide in parser.parse()])
+
+    def test_iter_slides_crlf(self):
+        """Test that iter_slides handles CRLF and CR line endings like parse."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "crlf.md"
+            test_file.write_bytes(b"# One\r\n\r\n---\r\n# Two\r---\r# Three\r\nEnd")
+
+            parser = SlideParser(test_file)
+            streamed = [slide.to_dict() for slide in parser.iter_slides()]
+
+            self.assertEqual(len(streamed), 3)
+            self.assertEqual(streamed, [slide.to_dict() for slide in parser.parse()])
+
+    def test_iter_slides_empty_file(self):
+        """Test that iter_slides yields nothing for an empty file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "empty.md"
+            test_file.write_text("", encoding="utf-8")
+
+            self.assertEqual(list(SlideParser(test_file).iter_slides()), [])
+
     def test_get_title_fallback_to_filename(self):
         """Test title fallback to filename when no H1 present."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -583,5 +749,436 @@ Conclusion"""
             self.assertEqual(title, "my-presentation")
 
 
+class TestIncrementalParse(unittest.TestCase):
+    """Test incremental parsing against a previous deck version."""
+
+    def setUp(self):
+        """Parse a base version of a deck."""
+        self.old_content = "\n---\n".join(f"# Slide {i}\n\nBody {i}" for i in range(6))
+        self.old = SlideParser.parse_deck(self.old_content, "deck", "v1")
+
+    def reparse(self, content):
+        """Parse a new version incrementally and check it against a full parse."""
+        deck = SlideParser.parse_deck(content, "deck", "v2", self.old)
+        full = SlideParser.parse_content(content)
+        self.assertEqual([s.to_dict() for s in deck.slides], [s.to_dict() for s in full])
+        return deck
+
+    def test_full_parse_has_no_changes(self):
+        """Test that a deck parsed from scratch reports no changes."""
+        self.assertIsNone(self.old.changes)
+
+    def test_modified_slide(self):
+        """Test that editing one slide only rebuilds that slide."""
+        metadata = [slide.metadata for slide in self.old.slides]
+        deck = self.reparse(self.old_content.replace("Body 3", "Body three"))
+
+        self.assertEqual(deck.changes.modified, (3,))
+        self.assertEqual(deck.changes.added, ())
+        self.assertEqual(deck.changes.removed, ())
+        for i in (0, 1, 2, 4, 5):
+            self.assertIs(deck.slides[i].metadata, metadata[i])
+        self.assertIsNot(deck.slides[3].metadata, metadata[3])
+
+    def test_reused_slides_reference_only_new_source(self):
+        """Test that a deck reparsed many times does not keep older sources alive."""
+        deck = self.old
+        for version in range(5):
+            for slide in deck.slides:
+                slide.to_dict()
+            content = self.old_content.replace("Body 3", f"Body {version} edited")
+            deck = SlideParser.parse_deck(content, "deck", f"v{version}", deck)
+
+        for slide in deck.slides:
+            slide.to_dict()
+            referents = gc.get_referents(slide)
+            referents += [item for ref in referents if isinstance(ref, tuple) for item in ref]
+            sources = [
+                ref
+                for ref in referents
+                if isinstance(ref, str) and len(ref) > len(deck.source) // 2
+            ]
+            self.assertTrue(all(source is deck.source for source in sources))
+
+    def test_added_slide(self):
+        """Test that inserting a slide reports it and shifts later slides."""
+        content = self.old_content.replace("Body 1", "Body 1\n---\n# Inserted")
+        deck = self.reparse(content)
+
+        self.assertEqual(deck.changes.added, (2,))
+        self.assertEqual(deck.changes.modified, ())
+        self.assertEqual(deck.slides[3].content, self.old.slides[2].content)
+        self.assertEqual(deck.slides[3].index, 3)
+        self.assertEqual(self.old.slides[2].index, 2)
+
+    def test_removed_slide(self):
+        """Test that deleting a slide reports its old id."""
+        content = self.old_content.replace("\n---\n# Slide 4\n\nBody 4", "")
+        deck = self.reparse(content)
+
+        self.assertEqual(deck.changes.removed, (4,))
+        self.assertEqual(len(deck.slides), 5)
+
+    def test_unchanged_content(self):
+        """Test that identical content reports an empty diff."""
+        deck = self.reparse(self.old_content)
+
+        self.assertTrue(deck.changes.is_empty())
+
+    def test_title_follows_first_slide(self):
+        """Test that editing the first slide updates the title."""
+        deck = self.reparse(self.old_content.replace("# Slide 0", "# New Title"))
+
+        self.assertEqual(deck.title, "New Title")
+
+    def test_diff_across_versions(self):
+        """Test diffing against a version the deck was not parsed against."""
+        middle = self.reparse(self.old_content.replace("Body 1", "Body one"))
+        content = middle.source.replace("Body 4", "Body 4\n---\n# Inserted")
+        latest = SlideParser.parse_deck(content, "deck", "v3", middle)
+
+        self.assertEqual(latest.changes.modified, ())
+        changes = latest.diff(self.old)
+        self.assertEqual(changes.modified, (1, 2, 3, 4))
+        self.assertEqual(changes.added, (5,))
+        self.assertEqual(changes.removed, ())
+        self.assertTrue(latest.diff(latest).is_empty())
+
+
+class TestSlideMetadata(unittest.TestCase):
+    """Test the per-slide metadata index."""
+
+    def test_headings(self):
+        """Test that headings outside fenced code are collected with their level."""
+        slide = Slide("# Title #\n\nText\n\n```bash\n# comment\n```\n\n### Sub", 0)
+
+        self.assertEqual(slide.metadata.headings, ((1, "Title"), (3, "Sub")))
+
+    def test_flags(self):
+        """Test the content flags."""
+        slide = Slide("```mermaid\ngraph TD\n```\n\nMath $x^2$ and <img src='a.png'>", 0)
+        metadata = slide.metadata
+
+        self.assertTrue(metadata.has_mermaid)
+        self.assertFalse(metadata.has_code)
+        self.assertTrue(metadata.has_math)
+        self.assertTrue(metadata.has_images)
+        self.assertFalse(metadata.has_notes)
+
+    def test_deck_features(self):
+        """Test that the deck reports which optional viewer features it uses."""
+        deck = SlideParser.parse_deck("# A\n\n$$x$$\n\n---\n\n# B", "Deck", "v1")
+        self.assertEqual(deck.features(), {"math": True, "mermaid": False})
+
+        deck = SlideParser.parse_deck("# A\n\n```mermaid\ngraph TD\n```", "Deck", "v2")
+        self.assertEqual(deck.features(), {"math": False, "mermaid": True})
+
+    def test_math_with_spaces(self):
+        """Test that math with spaces inside the dollar signs is found, as KaTeX renders it."""
+        self.assertTrue(Slide("Energy: $ E = mc^2 $", 0).metadata.has_math)
+
+    def test_mermaid_html(self):
+        """Test that diagrams in raw HTML containers count as Mermaid."""
+        slide = Slide('<div class="mermaid">\ngraph TD\n</div>', 0)
+
+        self.assertTrue(slide.metadata.has_mermaid)
+        self.assertFalse(Slide('<div class="diagram">x</div>', 0).metadata.has_mermaid)
+
+    def test_plain_dollars_are_not_math(self):
+        """Test that a lone dollar sign does not count as math."""
+        self.assertFalse(Slide("It costs $5", 0).metadata.has_math)
+
+    def test_word_count(self):
+        """Test that words are counted outside code, link targets and column syntax."""
+        content = (
+            "## Two words\n\n:::columns[60]\nSee [the docs](https://example.com/a/b)\n"
+            "|||\n<b>bold</b>\n:::\n\n```python\nnot counted\n```"
+        )
+        self.assertEqual(Slide(content, 0).metadata.word_count, 6)
+
+    def test_notes(self):
+        """Test that notes presence is recorded."""
+        self.assertTrue(Slide("# A\n<!--NOTES: hi -->", 0).metadata.has_notes)
+
+    def test_title_ignores_code(self):
+        """Test that the title is not taken from a comment in fenced code."""
+        deck = SlideParser.parse_deck("```bash\n# install\n```\n\n# Real Title", "fb", "v1")
+
+        self.assertEqual(deck.title, "Real Title")
+
+    def test_outline_shared_by_reused_slides(self):
+        """Test that an incremental parse reuses the metadata of unchanged slides."""
+        old = SlideParser.parse_deck("# A\n---\n## B\n---\n## C", "fb", "v1")
+        old.outline()
+        new = SlideParser.parse_deck("# A\n---\n## B2\n---\n## C", "fb", "v2", old)
+
+        self.assertIs(new.slides[0].metadata, old.slides[0].metadata)
+        self.assertEqual([child["title"] for child in new.outline()[0]["children"]], ["B2", "C"])
+
+
+class TestParallelParse(unittest.TestCase):
+    """Test parsing in a process pool."""
+
+    CONTENT = "\n---\n".join(
+        [
+            "<!--SLIDE:wide-->\n# Title\n\n:::columns[70]\nLeft\n|||\nRight\n:::",
+            "# Notes\n\n<!--NOTES: say hello -->\nBody",
+            "```python\n:::columns\n```",
+        ]
+        * 20
+    )
+
+    def setUp(self):
+        """Make every source large enough and pretend there are several CPUs."""
+        for patcher in (
+            mock.patch.object(SlideParser, "PARALLEL_THRESHOLD", 0),
+            mock.patch.object(parser_module, "_PARALLEL_CHUNK_SIZE", 200),
+            mock.patch.object(parser_module.os, "cpu_count", return_value=2),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_parse_deck_matches_sequential(self):
+        """Test that a parallel parse yields the same slides, in order."""
+        deck = SlideParser.parse_deck(self.CONTENT, "deck", "v1", parallel=True)
+        expected = [slide.to_dict() for slide in SlideParser.parse_content(self.CONTENT)]
+
+        self.assertEqual([slide.to_dict() for slide in deck.slides], expected)
+        self.assertEqual(deck.title, "Title")
+
+    def test_iter_slides_matches_sequential(self):
+        """Test that parallel streaming yields the same slides, in order."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = Path(tmp_dir) / "large.md"
+            test_file.write_text(self.CONTENT, encoding="utf-8")
+
+            parser = SlideParser(test_file)
+            streamed = [slide.to_dict() for slide in parser.iter_slides(parallel=True)]
+
+            self.assertEqual(streamed, [slide.to_dict() for slide in parser.iter_slides()])
+
+    def test_workers_are_spawned(self):
+        """Test that workers are started fresh, not forked from the server's threads."""
+        executor = parser_module.ProcessPoolExecutor
+        with mock.patch.object(parser_module, "ProcessPoolExecutor", wraps=executor) as pool:
+            SlideParser.parse_deck(self.CONTENT, "deck", "v1", parallel=True)
+
+        self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+
+    def test_small_source_stays_sequential(self):
+        """Test that sources below the threshold do not start a process pool."""
+        with (
+            mock.patch.object(SlideParser, "PARALLEL_THRESHOLD", len(self.CONTENT) + 1),
+            mock.patch.object(parser_module, "ProcessPoolExecutor") as pool,
+        ):
+            deck = SlideParser.parse_deck(self.CONTENT, "deck", "v1", parallel=True)
+
+        pool.assert_not_called()
+        self.assertEqual(len(deck.slides), 60)
+
+
+class TestParseCache(unittest.TestCase):
+    """Test the version-keyed parse cache."""
+
+    def setUp(self):
+        """Set up a temporary directory and a private cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ParseCache()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def write(self, name, content, mtime_ns=None):
+        """Write a markdown file, optionally with a fixed mtime."""
+        path = Path(self.temp_dir.name) / name
+        path.write_text(content, encoding="utf-8")
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_same_version_returns_same_deck(self):
+        """Test that an unchanged file returns the very same deck object."""
+        path = self.write("deck.md", "# Title\n---\n# Two")
+
+        first = self.cache.get(path)
+        second = self.cache.get(path)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.title, "Title")
+        self.assertEqual(len(first.slides), 2)
+        self.assertIsInstance(first.slides, tuple)
+
+    def test_changed_file_is_reparsed(self):
+        """Test that a new version of the file produces a new deck."""
+        path = self.write("deck.md", "# Old", mtime_ns=1_000_000_000)
+        old = self.cache.get(path)
+
+        self.write("deck.md", "# New title", mtime_ns=2_000_000_000)
+        new = self.cache.get(path)
+
+        self.assertIsNot(old, new)
+        self.assertEqual(new.title, "New title")
+        self.assertNotEqual(old.version, new.version)
+        self.assertEqual(new.changes.modified, (0,))
+
+    def test_touched_file_reuses_parse(self):
+        """Test that a new mtime with identical content reuses the parsed deck."""
+        path = self.write("deck.md", "# Same", mtime_ns=1_000_000_000)
+        first = self.cache.get(path)
+
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        second = self.cache.get(path)
+
+        self.assertIs(first, second)
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used version is evicted first."""
+        cache = ParseCache(max_entries=2)
+        paths = [self.write(f"deck{i}.md", f"# Deck {i}") for i in range(3)]
+
+        first = cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])
+        cache.get(paths[2])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(paths[0]), first)
+
+    def test_eviction_by_memory_cap(self):
+        """Test that entries are evicted once the memory cap is exceeded."""
+        cache = ParseCache(max_bytes=100)
+        small = self.write("small.md", "# Small")
+        large = self.write("large.md", "# Large\n\n" + "x" * 200)
+
+        cache.get(small)
+        cache.get(large)
+
+        self.assertEqual(len(cache), 1)
+
+    def test_peek_does_not_parse(self):
+        """Test that peek only returns an up-to-date cached deck."""
+        path = self.write("deck.md", "# Old", mtime_ns=1_000_000_000)
+        self.assertIsNone(self.cache.peek(path))
+
+        deck = self.cache.get(path)
+        self.assertIs(self.cache.peek(path), deck)
+
+        self.write("deck.md", "# New", mtime_ns=2_000_000_000)
+        self.assertIsNone(self.cache.peek(path))
+
+    def test_crlf_line_endings(self):
+        """Test that CRLF files parse like with universal newlines."""
+        path = Path(self.temp_dir.name) / "crlf.md"
+        path.write_bytes(b"# One\r\n---\r\n# Two")
+
+        deck = self.cache.get(path)
+
+        self.assertEqual([slide.content for slide in deck.slides], ["# One", "# Two"])
+
+    def test_to_json_parses_once(self):
+        """Test that to_json does not parse the file a second time for the title."""
+        parser = SlideParser.__new__(SlideParser)
+        parser.file_path = Path("test.md")
+        calls = []
+        slides = SlideParser.parse_content("# Title\n---\n# Two")
+
+        def mock_parse():
+            calls.append(1)
+            return slides
+
+        parser.parse = mock_parse
+        parser.to_json()
+
+        self.assertEqual(len(calls), 1)
+
+
+class TestIncludes(unittest.TestCase):
+    """Test include directives and per-file caching."""
+
+    def setUp(self):
+        """Set up a deck assembled from section files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        (self.root / "sections").mkdir()
+        self.cache = ParseCache()
+        self.deck = self.write("deck.md", "# Deck\n---\n<!--INCLUDE: sections/a.md-->\n---\n# End")
+        self.write("sections/a.md", "## A1\n---\n## A2\n<!-- include: b.md -->\n")
+        self.write("sections/b.md", "B text")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def write(self, name, content, mtime_ns=1_000_000_000):
+        """Write a file with a fixed mtime."""
+        path = self.root / name
+        path.write_text(content, encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_includes_are_spliced(self):
+        """Test that included files contribute slides, recursively."""
+        deck = self.cache.get(self.deck)
+
+        self.assertEqual(
+            [slide.content for slide in deck.slides], ["# Deck", "## A1", "## A2\nB text", "# End"]
+        )
+        self.assertEqual([Path(name).name for name in deck.files], ["deck.md", "a.md", "b.md"])
+
+    def test_directive_in_code_is_ignored(self):
+        """Test that include directives in fenced code stay as they are."""
+        self.write("deck.md", "```\n<!--INCLUDE: missing.md-->\n```")
+
+        deck = self.cache.get(self.deck)
+
+        self.assertIn("<!--INCLUDE: missing.md-->", deck.slides[0].content)
+        self.assertEqual(len(deck.files), 1)
+
+    def test_editing_included_file_reads_only_that_file(self):
+        """Test that an edited section is read again and only its slides change."""
+        old = self.cache.get(self.deck)
+        metadata = old.slides[1].metadata
+
+        self.write("sections/b.md", "B edited", mtime_ns=2_000_000_000)
+        with mock.patch("pathlib.Path.open", autospec=True, side_effect=Path.open) as opened:
+            new = self.cache.get(self.deck)
+
+        self.assertEqual([call.args[0].name for call in opened.call_args_list], ["b.md"])
+        self.assertEqual(new.changes.modified, (2,))
+        self.assertEqual(new.slides[1].content, old.slides[1].content)
+        self.assertIs(new.slides[1].metadata, metadata)
+
+    def test_unchanged_files_are_not_read(self):
+        """Test that an unchanged presentation is served without reading any file."""
+        first = self.cache.get(self.deck)
+
+        with mock.patch("pathlib.Path.open", autospec=True, side_effect=Path.open) as opened:
+            second = self.cache.get(self.deck)
+
+        opened.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_include_cycle(self):
+        """Test that include cycles are reported."""
+        self.write("sections/b.md", "<!--INCLUDE: a.md-->", mtime_ns=2_000_000_000)
+
+        with self.assertRaisesRegex(ValueError, "a.md -> b.md -> a.md"):
+            self.cache.get(self.deck)
+
+    def test_missing_include(self):
+        """Test that a missing included file names the including file."""
+        self.write("sections/b.md", "<!--INCLUDE: gone.md-->", mtime_ns=2_000_000_000)
+
+        with self.assertRaisesRegex(FileNotFoundError, "gone.md.*included from b.md"):
+            self.cache.get(self.deck)
+
+    def test_iter_slides_resolves_includes(self):
+        """Test that streaming a deck with includes yields the assembled slides."""
+        slides = SlideParser(self.deck).iter_slides()
+
+        self.assertEqual([slide.content for slide in slides][1:3], ["## A1", "## A2\nB text"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the server-side slide renderer."""
+
+import unittest
+
+from markdeck import highlighter
+from markdeck.parser import Slide
+from markdeck.renderer import SlideRenderer
+
+
+class TestSlideRenderer(unittest.TestCase):
+    """Test the SlideRenderer class."""
+
+    def setUp(self):
+        """Set up a private renderer."""
+        self.renderer = SlideRenderer()
+
+    def test_renders_markdown(self):
+        """Test basic markdown rendering."""
+        html = self.renderer.render(Slide("# Title\n\nSome **bold** text", 0))
+
+        self.assertIn("<h1>Title</h1>", html)
+        self.assertIn("<strong>bold</strong>", html)
+
+    def test_line_breaks(self):
+        """Test that single newlines become line breaks, like marked's breaks option."""
+        html = self.renderer.render(Slide("line one\nline two", 0))
+
+        self.assertIn("<br", html)
+
+    def test_tables(self):
+        """Test that GFM-style tables are rendered."""
+        html = self.renderer.render(Slide("| a | b |\n|---|---|\n| 1 | 2 |", 0))
+
+        self.assertIn("<table>", html)
+        self.assertIn("<td>1</td>", html)
+
+    def test_list_after_paragraph(self):
+        """Test that a list right after a paragraph line is a list, as in marked."""
+        html = self.renderer.render(Slide("Text\n- item\n- item2", 0))
+
+        self.assertIn("<p>Text</p>", html)
+        self.assertIn("<li>item</li>", html)
+        self.assertIn("<li>item2</li>", html)
+
+    def test_nested_list_two_spaces(self):
+        """Test that a list indented by two spaces is nested."""
+        html = self.renderer.render(Slide("- a\n  - b", 0))
+
+        self.assertRegex(html, r"<li>a\s*<ul>\s*<li>b</li>\s*</ul>\s*</li>")
+
+    def test_gfm_extensions(self):
+        """Test strikethrough, task lists and bare URLs, as marked renders them."""
+        html = self.renderer.render(
+            Slide("~~old~~ see https://example.com\n\n- [ ] todo\n- [x] done", 0)
+        )
+
+        self.assertIn("<del>old</del>", html)
+        self.assertIn('<a href="https://example.com">https://example.com</a>', html)
+        self.assertRegex(html, r'<input [^>]*type="checkbox"[^>]*> todo')
+        self.assertRegex(html, r"<input [^>]*checked[^>]*> done")
+
+    def test_code_block_language(self):
+        """Test that fenced code keeps its language class."""
+        html = self.renderer.render(Slide("```python\nx = '<b>'\n```", 0))
+
+        self.assertRegex(html, r'<code class="(hljs )?language-python">')
+        self.assertIn("&lt;b&gt;", html)
+
+    @unittest.skipUnless(highlighter.is_available(), "Pygments is not installed")
+    def test_code_block_highlighted(self):
+        """Test that labeled code blocks are highlighted on the server."""
+        html = self.renderer.render(Slide("```python\ndef f(): pass\n```\n\n```\nplain\n```", 0))
+
+        self.assertIn('<code class="hljs language-python">', html)
+        self.assertIn('<span class="hljs-keyword">def</span>', html)
+        self.assertIn("<pre><code>plain", html)
+
+    def test_mermaid_container(self):
+        """Test that mermaid blocks become mermaid containers."""
+        html = self.renderer.render(Slide("```mermaid\ngraph TD; A-->B\n```", 0))
+
+        self.assertIn('<div class="mermaid">', html)
+        self.assertNotIn("<pre>", html)
+
+    def test_columns(self):
+        """Test that column markers become the two-column layout."""
+        slide = Slide("# Intro\n\n:::columns[60]\n**Left**\n|||\nRight\n:::\n\nOutro", 0)
+        html = self.renderer.render(slide)
+
+        self.assertIn('<div class="columns-container">', html)
+        self.assertIn('<div class="column-left" style="flex: 0 0 60%;">', html)
+        self.assertIn('<div class="column-right" style="flex: 1;">', html)
+        self.assertIn("<strong>Left</strong>", html)
+        self.assertTrue(html.startswith("<h1>Intro</h1>"))
+        self.assertTrue(html.endswith("<p>Outro</p>"))
+
+    def test_cache_by_content(self):
+        """Test that slides with the same content share one cached rendering."""
+        first = self.renderer.render(Slide("# Same", 0))
+        second = self.renderer.render(Slide("# Same", 7))
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.renderer), 1)
+
+    def test_cache_eviction(self):
+        """Test that the least recently used rendering is evicted."""
+        renderer = SlideRenderer(max_entries=2)
+        for i in range(3):
+            renderer.render(Slide(f"# Slide {i}", i))
+
+        self.assertEqual(len(renderer), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,31 @@
 """Tests for the FastAPI server."""
 
+import asyncio
+import json
+import os
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from fastapi.testclient import TestClient
 
-from markdeck.server import app, set_presentation_file
+from markdeck import server
+from markdeck.bundle import static_bundle
+from markdeck.clients import ClientConnection
+from markdeck.encoding import body_cache
+from markdeck.parser import SlideParser, parse_cache
+from markdeck.server import (
+    app,
+    enable_follow_mode,
+    enable_prerender,
+    get_presenter_key,
+    load_deck,
+    set_presentation_file,
+)
+from markdeck.terminal import terminal_writer
 
 
 class TestHealthEndpoint(unittest.TestCase):
@@ -112,6 +131,721 @@ Final slide"""
         self.assertEqual(slide_with_notes["notes"], "Test notes")
         self.assertNotIn("NOTES", slide_with_notes["content"])
 
+    def test_no_html_by_default(self):
+        """Test that slides carry no pre-rendered HTML unless enabled."""
+        set_presentation_file(self.sample_file)
+        response = self.client.get("/api/slides")
+
+        self.assertNotIn("html", response.json()["slides"][0])
+
+    def test_prerendered_html(self):
+        """Test that pre-rendered HTML is returned next to the markdown."""
+        set_presentation_file(self.sample_file)
+        enable_prerender(True)
+        try:
+            response = self.client.get("/api/slides")
+        finally:
+            enable_prerender(False)
+
+        slide = response.json()["slides"][0]
+        self.assertEqual(slide["content"], "# Test Presentation\n\nFirst slide")
+        self.assertIn("<h1>Test Presentation</h1>", slide["html"])
+
+
+class TestSlidesConditionalRequests(unittest.TestCase):
+    """Test ETag and Last-Modified handling of the slides endpoint."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "test.md"
+        self.sample_file.write_text("# One\n---\n# Two", encoding="utf-8")
+        os.utime(self.sample_file, (1_700_000_000, 1_700_000_000))
+        set_presentation_file(self.sample_file)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def test_validators(self):
+        """Test that responses carry an ETag and Last-Modified."""
+        response = self.client.get("/api/slides")
+
+        self.assertRegex(response.headers["etag"], r'^"[0-9a-f]+"$')
+        self.assertEqual(response.headers["last-modified"], "Tue, 14 Nov 2023 22:13:20 GMT")
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+    def test_if_none_match(self):
+        """Test that a matching ETag gets 304 with no body."""
+        etag = self.client.get("/api/slides").headers["etag"]
+
+        response = self.client.get("/api/slides", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+
+    def test_changed_file_gets_new_etag(self):
+        """Test that a stale ETag gets the new slides."""
+        etag = self.client.get("/api/slides").headers["etag"]
+        self.sample_file.write_text("# One\n---\n# Changed", encoding="utf-8")
+
+        response = self.client.get("/api/slides", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+        self.assertEqual(response.json()["slides"][1]["content"], "# Changed")
+
+    def test_prerender_changes_etag(self):
+        """Test that responses with and without HTML have different ETags."""
+        etag = self.client.get("/api/slides").headers["etag"]
+        enable_prerender(True)
+        try:
+            response = self.client.get("/api/slides", headers={"If-None-Match": etag})
+        finally:
+            enable_prerender(False)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("html", response.json()["slides"][0])
+
+    def test_compressed_variants(self):
+        """Test that large bodies are served gzip-compressed with their own ETag."""
+        self.sample_file.write_text(
+            "\n---\n".join(f"# Slide {i}\n\nSome text" for i in range(50)), encoding="utf-8"
+        )
+        plain = self.client.get("/api/slides", headers={"Accept-Encoding": "identity"})
+        compressed = self.client.get("/api/slides", headers={"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("content-encoding", plain.headers)
+        self.assertEqual(compressed.headers["content-encoding"], "gzip")
+        self.assertEqual(compressed.headers["vary"], "Accept-Encoding")
+        self.assertEqual(compressed.json(), plain.json())
+        self.assertEqual(compressed.headers["etag"], plain.headers["etag"][:-1] + '-gzip"')
+
+        revalidated = self.client.get(
+            "/api/slides", headers={"If-None-Match": compressed.headers["etag"]}
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since against the file mtime."""
+        current = self.client.get(
+            "/api/slides", headers={"If-Modified-Since": "Tue, 14 Nov 2023 22:13:20 GMT"}
+        )
+        stale = self.client.get(
+            "/api/slides", headers={"If-Modified-Since": "Tue, 14 Nov 2023 22:13:19 GMT"}
+        )
+
+        self.assertEqual(current.status_code, 304)
+        self.assertEqual(stale.status_code, 200)
+
+    def test_if_none_match_takes_precedence(self):
+        """Test that If-Modified-Since is ignored when If-None-Match is present."""
+        response = self.client.get(
+            "/api/slides",
+            headers={
+                "If-None-Match": '"stale"',
+                "If-Modified-Since": "Tue, 14 Nov 2023 22:13:20 GMT",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+
+class TestProgressiveLoading(unittest.TestCase):
+    """Test the range, single-slide and manifest endpoints."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "deck.md"
+        self.sample_file.write_text(
+            "# Deck\n---\nNo heading\n---\n## Three\n<!--NOTES: n -->", encoding="utf-8"
+        )
+        set_presentation_file(self.sample_file)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def test_range(self):
+        """Test fetching a range of slides."""
+        data = self.client.get("/api/slides?start=1&count=1").json()
+
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(data["start"], 1)
+        self.assertEqual([slide["id"] for slide in data["slides"]], [1])
+        self.assertEqual(data["title"], "Deck")
+
+    def test_range_to_end(self):
+        """Test that a range without count runs to the last slide."""
+        data = self.client.get("/api/slides?start=1").json()
+
+        self.assertEqual([slide["id"] for slide in data["slides"]], [1, 2])
+
+    def test_invalid_range(self):
+        """Test that negative range bounds are rejected."""
+        self.assertEqual(self.client.get("/api/slides?start=-1").status_code, 422)
+
+    def test_single_slide(self):
+        """Test fetching one slide."""
+        response = self.client.get("/api/slides/2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["notes"], "n")
+        self.assertIn("etag", response.headers)
+
+    def test_single_slide_not_found(self):
+        """Test fetching a slide that does not exist."""
+        self.assertEqual(self.client.get("/api/slides/3").status_code, 404)
+
+    def test_manifest(self):
+        """Test the manifest of slide ids, titles and hashes."""
+        data = self.client.get("/api/manifest").json()
+
+        self.assertEqual(data["total"], 3)
+        self.assertEqual([entry["title"] for entry in data["slides"]], ["Deck", None, "Three"])
+        self.assertEqual(len({entry["hash"] for entry in data["slides"]}), 3)
+
+    def test_manifest_hash_follows_content(self):
+        """Test that only the hash of an edited slide changes."""
+        before = self.client.get("/api/manifest").json()["slides"]
+        self.sample_file.write_text(
+            "# Deck\n---\nEdited\n---\n## Three\n<!--NOTES: n -->", encoding="utf-8"
+        )
+        after = self.client.get("/api/manifest").json()["slides"]
+
+        self.assertEqual(
+            [a["hash"] == b["hash"] for a, b in zip(before, after)], [True, False, True]
+        )
+
+
+class TestNdjsonEndpoint(unittest.TestCase):
+    """Test the streaming NDJSON endpoint."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "stream.md"
+        self.sample_file.write_text(
+            "# Streamed\n---\nTwo\n<!--NOTES: n -->\n---\nThree", encoding="utf-8"
+        )
+        set_presentation_file(self.sample_file)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def read_lines(self):
+        """Fetch the stream and decode its lines."""
+        response = self.client.get("/api/slides.ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_stream_lines(self):
+        """Test the deck, slide and end lines of a stream parsed on the fly."""
+        parse_cache.clear()
+        lines = self.read_lines()
+
+        self.assertEqual(lines[0], {"type": "deck", "title": "Streamed"})
+        self.assertEqual([line["type"] for line in lines[1:4]], ["slide"] * 3)
+        self.assertEqual(lines[2]["slide"]["notes"], "n")
+        self.assertEqual(lines[-1], {"type": "end", "total": 3})
+
+    def test_stream_matches_slides_endpoint(self):
+        """Test that a cached deck streams the same slides as /api/slides."""
+        slides = self.client.get("/api/slides").json()["slides"]
+
+        streamed = [line["slide"] for line in self.read_lines() if line["type"] == "slide"]
+
+        self.assertEqual(streamed, slides)
+
+    def test_empty_deck(self):
+        """Test that an empty deck still has a deck and an end line."""
+        self.sample_file.write_text("", encoding="utf-8")
+
+        lines = self.read_lines()
+
+        self.assertEqual(lines, [{"type": "deck", "title": "stream"}, {"type": "end", "total": 0}])
+
+    def test_parse_error(self):
+        """Test that a parse failure ends the stream with an error line."""
+        self.sample_file.write_bytes(b"# Bad \xff")
+        parse_cache.clear()
+
+        lines = self.read_lines()
+
+        self.assertEqual(lines[-1]["type"], "error")
+
+
+class TestOutlineEndpoint(unittest.TestCase):
+    """Test the outline API endpoint."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "outline.md"
+        content = """# Deck Title
+
+## Part One
+
+---
+
+### Detail
+
+```python
+# not a heading
+```
+
+<!--NOTES: remember this -->
+
+---
+
+## Part Two
+
+![Diagram](diagram.png)"""
+        self.sample_file.write_text(content, encoding="utf-8")
+        set_presentation_file(self.sample_file)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def test_outline_tree(self):
+        """Test that headings nest across slides."""
+        response = self.client.get("/api/outline")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["title"], "Deck Title")
+        self.assertEqual(data["total"], 3)
+
+        (root,) = data["outline"]
+        self.assertEqual(root["title"], "Deck Title")
+        self.assertEqual([child["title"] for child in root["children"]], ["Part One", "Part Two"])
+        self.assertEqual(root["children"][0]["children"][0]["title"], "Detail")
+        self.assertEqual(root["children"][0]["children"][0]["slide"], 1)
+
+    def test_slide_metadata(self):
+        """Test the per-slide metadata of the index."""
+        slides = self.client.get("/api/outline").json()["slides"]
+
+        self.assertEqual(slides[1]["headings"], [{"level": 3, "text": "Detail"}])
+        self.assertTrue(slides[1]["has_code"])
+        self.assertTrue(slides[1]["has_notes"])
+        self.assertFalse(slides[0]["has_notes"])
+        self.assertTrue(slides[2]["has_images"])
+
+    def test_outline_no_file(self):
+        """Test getting the outline without a file."""
+        set_presentation_file(None)
+        response = self.client.get("/api/outline")
+        self.assertEqual(response.status_code, 400)
+
+
+class TestLogNotesEndpoint(unittest.TestCase):
+    """Test the speaker notes logging endpoint."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "notes.md"
+        self.sample_file.write_text(
+            "# One\n\n<!--NOTES: first notes -->\n\n---\n\n# Two", encoding="utf-8"
+        )
+        set_presentation_file(self.sample_file)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        set_presentation_file(None)
+        self.temp_dir.cleanup()
+
+    def test_notes_written_by_terminal_writer(self):
+        """Test that the notes reach the terminal through the writer."""
+        with mock.patch("markdeck.terminal.click.echo") as echo:
+            response = self.client.post("/api/log-notes", json={"slide_index": 0})
+            self.assertTrue(terminal_writer.flush(timeout=5))
+
+        self.assertEqual(response.status_code, 200)
+        (output,) = [call.args[0] for call in echo.call_args_list]
+        self.assertIn("Slide 1 / 2", output)
+        self.assertIn("first notes", output)
+
+    def test_slide_without_notes(self):
+        """Test logging a slide that has no notes."""
+        with mock.patch("markdeck.terminal.click.echo") as echo:
+            response = self.client.post("/api/log-notes", json={"slide_index": 1})
+            terminal_writer.flush(timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("No speaker notes", echo.call_args.args[0])
+
+    def test_uses_cached_deck(self):
+        """Test that the slides are not re-parsed for every notification."""
+        self.client.post("/api/log-notes", json={"slide_index": 0})
+        with mock.patch("markdeck.parser.SlideParser.parse_deck") as parse_deck:
+            response = self.client.post("/api/log-notes", json={"slide_index": 1})
+        terminal_writer.flush(timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        parse_deck.assert_not_called()
+
+    def test_invalid_index(self):
+        """Test that an out-of-range index is rejected."""
+        response = self.client.post("/api/log-notes", json={"slide_index": 5})
+        self.assertEqual(response.status_code, 400)
+
+
+class TestLoadDeck(unittest.TestCase):
+    """Test loading presentations off the event loop."""
+
+    def setUp(self):
+        """Set up a sample file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "deck.md"
+        self.sample_file.write_text("# One\n\n---\n\n# Two", encoding="utf-8")
+        parse_cache.clear()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        parse_cache.clear()
+        self.temp_dir.cleanup()
+
+    def _slow_parse(self, release: threading.Event, calls: list[Path]):
+        """Build a parse function that blocks until released."""
+
+        def parse(file_path):
+            calls.append(file_path)
+            release.wait(5)
+            return parse_cache.get(file_path)
+
+        return parse
+
+    def test_concurrent_loads_share_one_parse(self):
+        """Test that concurrent loads of a file wait for a single parse."""
+        release = threading.Event()
+        calls = []
+
+        async def run():
+            tasks = [asyncio.create_task(load_deck(self.sample_file)) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        with mock.patch("markdeck.server._parse", self._slow_parse(release, calls)):
+            decks = asyncio.run(run())
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(deck is decks[0] for deck in decks))
+        self.assertEqual(len(decks[0].slides), 2)
+
+    def test_event_loop_not_blocked(self):
+        """Test that other tasks run while a file is being parsed."""
+        release = threading.Event()
+
+        async def run():
+            load = asyncio.create_task(load_deck(self.sample_file))
+            # Would deadlock if the parse ran on the event loop
+            await asyncio.sleep(0.01)
+            release.set()
+            return await load
+
+        with mock.patch("markdeck.server._parse", self._slow_parse(release, [])):
+            deck = asyncio.run(run())
+
+        self.assertEqual(len(deck.slides), 2)
+
+    def test_cancelled_waiter_does_not_cancel_load(self):
+        """Test that cancelling one request leaves the shared load running."""
+        release = threading.Event()
+
+        async def run():
+            first = asyncio.create_task(load_deck(self.sample_file))
+            second = asyncio.create_task(load_deck(self.sample_file))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            release.set()
+            return await second
+
+        with mock.patch("markdeck.server._parse", self._slow_parse(release, [])):
+            deck = asyncio.run(run())
+
+        self.assertEqual(len(deck.slides), 2)
+
+    def test_errors_reach_every_waiter(self):
+        """Test that a failed load raises in every waiting request."""
+
+        async def run():
+            missing = self.sample_file.with_name("missing.md")
+            return await asyncio.gather(
+                load_deck(missing), load_deck(missing), return_exceptions=True
+            )
+
+        errors = asyncio.run(run())
+        self.assertTrue(all(isinstance(error, FileNotFoundError) for error in errors))
+
+
+class TestCachedBody(unittest.TestCase):
+    """Test building response bodies off the event loop."""
+
+    def setUp(self):
+        """Start from an empty body cache."""
+        body_cache.clear()
+
+    def tearDown(self):
+        """Clean up."""
+        body_cache.clear()
+
+    def test_concurrent_builds_share_one_call(self):
+        """Test that concurrent requests for a body build it once, in the worker pool."""
+        release = threading.Event()
+        threads = []
+
+        def build():
+            threads.append(threading.current_thread().name)
+            release.wait(5)
+            return {"slides": []}
+
+        async def run():
+            tasks = [asyncio.create_task(server._cached_body("key", build)) for _ in range(5)]
+            # Would deadlock if the body were built on the event loop
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        bodies = asyncio.run(run())
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("markdeck-parse"))
+        self.assertTrue(all(body is bodies[0] for body in bodies))
+        self.assertEqual(bodies[0].identity, b'{"slides":[]}')
+
+    def test_slides_rendered_in_worker_pool(self):
+        """Test that /api/slides renders the lazy slides in the worker pool."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sample_file = Path(tmp_dir) / "deck.md"
+            sample_file.write_text("# One\n\n---\n\n# Two", encoding="utf-8")
+            set_presentation_file(sample_file)
+            self.addCleanup(set_presentation_file, None)
+            threads = []
+            slide_data = server._slide_data
+
+            def record(slide):
+                threads.append(threading.current_thread().name)
+                return slide_data(slide)
+
+            with mock.patch.object(server, "_slide_data", side_effect=record):
+                response = TestClient(app).get("/api/slides")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("markdeck-parse") for name in threads))
+
+
+class TestPatchNotifications(unittest.TestCase):
+    """Test pushing changed slides to WebSocket clients."""
+
+    class RecordingWebSocket:
+        """WebSocket stand-in that records the messages sent to it."""
+
+        def __init__(self):
+            """Initialize the message list."""
+            self.messages = []
+
+        async def send_text(self, text):
+            """Record a message."""
+            self.messages.append(json.loads(text))
+
+    def notify(self, previous, deck):
+        """Run notify_clients_changed for one client and return its messages."""
+        websocket = self.RecordingWebSocket()
+
+        async def run():
+            client = ClientConnection(websocket)
+            client.start()
+            with mock.patch.object(server, "_websocket_clients", {client}):
+                await server.notify_clients_changed(previous, deck)
+            for _ in range(5):
+                await asyncio.sleep(0)
+            await client.close()
+
+        asyncio.run(run())
+        return websocket.messages
+
+    def setUp(self):
+        """Parse a base version of a deck."""
+        self.old = SlideParser.parse_deck("# A\n---\n# B\n---\n# C", "deck", "v1")
+
+    def test_patch_contains_only_changed_slides(self):
+        """Test that a one-slide edit sends just that slide."""
+        deck = SlideParser.parse_deck("# A\n---\n# B2\n---\n# C", "deck", "v2", self.old)
+
+        (message,) = self.notify(self.old, deck)
+
+        self.assertEqual(message["type"], "patch")
+        self.assertEqual((message["base"], message["version"]), ("v1", "v2"))
+        self.assertEqual(message["start"], 1)
+        self.assertEqual(message["modified"], [1])
+        self.assertEqual([slide["content"] for slide in message["slides"]], ["# B2"])
+        self.assertEqual(message["total"], 3)
+
+    def test_patch_for_removed_slides(self):
+        """Test that removing slides sends their old ids and no slide data."""
+        deck = SlideParser.parse_deck("# A", "deck", "v2", self.old)
+
+        (message,) = self.notify(self.old, deck)
+
+        self.assertEqual(message["start"], 1)
+        self.assertEqual(message["removed"], [1, 2])
+        self.assertEqual(message["slides"], [])
+
+    def test_patch_for_whitespace_only_edit(self):
+        """Test that an edit changing no slide still moves clients to the new version."""
+        old = SlideParser.parse_deck("# A\n\n---\n\n# B\n", "deck", "v1")
+        deck = SlideParser.parse_deck("# A\n\n---\n\n# B\n\n\n", "deck", "v2", old)
+
+        (message,) = self.notify(old, deck)
+
+        self.assertEqual((message["base"], message["version"]), ("v1", "v2"))
+        self.assertEqual(message["start"], 0)
+        self.assertEqual(message["modified"] + message["added"] + message["removed"], [])
+        self.assertEqual(message["slides"], [])
+        self.assertEqual(message["total"], 2)
+
+    def test_reload_without_previous_version(self):
+        """Test that clients reload when there is nothing to diff against."""
+        self.assertEqual(self.notify(None, self.old), [{"type": "reload"}])
+        self.assertEqual(self.notify(self.old, None), [{"type": "reload"}])
+
+    def test_unchanged_version_not_sent(self):
+        """Test that nothing is sent when the slides did not change."""
+        self.assertEqual(self.notify(self.old, self.old), [])
+
+
+class TestFollowMode(unittest.TestCase):
+    """Test relaying the presenter's navigation over the WebSocket."""
+
+    def setUp(self):
+        """Set up test client with follow mode enabled."""
+        # Entering the client runs all connections on one event loop, as uvicorn does
+        self.client = TestClient(app).__enter__()
+        enable_follow_mode(True)
+
+    def tearDown(self):
+        """Disable follow mode and stop the client."""
+        enable_follow_mode(False)
+        self.client.__exit__(None, None, None)
+
+    def test_follower_receives_presenter_navigation(self):
+        """Test that only the presenter's navigation reaches followers."""
+        key = get_presenter_key()
+        with self.client.websocket_connect("/ws?follow=true") as follower:
+            with self.client.websocket_connect("/ws?presenter=wrong") as impostor:
+                impostor.send_json({"type": "navigate", "slide": 7})
+            with self.client.websocket_connect(f"/ws?presenter={key}") as presenter:
+                presenter.send_json({"type": "navigate", "slide": "bad"})
+                presenter.send_json({"type": "navigate", "slide": 2})
+                self.assertEqual(follower.receive_json(), {"type": "goto", "slide": 2})
+
+    def test_late_follower_gets_current_slide(self):
+        """Test that a follower joining later starts on the presenter's slide."""
+        with self.client.websocket_connect(f"/ws?presenter={get_presenter_key()}") as presenter:
+            presenter.send_json({"type": "navigate", "slide": 5})
+            with self.client.websocket_connect("/ws?follow=true") as follower:
+                self.assertEqual(follower.receive_json(), {"type": "goto", "slide": 5})
+
+    def test_follow_enabled_reported(self):
+        """Test that viewers can tell whether follow mode is on."""
+        self.assertTrue(self.client.get("/api/watch-enabled").json()["follow_enabled"])
+
+    def test_new_key_each_time(self):
+        """Test that re-enabling follow mode rotates the presenter key."""
+        key = get_presenter_key()
+        enable_follow_mode(True)
+        self.assertNotEqual(get_presenter_key(), key)
+        enable_follow_mode(False)
+        self.assertIsNone(get_presenter_key())
+
+
+class TestViewerEvents(unittest.TestCase):
+    """Test viewer events sent over the WebSocket."""
+
+    def setUp(self):
+        """Set up test client and sample file."""
+        self.client = TestClient(app).__enter__()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_file = Path(self.temp_dir.name) / "events.md"
+        self.sample_file.write_text(
+            "# One\n\n<!--NOTES: first -->\n\n---\n\n# Two\n\n<!--NOTES: second -->",
+            encoding="utf-8",
+        )
+        set_presentation_file(self.sample_file)
+        self.echo = mock.patch("markdeck.terminal.click.echo").start()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        mock.patch.stopall()
+        set_presentation_file(None)
+        self.client.__exit__(None, None, None)
+        self.temp_dir.cleanup()
+
+    def logged(self, count):
+        """Wait for the given number of terminal writes and return them."""
+        deadline = time.monotonic() + 5
+        while self.echo.call_count < count and time.monotonic() < deadline:
+            terminal_writer.flush(timeout=0.01)
+        return [call.args[0] for call in self.echo.call_args_list]
+
+    def test_navigation_logs_notes(self):
+        """Test that a navigate event logs the slide's speaker notes."""
+        with self.client.websocket_connect("/ws") as websocket:
+            websocket.send_json({"type": "navigate", "slide": 1})
+            (output,) = self.logged(1)
+
+        self.assertIn("Slide 2 / 2", output)
+        self.assertIn("second", output)
+
+    def test_batch_logs_last_navigation(self):
+        """Test that only the last navigation of a batch is logged."""
+        with self.client.websocket_connect("/ws") as websocket:
+            websocket.send_text(
+                json.dumps(
+                    [
+                        {"type": "navigate", "slide": 0},
+                        {"type": "unknown"},
+                        {"type": "navigate", "slide": 1},
+                    ]
+                )
+            )
+            websocket.send_json({"type": "navigate", "slide": 0})
+            outputs = self.logged(2)
+
+        self.assertEqual(len(outputs), 2)
+        self.assertIn("second", outputs[0])
+        self.assertIn("first", outputs[1])
+
+    def test_malformed_events_ignored(self):
+        """Test that malformed events neither log nor close the connection."""
+        with self.client.websocket_connect("/ws") as websocket:
+            websocket.send_text("not json")
+            websocket.send_json({"type": "navigate", "slide": 99})
+            websocket.send_json({"type": "navigate", "slide": -1})
+            websocket.send_json({"type": "navigate", "slide": 0})
+            outputs = self.logged(1)
+
+        self.assertEqual(len(outputs), 1)
+        self.assertIn("first", outputs[0])
+
 
 class TestRootEndpoint(unittest.TestCase):
     """Test the root HTML endpoint."""
@@ -127,6 +861,91 @@ class TestRootEndpoint(unittest.TestCase):
         self.assertIn("text/html", response.headers["content-type"])
         self.assertIn("MarkDeck", response.text)
 
+    def test_root_links_hashed_files(self):
+        """Test that the page links its files by content-hashed URL and is revalidated."""
+        response = self.client.get("/")
+
+        self.assertIn(f'src="{static_bundle.url("slides.js")}"', response.text)
+        self.assertNotIn("{{", response.text)
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+        response = self.client.get("/", headers={"If-None-Match": response.headers["etag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_slides_report_features(self):
+        """Test that the slides tell the viewer which libraries the deck needs."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write("# Math\n\n$$e^{i\\pi} = -1$$\n\n---\n\n# Plain")
+            temp_file = f.name
+        try:
+            set_presentation_file(temp_file)
+            data = self.client.get("/api/slides?start=0&count=1").json()
+            self.assertEqual(data["features"], {"math": True, "mermaid": False})
+        finally:
+            set_presentation_file(None)
+            os.unlink(temp_file)
+
+
+class TestBootstrap(unittest.TestCase):
+    """Test the bootstrap data embedded in the viewer page."""
+
+    def setUp(self):
+        """Set up a presentation and the test client."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+            f.write("# One\n\n<script>alert(1)</script>\n\n---\n\n# Two\n\n---\n\n# Three")
+            f.write("\n\n---\n\n# Four")
+            self.temp_file = f.name
+        set_presentation_file(self.temp_file)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        """Clean up."""
+        set_presentation_file(None)
+        os.unlink(self.temp_file)
+
+    def bootstrap(self, html: str) -> dict | None:
+        """Extract the bootstrap data from the viewer page."""
+        data = html.split('<script id="markdeck-bootstrap" type="application/json">')[1]
+        return json.loads(data.split("</script>")[0])
+
+    def test_first_slides_embedded(self):
+        """Test that the page carries the first slides in the /api/slides format."""
+        data = self.bootstrap(self.client.get("/").text)
+        slides = self.client.get("/api/slides?start=0&count=3").json()
+
+        self.assertEqual({key: data[key] for key in slides}, slides)
+        self.assertEqual(len(data["slides"]), 3)
+        self.assertEqual(data["total"], 4)
+        self.assertFalse(data["watch_enabled"])
+        self.assertFalse(data["follow_enabled"])
+
+    def test_slide_content_cannot_end_script(self):
+        """Test that markup in slides is escaped inside the page."""
+        html = self.client.get("/").text
+
+        self.assertNotIn("<script>alert(1)", html)
+        self.assertIn("<script>alert(1)</script>", self.bootstrap(html)["slides"][0]["content"])
+
+    def test_page_changes_with_deck(self):
+        """Test that the page is revalidated against the current deck version."""
+        response = self.client.get("/")
+        etag = response.headers["etag"]
+        self.assertEqual(self.client.get("/", headers={"If-None-Match": etag}).status_code, 304)
+
+        time.sleep(0.01)
+        with open(self.temp_file, "a") as f:
+            f.write("\n\n---\n\n# Five")
+        response = self.client.get("/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.bootstrap(response.text)["total"], 5)
+
+    def test_without_presentation(self):
+        """Test that the page has only the settings when there is no deck."""
+        set_presentation_file(None)
+        data = self.bootstrap(self.client.get("/").text)
+
+        self.assertEqual(set(data), {"watch_enabled", "follow_enabled", "image_widths"})
+
 
 class TestStaticFiles(unittest.TestCase):
     """Test static file serving."""
@@ -146,6 +965,36 @@ class TestStaticFiles(unittest.TestCase):
         response = self.client.get("/static/slides.js")
         self.assertEqual(response.status_code, 200)
 
+    def test_hashed_url_cached_forever(self):
+        """Test that content-hashed URLs may be cached forever."""
+        response = self.client.get(static_bundle.url("slides.js"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response.headers["cache-control"])
+        self.assertIn("SlideShow", response.text)
+
+    def test_unhashed_url_revalidated(self):
+        """Test that plain and outdated URLs are revalidated."""
+        for url in ("/static/style.css", "/static/0123456789abcdef/style.css"):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["cache-control"], "no-cache")
+
+            response = self.client.get(url, headers={"If-None-Match": response.headers["etag"]})
+            self.assertEqual(response.status_code, 304)
+
+    def test_compressed_variant(self):
+        """Test that files are sent compressed when the client accepts it."""
+        response = self.client.get("/static/slides.js", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertIn("SlideShow", response.text)
+
+    def test_unknown_file_not_found(self):
+        """Test that files outside the bundle are not served."""
+        self.assertEqual(self.client.get("/static/missing.js").status_code, 404)
+        self.assertEqual(self.client.get("/static/a/b/slides.js").status_code, 404)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,48 @@
+"""Tests for the background terminal writer."""
+
+import threading
+import unittest
+from unittest import mock
+
+from markdeck.terminal import TerminalWriter
+
+
+class TestTerminalWriter(unittest.TestCase):
+    """Test the TerminalWriter class."""
+
+    def test_messages_written_in_order(self):
+        """Test that queued messages are written in order."""
+        writer = TerminalWriter()
+        with mock.patch("markdeck.terminal.click.echo") as echo:
+            for i in range(50):
+                writer.echo(f"line {i}")
+            self.assertTrue(writer.flush(timeout=5))
+
+        self.assertEqual(
+            [call.args[0] for call in echo.call_args_list], [f"line {i}" for i in range(50)]
+        )
+
+    def test_echo_does_not_wait_for_terminal(self):
+        """Test that echo returns while the terminal is blocked."""
+        writer = TerminalWriter()
+        release = threading.Event()
+        with mock.patch("markdeck.terminal.click.echo", side_effect=lambda _: release.wait()):
+            writer.echo("slow")
+            writer.echo("slower")
+            self.assertFalse(writer.flush(timeout=0.05))
+            release.set()
+            self.assertTrue(writer.flush(timeout=5))
+
+    def test_write_errors_do_not_stop_writer(self):
+        """Test that a failing write does not stop later messages."""
+        writer = TerminalWriter()
+        with mock.patch("markdeck.terminal.click.echo", side_effect=[OSError, None]) as echo:
+            writer.echo("broken")
+            writer.echo("fine")
+            self.assertTrue(writer.flush(timeout=5))
+
+        self.assertEqual(echo.call_args.args[0], "fine")
+
+
+if __name__ == "__main__":
+    unittest.main()
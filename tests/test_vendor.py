@@ -0,0 +1,120 @@
+"""Tests for the bundled front-end libraries."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from markdeck import server
+from markdeck.bundle import StaticBundle
+from markdeck.server import app, get_static_dir
+from markdeck.vendor import LIBRARIES, VendorAssets
+
+
+class TestVendorAssets(unittest.TestCase):
+    """Test the VendorAssets class."""
+
+    def setUp(self):
+        """Create a vendor directory with one bundled library."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        (self.directory / "marked").mkdir()
+        (self.directory / "marked" / "marked.min.js").write_text("var marked;")
+        self.assets = VendorAssets(self.directory)
+
+    def tearDown(self):
+        """Remove the vendor directory."""
+        self.temp_dir.cleanup()
+
+    def test_bundled_library_has_hashed_url(self):
+        """Test that a bundled library is served under a content hash."""
+        url = self.assets.url("marked")
+        self.assertRegex(url, r"^/vendor/[0-9a-f]{16}/marked/marked\.min\.js$")
+
+    def test_missing_library_falls_back_to_cdn(self):
+        """Test that a library that is not bundled is loaded from the CDN."""
+        self.assertEqual(self.assets.url("mermaid"), LIBRARIES["mermaid"].url)
+
+    def test_url_changes_with_content(self):
+        """Test that a changed file gets a new URL."""
+        before = self.assets.url("marked")
+        (self.directory / "marked" / "marked.min.js").write_text("var marked = 2;")
+        self.assets.clear()
+        self.assertNotEqual(self.assets.url("marked"), before)
+
+    def test_find(self):
+        """Test that files are found only under their current hash."""
+        digest = self.assets.url("marked").split("/")[2]
+
+        self.assertEqual(
+            self.assets.find(digest, "marked/marked.min.js"),
+            (self.directory / "marked" / "marked.min.js").resolve(),
+        )
+        self.assertIsNone(self.assets.find("0" * 16, "marked/marked.min.js"))
+        self.assertIsNone(self.assets.find(digest, "marked/missing.js"))
+
+    def test_find_referenced_file(self):
+        """Test that files referenced by a stylesheet are found under its hash."""
+        (self.directory / "katex" / "fonts").mkdir(parents=True)
+        (self.directory / "katex" / "fonts" / "KaTeX_Main.woff2").write_bytes(b"font")
+
+        self.assertIsNotNone(self.assets.find("0123456789abcdef", "katex/fonts/KaTeX_Main.woff2"))
+
+    def test_find_rejects_traversal(self):
+        """Test that paths outside the vendor directory are rejected."""
+        self.assertIsNone(self.assets.find("0" * 16, "../outside.js"))
+
+
+class TestVendorEndpoint(unittest.TestCase):
+    """Test serving the bundled libraries."""
+
+    def setUp(self):
+        """Bundle one library in a temporary vendor directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        directory = Path(self.temp_dir.name)
+        (directory / "highlight").mkdir()
+        (directory / "highlight" / "highlight.min.js").write_text("var hljs;")
+        self.assets = VendorAssets(directory)
+        bundle = StaticBundle(get_static_dir(), vendor=self.assets)
+        for name, value in (("vendor_assets", self.assets), ("static_bundle", bundle)):
+            patcher = mock.patch.object(server, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        """Remove the vendor directory."""
+        self.temp_dir.cleanup()
+
+    def test_library_is_cached_forever(self):
+        """Test that bundled files are sent with an immutable cache lifetime."""
+        response = self.client.get(self.assets.url("highlight"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "var hljs;")
+        self.assertIn("immutable", response.headers["cache-control"])
+
+    def test_unknown_file_not_found(self):
+        """Test that unknown files and stale hashes are not found."""
+        self.assertEqual(self.client.get("/vendor/0123/highlight/other.js").status_code, 404)
+        self.assertEqual(
+            self.client.get("/vendor/0123/highlight/highlight.min.js").status_code, 404
+        )
+
+    def test_viewer_uses_library_urls(self):
+        """Test that the viewer page links bundled and CDN libraries."""
+        html = self.client.get("/").text
+
+        self.assertIn(f'<script src="{self.assets.url("highlight")}">', html)
+        self.assertIn(f'<script src="{LIBRARIES["marked"].url}">', html)
+        self.assertIn(f'"mermaid": "{LIBRARIES["mermaid"].url}"', html)
+        self.assertNotIn("{{", html)
+        # Math and diagrams are loaded on demand
+        self.assertNotIn("katex.min.js", html.split('id="markdeck-libraries"')[0])
+        self.assertNotIn('<script src="https://cdn.jsdelivr.net/npm/mermaid', html)
+
+
+if __name__ == "__main__":
+    unittest.main()